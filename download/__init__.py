@@ -1,15 +1,17 @@
 """
 Download package for handling video downloads from various sources.
 """
-from .downloader import download_twitter_broadcast, download_youtube_video
-from .utils import get_launch_data, get_downloaded_launches
+from .downloader import download_twitter_broadcast, download_youtube_video, download_flights_concurrently
+from .utils import get_launch_data, get_downloaded_launches, invalidate_launch_cache
 from .menu import download_media_menu
 
 # Export public functions
 __all__ = [
     'download_twitter_broadcast',
     'download_youtube_video',
+    'download_flights_concurrently',
     'get_launch_data',
     'get_downloaded_launches',
+    'invalidate_launch_cache',
     'download_media_menu'
 ]
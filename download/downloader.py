@@ -1,12 +1,58 @@
 """
 Core download functionality for different video platforms.
 """
+import asyncio
+import shutil
 import subprocess
 import os
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on simultaneous yt-dlp processes when downloading several flights
+MAX_CONCURRENT_DOWNLOADS = 5
+
+YTDLP_VIDEO_FORMAT = "bestvideo[height<=1080][ext=mp4]/bestvideo[height<=1080]/best[height<=1080]"
+
+# Broadcasts are HLS/DASH streams made of many small segments; fetch several at once
+YTDLP_CONCURRENT_FRAGMENTS = 8
+YTDLP_HTTP_CHUNK_SIZE = "10M"
+
+# Connections aria2c opens per download. Up to MAX_CONCURRENT_DOWNLOADS downloads
+# run at once against the same host, so keep this low to avoid throttling
+ARIA2C_CONNECTIONS = 4
+
+
+def build_ytdlp_command(url, output_template, aria2c_connections=ARIA2C_CONNECTIONS):
+    """
+    Build the yt-dlp command line used for every flight download.
+
+    Args:
+        url (str): The URL of the video.
+        output_template (str): yt-dlp output template for the downloaded file.
+        aria2c_connections (int): Connections per download when aria2c is used.
+
+    Returns:
+        list: The argument vector to execute.
+    """
+    command = [
+        "yt-dlp",
+        "-f", YTDLP_VIDEO_FORMAT,
+        "--no-audio",  # Explicitly disable audio download
+        "--concurrent-fragments", str(YTDLP_CONCURRENT_FRAGMENTS),
+    ]
+
+    # Hand non-fragmented downloads to aria2c's multi-connection fetcher when installed
+    if shutil.which("aria2c"):
+        connections = f"-x {aria2c_connections} -s {aria2c_connections}"
+        command += ["--downloader", "aria2c", "--downloader-args", f"aria2c:{connections}"]
+    else:
+        # Chunked HTTP requests only apply to yt-dlp's native downloader
+        command += ["--http-chunk-size", YTDLP_HTTP_CHUNK_SIZE]
+
+    command += ["-o", output_template, url]
+    return command
+
 def download_twitter_broadcast(url, flight_number, output_path="flight_recordings"):
     """
     Downloads a Twitter/X broadcast video using yt-dlp.
@@ -26,17 +72,11 @@ def download_twitter_broadcast(url, flight_number, output_path="flight_recording
         # Define output template with flight number
         output_template = f"{output_path}/flight_{flight_number}.%(ext)s"
         
-        logger.info(f"Downloading Twitter broadcast from {url}")
-        logger.info(f"Output file will be saved as: {output_template}")
+        logger.info("Downloading Twitter broadcast from %s", url)
+        logger.info("Output file will be saved as: %s", output_template)
         
         # Run yt-dlp to download the video only at 1080p resolution
-        subprocess.run([
-            "yt-dlp",
-            "-f", "bestvideo[height<=1080][ext=mp4]/bestvideo[height<=1080]/best[height<=1080]",
-            "--no-audio",  # Explicitly disable audio download
-            "-o", output_template,
-            url
-        ], check=True)
+        subprocess.run(build_ytdlp_command(url, output_template), check=True)
         
         logger.info("Download completed successfully.")
         return True
@@ -68,17 +108,11 @@ def download_youtube_video(url, flight_number, output_path="flight_recordings"):
         # Define output template with flight number
         output_template = f"{output_path}/flight_{flight_number}.%(ext)s"
         
-        logger.info(f"Downloading YouTube video from {url}")
-        logger.info(f"Output file will be saved as: {output_template}")
+        logger.info("Downloading YouTube video from %s", url)
+        logger.info("Output file will be saved as: %s", output_template)
         
         # Run yt-dlp to download video only at 1080p resolution, without audio
-        subprocess.run([
-            "yt-dlp",
-            "-f", "bestvideo[height<=1080][ext=mp4]/bestvideo[height<=1080]/best[height<=1080]",
-            "--no-audio",  # Explicitly disable audio download
-            "-o", output_template,
-            url
-        ], check=True)
+        subprocess.run(build_ytdlp_command(url, output_template), check=True)
         
         logger.info("Download completed successfully.")
         return True
@@ -90,3 +124,70 @@ def download_youtube_video(url, flight_number, output_path="flight_recordings"):
         logger.error(f"Unexpected error: {e}")
         print(f"An unexpected error occurred: {e}")
         return False
+
+async def download_video_async(url, flight_number, semaphore, output_path="flight_recordings"):
+    """
+    Download one flight video with yt-dlp without blocking the event loop.
+
+    Args:
+        url (str): The URL of the video (YouTube or Twitter/X).
+        flight_number (int): The flight number to use in the filename.
+        semaphore (asyncio.Semaphore): Limits how many downloads run at once.
+        output_path (str): The directory to save the downloaded video.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    output_template = f"{output_path}/flight_{flight_number}.%(ext)s"
+
+    async with semaphore:
+        logger.info("Starting download of flight %s from %s", flight_number, url)
+        try:
+            # Progress output of parallel downloads would interleave, so only keep stderr
+            process = await asyncio.create_subprocess_exec(
+                *build_ytdlp_command(url, output_template),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await process.communicate()
+        except Exception as e:
+            logger.error(f"Unexpected error downloading flight {flight_number}: {e}")
+            return False
+
+    if process.returncode != 0:
+        logger.error(f"Download of flight {flight_number} failed with exit code {process.returncode}: "
+                     f"{stderr.decode(errors='replace').strip()}")
+        return False
+
+    logger.info("Download of flight %s completed successfully.", flight_number)
+    return True
+
+
+async def _download_all_async(flights, output_path, max_concurrent):
+    """Run all flight downloads concurrently, bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results = await asyncio.gather(*(
+        download_video_async(url, flight_number, semaphore, output_path)
+        for flight_number, url in flights
+    ))
+    return dict(zip((flight_number for flight_number, _ in flights), results))
+
+
+def download_flights_concurrently(flights, output_path="flight_recordings", max_concurrent=MAX_CONCURRENT_DOWNLOADS):
+    """
+    Download several flight videos at once using parallel yt-dlp processes.
+
+    Args:
+        flights (list): List of (flight_number, url) tuples to download.
+        output_path (str): The directory to save the downloaded videos.
+        max_concurrent (int): Maximum number of simultaneous downloads.
+
+    Returns:
+        dict: Mapping of flight number to True if its download succeeded, False otherwise.
+    """
+    if not flights:
+        return {}
+
+    os.makedirs(output_path, exist_ok=True)
+    logger.info("Downloading %d flights with up to %d concurrent downloads", len(flights), max_concurrent)
+    return asyncio.run(_download_all_async(flights, output_path, max_concurrent))
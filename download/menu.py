@@ -4,7 +4,7 @@ Menu interfaces for download operations.
 import inquirer
 from download.utils import get_downloaded_launches, get_launch_data
 from utils.logger import get_logger
-from .downloader import download_twitter_broadcast, download_youtube_video
+from .downloader import download_twitter_broadcast, download_youtube_video, download_flights_concurrently
 from utils.terminal import clear_screen
 from utils.validators import validate_number, validate_url
 
@@ -17,6 +17,7 @@ def download_media_menu():
     
     menu_options = [
         'Download from launch list',
+        'Download all missing flights',
         'Download from custom URL',
         'Back to main menu'
     ]
@@ -29,6 +30,8 @@ def download_media_menu():
     
     if menu_answer == 'Download from launch list':
         return download_from_launch_list()
+    elif menu_answer == 'Download all missing flights':
+        return download_all_missing_flights()
     else:  # Download from custom URL
         return download_from_custom_url()
 
@@ -71,6 +74,33 @@ def download_from_launch_list():
     
     return prompt_continue_after_download(download_status, selected_flight_num)
 
+def download_all_missing_flights():
+    """Download every flight from the GitHub flight list that is not downloaded yet."""
+    clear_screen()
+    logger.debug("Downloading all missing flights")
+    
+    flight_data = get_flight_data()
+    if not flight_data:
+        return handle_error("Could not retrieve flight data. Please try again later.")
+    
+    available_flights = get_available_flights(flight_data)
+    
+    if not available_flights:
+        return handle_error("All flights have already been downloaded or no flights are available.")
+    
+    flights = [(flight_num, flight_data[f"flight_{flight_num}"]["url"]) for _, flight_num in available_flights]
+    print(f"Downloading {len(flights)} flights in parallel...")
+    results = download_flights_concurrently(flights)
+    
+    failed = sorted(flight_num for flight_num, success in results.items() if not success)
+    print(f"Downloaded {len(results) - len(failed)} of {len(results)} flights.")
+    if failed:
+        print(f"Failed flights: {', '.join(str(flight_num) for flight_num in failed)}")
+    
+    input("\nPress Enter to continue...")
+    clear_screen()
+    return True
+
 def get_flight_data():
     """Retrieve flight data from repository."""
     return get_launch_data()
@@ -2,36 +2,156 @@
 Utility functions for download operations.
 """
 import json
+import logging
 import os
+import re
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.logger import get_logger
 
+# orjson is an optional, much faster parser; fall back to the stdlib if missing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
 FLIGHTS_URL = "https://raw.githubusercontent.com/sanitaravel/starship_launches/refs/heads/master/flights.json"
 
+# Downloaded videos are saved as flight_<number>.<ext>; the flight number is the
+# text after "flight_" up to the next "_" or "."
+DOWNLOADED_FLIGHT_PATTERN = re.compile(r"^flight_([^_.]*)")
+
+# On-disk copy of the flight list, revalidated with the server's ETag
+FLIGHTS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "starship_analyzer", "flights.json")
+FLIGHTS_CACHE_VERSION = 1
+FLIGHTS_CACHE_MAX_AGE = 60 * 60  # Seconds a cached flight list is used without asking the server
+
+# In-process memo in front of the disk cache; timestamps use time.monotonic()
+LAUNCH_DATA_MEMO_TTL = 5 * 60
+_launch_data_memo = {"data": None, "ts": 0.0}
+
+# Shared HTTP session: keeps the connection to GitHub alive between (re)validation
+# requests and retries transient gateway errors with exponential backoff
+HTTP_RETRY_POLICY = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=HTTP_RETRY_POLICY))
+
+def _read_flights_cache():
+    """
+    Read the cached flight list from disk.
+    
+    Returns:
+        dict: Cache entry with 'data', 'etag' and '_cached_at' keys, or None if unavailable.
+    """
+    try:
+        with open(FLIGHTS_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cache, dict) or cache.get("_cache_version") != FLIGHTS_CACHE_VERSION or "data" not in cache:
+        return None
+    return cache
+
+def _write_flights_cache(flight_data, etag, cached_at=None):
+    """
+    Store the flight list and its ETag on disk. Failures are logged and ignored.
+    
+    Args:
+        flight_data (dict): The flight data returned by the server.
+        etag (str): The ETag header of the response, if any.
+        cached_at (float): Timestamp to record, defaults to now.
+    """
+    cache = {
+        "_cache_version": FLIGHTS_CACHE_VERSION,
+        "_cached_at": time.time() if cached_at is None else cached_at,
+        "etag": etag if isinstance(etag, str) else None,
+        "data": flight_data
+    }
+    try:
+        os.makedirs(os.path.dirname(FLIGHTS_CACHE_PATH), exist_ok=True)
+        with open(FLIGHTS_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write flight data cache: %s", e)
+
+def invalidate_launch_cache():
+    """
+    Force the next get_launch_data call to check the server again.
+    
+    Clears the in-process memo and marks the disk cache as stale, so it is
+    revalidated with its ETag instead of being discarded.
+    """
+    _launch_data_memo["data"] = None
+    _launch_data_memo["ts"] = 0.0
+    
+    cache = _read_flights_cache()
+    if cache is not None:
+        _write_flights_cache(cache["data"], cache.get("etag"), cached_at=0.0)
+    logger.debug("Invalidated cached flight data")
+
 def get_launch_data():
     """
     Retrieve the flight data from GitHub.
     
+    Results are memoized in-process for LAUNCH_DATA_MEMO_TTL seconds. Behind that,
+    a copy of the data is cached on disk: a cache younger than FLIGHTS_CACHE_MAX_AGE
+    is returned directly; an older one is revalidated with If-None-Match and reused
+    when the server answers 304. If the server cannot be reached, any cached copy
+    is returned instead.
+    
     Returns:
         dict: A dictionary containing flight information, or None if there was an error.
     """
+    if _launch_data_memo["data"] is not None and \
+            time.monotonic() - _launch_data_memo["ts"] < LAUNCH_DATA_MEMO_TTL:
+        return _launch_data_memo["data"]
+    
+    flight_data = _fetch_launch_data()
+    if flight_data is not None:
+        _launch_data_memo["data"] = flight_data
+        _launch_data_memo["ts"] = time.monotonic()
+    return flight_data
+
+def _fetch_launch_data():
+    """Load the flight data from the disk cache or GitHub; see get_launch_data."""
+    cache = _read_flights_cache()
+    if cache is not None and time.time() - cache.get("_cached_at", 0) < FLIGHTS_CACHE_MAX_AGE:
+        logger.info("Using cached flight data")
+        return cache["data"]
+    
     try:
-        logger.info(f"Fetching flight data from {FLIGHTS_URL}")
+        logger.info("Fetching flight data from %s", FLIGHTS_URL)
         
-        response = requests.get(FLIGHTS_URL, timeout=10)
+        if cache is not None and cache.get("etag"):
+            response = _SESSION.get(FLIGHTS_URL, headers={"If-None-Match": cache["etag"]}, timeout=10)
+            if response.status_code == 304:
+                logger.info("Flight data not modified on server, using cached copy")
+                _write_flights_cache(cache["data"], cache["etag"])
+                return cache["data"]
+        else:
+            response = _SESSION.get(FLIGHTS_URL, timeout=10)
         response.raise_for_status()  # Raise an exception for HTTP errors
         
-        flight_data = response.json()
-        logger.info(f"Successfully retrieved data for {len(flight_data)} flights")
+        # Parse the raw bytes directly, skipping the intermediate str decode
+        flight_data = _json_loads(response.content)
+        logger.info("Successfully retrieved data for %d flights", len(flight_data))
+        _write_flights_cache(flight_data, response.headers.get("ETag"))
         return flight_data
         
     except requests.RequestException as e:
         logger.error(f"Error fetching flight data: {e}")
+        if cache is not None:
+            logger.warning("Using previously cached flight data")
+            return cache["data"]
         print(f"Error fetching flight data: {e}")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # json and orjson decode errors both subclass ValueError
         logger.error(f"Error parsing flight JSON data: {e}")
         print(f"Error parsing flight data: {e}")
         return None
@@ -42,28 +162,30 @@ def get_launch_data():
 
 def get_downloaded_launches(output_path="flight_recordings"):
     """
-    Get a list of already downloaded flight numbers.
+    Get the set of already downloaded flight numbers.
     
     Args:
         output_path (str): Path to check for downloaded files
         
     Returns:
-        list: List of downloaded flight numbers as integers
+        set: Set of downloaded flight numbers as integers
     """
-    downloaded = []
+    downloaded = set()
     
-    if not os.path.exists(output_path):
+    # Check for entries matching the pattern "flight_X.*"
+    try:
+        with os.scandir(output_path) as entries:
+            for entry in entries:
+                match = DOWNLOADED_FLIGHT_PATTERN.match(entry.name)
+                if match:
+                    try:
+                        downloaded.add(int(match.group(1)))
+                    except ValueError:
+                        continue
+    except FileNotFoundError:
         return downloaded
     
-    # Check for files matching the pattern "flight_X.*"
-    for file in os.listdir(output_path):
-        if file.startswith("flight_"):
-            try:
-                # Extract the flight number from the filename
-                flight_num = int(file.split("_")[1].split(".")[0])
-                downloaded.append(flight_num)
-            except (IndexError, ValueError):
-                continue
-    
-    logger.debug(f"Found already downloaded flights: {downloaded}")
+    # Sorting the full set is only worth doing when the record will be emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found already downloaded flights: %s", sorted(downloaded))
     return downloaded
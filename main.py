@@ -2,10 +2,12 @@
 Main entry point for the Starship Analyzer application.
 """
 import argparse
-import io
+import importlib.util
 import logging
+import sys
 import cProfile
 import pstats
+from functools import lru_cache
 from typing import Optional
 
 from utils.logger import start_new_session, get_logger, set_global_log_level
@@ -22,6 +24,9 @@ logger = get_logger(__name__)
 # Global debug state - kept in main as requested
 DEBUG_MODE = False
 
+# Output file used when --profile is given without a path
+DEFAULT_PROFILE_PATH = "profile.stats"
+
 def toggle_debug_mode():
     """Toggle debug mode on/off and set appropriate log levels."""
     global DEBUG_MODE
@@ -83,21 +88,65 @@ def _run_with_cprofile(output_path: str, print_top: bool, top_n: int = 50) -> No
             print(f"Failed to write profile to {output_path}: {e}")
 
         if print_top:
-            s = io.StringIO()
-            ps = pstats.Stats(profiler, stream=s).sort_stats("cumtime")
+            # Write the report straight to stdout rather than building it in memory first
+            ps = pstats.Stats(profiler, stream=sys.stdout).sort_stats("cumtime")
             ps.print_stats(top_n)
-            print(s.getvalue())
 
+def _run_with_pyinstrument(output_path: str, print_top: bool) -> None:
+    """Run the main() under the pyinstrument sampling profiler and save an HTML report.
 
-if __name__ == "__main__":
+    Sampling costs roughly the same however many Python calls are made, so the
+    per-frame hot loop is not slowed down the way cProfile's call tracing slows it.
+    If print_top is True, also print the call tree to stdout.
+    """
+    from pyinstrument import Profiler
+
+    profiler = Profiler()
+    try:
+        profiler.start()
+        main()
+    finally:
+        profiler.stop()
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+            print(f"Profile saved to: {output_path}")
+        except Exception as e:
+            print(f"Failed to write profile to {output_path}: {e}")
+
+        if print_top:
+            print(profiler.output_text())
+
+def _run_profiled(args: argparse.Namespace) -> None:
+    """Run the main() under the profiler selected with --profile-sampler."""
+    if args.profile_sampler == "pyinstrument":
+        if importlib.util.find_spec("pyinstrument") is not None:
+            # The default output name is for cProfile stats; pyinstrument writes HTML
+            out = "profile.html" if args.profile == DEFAULT_PROFILE_PATH else args.profile
+            _run_with_pyinstrument(out, args.profile_print)
+            return
+        print("pyinstrument is not installed (pip install pyinstrument); falling back to cProfile")
+    _run_with_cprofile(args.profile, args.profile_print, args.profile_top)
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(description="Starship Analyzer")
     parser.add_argument(
         "--profile",
         "-p",
         nargs="?",
-        const="profile.stats",
+        const=DEFAULT_PROFILE_PATH,
         default=None,
-        help="Enable cProfile and write stats to the given file (default: profile.stats if flag provided without path)",
+        help="Enable profiling and write the results to the given file (default: profile.stats if flag provided without path)",
+    )
+    parser.add_argument(
+        "--profile-sampler",
+        choices=("cprofile", "pyinstrument"),
+        default="cprofile",
+        help="Profiler to use: cprofile traces every call, pyinstrument samples the stack "
+             "with much lower overhead and writes an HTML report (default: cprofile)",
     )
     parser.add_argument(
         "--profile-print",
@@ -110,11 +159,16 @@ if __name__ == "__main__":
         default=50,
         help="Number of top functions to print when --profile-print is used (default: 50)",
     )
+    return parser
 
-    args = parser.parse_args()
 
+def run(args: argparse.Namespace) -> None:
+    """Run main(), under the profiler when --profile is given."""
     if args.profile:
-        out = args.profile if isinstance(args.profile, str) and args.profile != "profile.stats" else "profile.stats"
-        _run_with_cprofile(out, args.profile_print, args.profile_top)
+        _run_profiled(args)
     else:
         main()
+
+
+if __name__ == "__main__":
+    run(_build_parser().parse_args())
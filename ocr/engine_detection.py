@@ -1,5 +1,6 @@
+import logging
 import numpy as np
-from typing import Dict, List, Union, Optional
+from typing import Dict, List, Union, Optional, Tuple
 from numba import njit
 from utils.constants import WHITE_THRESHOLD
 from utils.logger import get_logger
@@ -8,33 +9,92 @@ from .roi_manager import get_default_manager, ROIManager
 # Initialize logger
 logger = get_logger(__name__)
 
-@njit
-def check_engines_numba(image: np.ndarray, coordinates: np.ndarray, white_threshold: int) -> list:
+# Flattened engine coordinates per engine type: (coordinates object, layout)
+_engine_layouts = {}
+
+def check_engine_points(image: np.ndarray, coordinates: np.ndarray, white_threshold: int) -> list:
+    """
+    Check whether the colour-image pixel at each (x, y) point is bright enough to count as an engine on.
+    
+    Thin wrapper around engines_on_numba for callers that hold (N, 2) points
+    rather than separate x and y arrays.
+    
+    Args:
+        image: The (H, W, C) image to process
+        coordinates: Array-like of (x, y) points
+        white_threshold: Brightness every channel must reach for an engine to be on
+        
+    Returns:
+        List of boolean values indicating engine status; points outside the image are off
+    """
+    coordinates = np.asarray(coordinates).reshape(-1, 2)
+    return engines_on_numba(image, coordinates[:, 0], coordinates[:, 1], white_threshold).tolist()
+
+# Former name, kept for existing callers
+check_engines_numba = check_engine_points
+
+# cache=True keeps the compiled kernel on disk so batch worker processes skip the
+# JIT warmup; nogil lets OCR threads run while it executes
+@njit(cache=True, nogil=True)
+def engines_on_numba(image: np.ndarray, xs: np.ndarray, ys: np.ndarray, white_threshold: int) -> np.ndarray:
     """
-    Optimized engine status check using numba.
+    Check a colour image's engine pixels in one compiled pass.
+    
+    Fuses the bounds check, pixel gather and per-channel threshold into a single
+    loop, so no intermediate index or boolean arrays are allocated per frame.
     
     Args:
-        image: The image to process
-        coordinates: NumPy array of (x, y) coordinate tuples
-        white_threshold: Brightness threshold for determining engine status
+        image: The (H, W, C) image to process
+        xs: Engine x coordinates
+        ys: Engine y coordinates, parallel to xs
+        white_threshold: Brightness every channel must reach for an engine to be on
         
     Returns:
-        List of boolean values indicating engine status
+        Boolean array with the status of each engine; points outside the image are off
     """
-    status = []
-    for x, y in coordinates:
-        if 0 <= y < image.shape[0] and 0 <= x < image.shape[1]:
-            pixel = image[y, x]
+    height, width, channels = image.shape
+    status = np.zeros(xs.size, dtype=np.bool_)
+    for i in range(xs.size):
+        x = xs[i]
+        y = ys[i]
+        if 0 <= y < height and 0 <= x < width:
             is_on = True
-            for channel in pixel:
-                if channel < white_threshold:
+            for c in range(channels):
+                if image[y, x, c] < white_threshold:
                     is_on = False
                     break
-            status.append(is_on)
-        else:
-            status.append(False)
+            status[i] = is_on
     return status
 
+def _engine_layout(engine_coords: Dict, engine_type: str) -> Tuple[List[str], np.ndarray, np.ndarray, List[Tuple[int, int]]]:
+    """
+    Flatten per-section engine coordinates into single x and y index arrays.
+    
+    The layout is cached per engine type and reused for as long as the same
+    coordinates object is passed in (ROI point arrays are built once per ROI).
+    
+    Returns:
+        Tuple of (section names, xs, ys, (start, end) slice of each section)
+    """
+    cached = _engine_layouts.get(engine_type)
+    if cached is not None and cached[0] is engine_coords:
+        return cached[1]
+    
+    sections, arrays, bounds = [], [], []
+    start = 0
+    for section, coordinates in engine_coords.items():
+        # ROI point arrays and the engine constants are int32 already, so this is a view
+        coords_array = np.asarray(coordinates, dtype=np.int32).reshape(-1, 2)
+        sections.append(section)
+        arrays.append(coords_array)
+        bounds.append((start, start + len(coords_array)))
+        start += len(coords_array)
+    
+    points = np.concatenate(arrays) if arrays else np.empty((0, 2), dtype=np.int32)
+    layout = (sections, np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1]), bounds)
+    _engine_layouts[engine_type] = (engine_coords, layout)
+    return layout
+
 def check_engines(image: np.ndarray, engine_coords: Dict, debug: bool, engine_type: str) -> Dict:
     """
     Check the status of engines based on pixel values at specific coordinates.
@@ -51,26 +111,37 @@ def check_engines(image: np.ndarray, engine_coords: Dict, debug: bool, engine_ty
     # Initialize results dictionary directly
     engine_status = {}
     
+    # debug only controls logging here, so skip the summaries when DEBUG is filtered out
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
+    
     if engine_coords is None:
         if debug:   
             logger.debug(f"No {engine_type} engine coordinates found.")
         return engine_status
 
+    sections, xs, ys, bounds = _engine_layout(engine_coords, engine_type)
+    
     if debug:
         logger.debug(f"Checking {engine_type} engines with threshold: {WHITE_THRESHOLD}")
-        logger.debug(f"Image shape: {image.shape}, checking {sum(len(coords) for coords in engine_coords.values())} engine points")
+        logger.debug(f"Image shape: {image.shape}, checking {len(xs)} engine points")
     
-    # Check engines
-    for section, coordinates in engine_coords.items():
-        # Avoid unnecessary array creation if already numpy array
-        coords_array = coordinates if isinstance(coordinates, np.ndarray) else np.array(coordinates)
-            
-        # Store results directly in dictionary without intermediate list
-        engine_status[section] = check_engines_numba(image, coords_array, WHITE_THRESHOLD)
+    if image.ndim == 3:
+        is_on = engines_on_numba(image, xs, ys, WHITE_THRESHOLD).tolist()
+    else:
+        # Grayscale frames: gather every engine pixel in one fancy-indexing call;
+        # points outside the frame stay off
+        height, width = image.shape[:2]
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        is_on = np.zeros(len(xs), dtype=bool)
+        is_on[inside] = image[ys[inside], xs[inside]] >= WHITE_THRESHOLD
+        is_on = is_on.tolist()
+    
+    for section, (start, end) in zip(sections, bounds):
+        engine_status[section] = is_on[start:end]
         
         if debug:
-            active_count = sum(engine_status[section])
-            logger.debug(f"{engine_type} {section} summary: {active_count} active engines out of {len(coords_array)}")
+            active_count = engine_status[section].count(True)
+            logger.debug(f"{engine_type} {section} summary: {active_count} active engines out of {end - start}")
                     
     return engine_status
 
@@ -90,7 +161,8 @@ def detect_engine_status(image: np.ndarray, debug: bool = False, roi_manager: Op
     # is provided (or can be loaded), prefer it for a conservative decision
     # about whether engine detection should run. If no manager is available
     # assume no engine ROIs.
-    if debug:
+    log_debug = debug and logger.isEnabledFor(logging.DEBUG)
+    if log_debug:
         logger.debug(f"Starting engine detection on image of shape {image.shape}")
 
     mgr = roi_manager
@@ -100,35 +172,24 @@ def detect_engine_status(image: np.ndarray, debug: bool = False, roi_manager: Op
         except Exception:
             mgr = None
 
-    has_engine_roi = False
-    if mgr is not None:
-        try:
-            active = mgr.get_active_rois(frame_idx)
-            for r in active:
-                if getattr(r, "match_to_role", None) and "engine" in (r.match_to_role or "").lower():
-                    has_engine_roi = True
-                    break
-        except Exception:
-            has_engine_roi = False
-
-    # Attempt to get engine coordinate points from ROI manager if present.
+    # Read the engine coordinate points from the active ROIs in a single pass.
     # ROI entries should have a 'points' dictionary mirroring the structure
-    # used by the legacy constants. If not present, fall back to constants.
+    # used by the legacy constants; without one the engines stay unchecked.
     sh_points = None
     ss_points = None
-    if mgr is not None and has_engine_roi:
+    if mgr is not None:
         try:
             for r in mgr.get_active_rois(frame_idx):
-                role = getattr(r, "match_to_role", None)
-                logger.debug(f"Found ROI with role: {role}, points: {getattr(r, 'points', None)}")
-                if not role:
+                role = (getattr(r, "match_to_role", None) or "").lower()
+                if "engine" not in role:
                     continue
-                if role.lower() == "sh_engines" and getattr(r, "points", None):
-                    sh_points = r.points
-                if role.lower() == "ss_engines" and getattr(r, "points", None):
-                    ss_points = r.points
+                if log_debug:
+                    logger.debug("Found ROI with role: %s, points: %s", role, getattr(r, 'points', None))
+                if role == "sh_engines" and getattr(r, "points", None):
+                    sh_points = getattr(r, "point_arrays", None) or r.points
+                if role == "ss_engines" and getattr(r, "points", None):
+                    ss_points = getattr(r, "point_arrays", None) or r.points
         except Exception:
-            # If reading from manager fails, we'll fall back to constants below
             sh_points = None
             ss_points = None
 
@@ -139,10 +200,10 @@ def detect_engine_status(image: np.ndarray, debug: bool = False, roi_manager: Op
     starship_engines = check_engines(image, ss_points, debug, "Starship")
 
     # Calculate summary statistics for debugging
-    if debug:
-        sh_active = sum(sum(1 for e in engines if e) for engines in superheavy_engines.values())
+    if log_debug:
+        sh_active = sum(engines.count(True) for engines in superheavy_engines.values())
         sh_total = sum(len(engines) for engines in superheavy_engines.values())
-        ss_active = sum(sum(1 for e in engines if e) for engines in starship_engines.values())
+        ss_active = sum(engines.count(True) for engines in starship_engines.values())
         ss_total = sum(len(engines) for engines in starship_engines.values())
         logger.debug(f"Engine detection summary - Superheavy: {sh_active}/{sh_total} active, Starship: {ss_active}/{ss_total} active")
 
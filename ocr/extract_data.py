@@ -1,4 +1,9 @@
+import logging
+import os
+import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Tuple, Dict, Optional
 from utils import display_image
 from .ocr import extract_values_from_roi
@@ -11,9 +16,53 @@ import traceback  # Import at the top level instead of in exception handler
 # Initialize logger
 logger = get_logger(__name__)
 
+# Shared pool for running the independent Superheavy/Starship OCR calls side by
+# side. The OCR model releases the GIL during inference, so threads overlap well.
+# Created on first use by _get_ocr_pool() and dropped in forked children: a
+# child inherits the executor but not its threads, so submits would never run.
+_OCR_POOL: Optional[ThreadPoolExecutor] = None
+_OCR_POOL_LOCK = threading.Lock()
+
+
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """Return this process's OCR thread pool, creating it on first use."""
+    global _OCR_POOL
+    with _OCR_POOL_LOCK:
+        if _OCR_POOL is None:
+            _OCR_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ocr")
+        return _OCR_POOL
+
+
+def _reset_ocr_pool_in_child() -> None:
+    """Forget the parent's OCR pool (and lock) so the child builds its own."""
+    global _OCR_POOL, _OCR_POOL_LOCK
+    _OCR_POOL = None
+    _OCR_POOL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ocr_pool_in_child)
+
 # This module is now fully config-driven. ROI coordinates and activation windows
 # are provided by `ocr.roi_manager.ROIManager` via `get_default_manager()`.
 
+@lru_cache(maxsize=64)
+def _roi_slices(y, h, x, w, image_height: int, image_width: int) -> Optional[Tuple[slice, slice]]:
+    """
+    Return the (rows, columns) slices of an ROI clipped to the frame, or None if empty.
+    
+    ROI geometry and frame size are fixed for a whole video, so the clipping is
+    worked out once per ROI instead of on every frame.
+    """
+    y0 = max(0, int(y))
+    x0 = max(0, int(x))
+    y1 = min(image_height, int(y) + int(h))
+    x1 = min(image_width, int(x) + int(w))
+    if y0 >= y1 or x0 >= x1:
+        return None
+    return slice(y0, y1), slice(x0, x1)
+
+
 def preprocess_image(image: np.ndarray, display_rois: bool = False, roi_manager: Optional[ROIManager] = None, frame_idx: Optional[int] = None) -> Dict[str, Optional[np.ndarray]]:
     """
     Preprocess the image to extract ROIs for Superheavy Speed, Superheavy Altitude, Starship Speed, Starship Altitude, and Time.
@@ -34,7 +83,7 @@ def preprocess_image(image: np.ndarray, display_rois: bool = False, roi_manager:
         logger.error("Input image is None")
         return {}
     
-    logger.debug(f"Preprocessing image of shape {image.shape}")
+    logger.debug("Preprocessing image of shape %s", image.shape)
 
     # Decide which ROI definitions to use; require ROIManager (default loaded if None)
     use_manager = roi_manager
@@ -49,16 +98,17 @@ def preprocess_image(image: np.ndarray, display_rois: bool = False, roi_manager:
         return {}
     
     try:
-        # Helper: safe slice function
+        # Frame geometry is read once per frame rather than once per ROI
+        ih, iw = image.shape[:2]
+
+        # Helper: safe slice function. Horizontal sub-crops are strided views, and
+        # EasyOCR's OpenCV preprocessing would silently copy them anyway, so make
+        # the single copy explicit here.
         def slice_roi(img, y, h, x, w):
-            ih, iw = img.shape[0], img.shape[1]
-            y0 = max(0, int(y))
-            x0 = max(0, int(x))
-            y1 = min(ih, int(y + h))
-            x1 = min(iw, int(x + w))
-            if y0 >= y1 or x0 >= x1:
+            bounds = _roi_slices(y, h, x, w, ih, iw)
+            if bounds is None:
                 return None
-            return img[y0:y1, x0:x1]
+            return np.ascontiguousarray(img[bounds])
 
         # Build mapping roi_id -> cropped image for all active ROIs
         rois_map: Dict[str, Optional[np.ndarray]] = {}
@@ -105,7 +155,8 @@ def extract_superheavy_data(sh_speed_roi: np.ndarray, sh_altitude_roi: np.ndarra
     Returns:
         dict: A dictionary containing the extracted data for Superheavy.
     """
-    if debug:
+    log_debug = debug and logger.isEnabledFor(logging.DEBUG)
+    if log_debug:
         logger.debug("Extracting Superheavy data from ROIs")
     
     try:
@@ -120,7 +171,7 @@ def extract_superheavy_data(sh_speed_roi: np.ndarray, sh_altitude_roi: np.ndarra
         altitude_value = altitude_data.get("value")
         
         # Debug logging
-        if debug:
+        if log_debug:
             missing = []
             if speed_value is None:
                 missing.append("speed")
@@ -137,7 +188,7 @@ def extract_superheavy_data(sh_speed_roi: np.ndarray, sh_altitude_roi: np.ndarra
     
     except Exception as e:
         logger.error(f"Error extracting Superheavy data: {str(e)}")
-        if debug:
+        if log_debug:
             logger.debug(traceback.format_exc())
         return {"speed": None, "altitude": None}
 
@@ -155,7 +206,8 @@ def extract_starship_data(ss_speed_roi: np.ndarray, ss_altitude_roi: np.ndarray,
     Returns:
         dict: A dictionary containing the extracted data for Starship.
     """
-    if debug:
+    log_debug = debug and logger.isEnabledFor(logging.DEBUG)
+    if log_debug:
         logger.debug("Extracting Starship data from ROIs")
     
     try:
@@ -170,7 +222,7 @@ def extract_starship_data(ss_speed_roi: np.ndarray, ss_altitude_roi: np.ndarray,
         altitude_value = altitude_data.get("value")
         
         # Debug logging
-        if debug:
+        if log_debug:
             missing = []
             if speed_value is None:
                 missing.append("speed")
@@ -187,7 +239,7 @@ def extract_starship_data(ss_speed_roi: np.ndarray, ss_altitude_roi: np.ndarray,
     
     except Exception as e:
         logger.error(f"Error extracting Starship data: {str(e)}")
-        if debug:
+        if log_debug:
             logger.debug(traceback.format_exc())
         return {"speed": None, "altitude": None}
 
@@ -205,17 +257,18 @@ def extract_time_data(time_roi: np.ndarray, display_rois: bool, debug: bool, zer
     Returns:
         dict: A dictionary containing the extracted time data.
     """
+    log_debug = debug and logger.isEnabledFor(logging.DEBUG)
     logger.debug("Extracting time data from ROI")
     
     if zero_time_met:
-        if debug:
+        if log_debug:
             logger.debug("Zero time already met, returning default zero time")
         return {"sign": "+", "hours": 0, "minutes": 0, "seconds": 0}
     
     try:
         time_data = extract_values_from_roi(time_roi, mode="time", display_transformed=display_rois, debug=debug)
         
-        if debug:
+        if log_debug:
             if time_data:
                 logger.debug(f"Extracted time: {time_data.get('sign')} " +
                            f"{time_data.get('hours', 0):02}:{time_data.get('minutes', 0):02}:{time_data.get('seconds', 0):02}")
@@ -229,10 +282,79 @@ def extract_time_data(time_roi: np.ndarray, display_rois: bool, debug: bool, zer
         return time_data
     except Exception as e:
         logger.error(f"Error extracting time data: {str(e)}")
-        logger.debug(traceback.format_exc())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
         return {}
 
 
+def _extract_fuel_data(image: np.ndarray, has_fuel_roi: bool, debug: bool) -> Tuple[Dict, Dict]:
+    """
+    Extract the Superheavy and Starship fuel levels for one frame.
+
+    Args:
+        image (numpy.ndarray): The frame to process.
+        has_fuel_roi (bool): Whether fuel ROIs are configured for this frame.
+        debug (bool): Whether to enable debug prints.
+
+    Returns:
+        tuple: Fuel data for Superheavy and Starship; zero fullness when missing or on error.
+    """
+    log_debug = debug and logger.isEnabledFor(logging.DEBUG)
+    if log_debug:
+        logger.debug("Extracting fuel levels")
+
+    # Reuse same empty dict for both to reduce allocations
+    empty_fuel = {"lox": {"fullness": 0}, "ch4": {"fullness": 0}}
+    if not has_fuel_roi:
+        if log_debug:
+            logger.debug("No fuel ROIs configured; skipping fuel extraction")
+        return empty_fuel, empty_fuel
+
+    try:
+        fuel_data = extract_fuel_levels(image, debug)
+        sh_fuel = fuel_data.get("superheavy", empty_fuel)
+        ss_fuel = fuel_data.get("starship", empty_fuel)
+
+        if log_debug:
+            # Use .get chains to be defensive about partial results
+            sh_lox = sh_fuel.get("lox", {}).get("fullness", 0)
+            sh_ch4 = sh_fuel.get("ch4", {}).get("fullness", 0)
+            ss_lox = ss_fuel.get("lox", {}).get("fullness", 0)
+            ss_ch4 = ss_fuel.get("ch4", {}).get("fullness", 0)
+            logger.debug(f"Fuel levels - SH: LOX {sh_lox:.1f}%, CH4 {sh_ch4:.1f}%, "
+                        f"SS: LOX {ss_lox:.1f}%, CH4 {ss_ch4:.1f}%")
+        return sh_fuel, ss_fuel
+    except Exception as e:
+        logger.error(f"Error extracting fuel levels: {str(e)}")
+        if log_debug:
+            logger.debug(traceback.format_exc())
+        return empty_fuel, empty_fuel
+
+
+def _extract_engine_data(image: np.ndarray, debug: bool, roi_manager: Optional[ROIManager], frame_idx: Optional[int]) -> Tuple[Dict, Dict]:
+    """
+    Detect the Superheavy and Starship engine status for one frame.
+
+    Args:
+        image (numpy.ndarray): The frame to process.
+        debug (bool): Whether to enable debug prints.
+        roi_manager (ROIManager, optional): Manager providing the engine ROIs.
+        frame_idx (int, optional): Frame index used to select active ROIs.
+
+    Returns:
+        tuple: Engine status for Superheavy and Starship; empty dicts when missing or on error.
+    """
+    try:
+        engine_data = detect_engine_status(image, debug, roi_manager=roi_manager, frame_idx=frame_idx)
+        # May be empty dicts if no engine ROIs
+        return engine_data.get("superheavy", {}), engine_data.get("starship", {})
+    except Exception as e:
+        logger.error(f"Error detecting engine status: {str(e)}")
+        if debug and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
+        return {}, {}
+
+
 def extract_data(image: np.ndarray, display_rois: bool = False, debug: bool = False, zero_time_met: bool = False, roi_manager: Optional[ROIManager] = None, frame_idx: Optional[int] = None) -> Tuple[Dict, Dict, Dict]:
     """
     Extract data from an image.
@@ -246,7 +368,8 @@ def extract_data(image: np.ndarray, display_rois: bool = False, debug: bool = Fa
     Returns:
         tuple: A tuple containing the extracted data for Superheavy, Starship, and Time.
     """
-    if debug:
+    log_debug = debug and logger.isEnabledFor(logging.DEBUG)
+    if log_debug:
         logger.debug("Starting data extraction from image")
     
     # Preprocess the image to get ROIs mapping (roi_id -> image)
@@ -304,33 +427,48 @@ def extract_data(image: np.ndarray, display_rois: bool = False, debug: bool = Fa
     time_roi = _get_roi_image("time")
 
     # Extract time first. If there is no time data we can skip heavy processing for this frame.
-    if debug:
+    if log_debug:
         logger.debug("Attempting to extract time before other data to decide whether to process frame")
 
     try:
         # If there is no time ROI, treat as missing time and skip
         if time_roi is None:
-            if debug:
+            if log_debug:
                 logger.debug("Time ROI not available; skipping frame processing")
             time_data = {}
         else:
             time_data = extract_time_data(time_roi, display_rois, debug, zero_time_met)
     except Exception as e:
         logger.error(f"Error extracting time data early: {str(e)}")
-        if debug:
+        if log_debug:
             logger.debug(traceback.format_exc())
         time_data = {}
 
     # Early exit: if no time was detected, don't process this frame further
     if not time_data:
-        if debug:
+        if log_debug:
             logger.debug("No time detected in frame; skipping further extraction (engines/fuel/vehicle data)")
         # Return empty vehicle dicts and the (empty) time_data to keep callsites safe
         return {}, {}, time_data
 
-    # Extract data for Superheavy and Starship
-    superheavy_data = extract_superheavy_data(sh_speed_roi, sh_altitude_roi, display_rois, debug)
-    starship_data = extract_starship_data(ss_speed_roi, ss_altitude_roi, display_rois, debug)
+    # Extract data for Superheavy and Starship concurrently. Time stays sequential
+    # above because frames without a timestamp skip all of this work.
+    if display_rois:
+        # Keep interactive ROI display on the calling thread
+        superheavy_data = extract_superheavy_data(sh_speed_roi, sh_altitude_roi, display_rois, debug)
+        starship_data = extract_starship_data(ss_speed_roi, ss_altitude_roi, display_rois, debug)
+        sh_fuel, ss_fuel = _extract_fuel_data(image, has_fuel_roi, debug)
+        sh_engines, ss_engines = _extract_engine_data(image, debug, roi_manager, frame_idx)
+    else:
+        ocr_pool = _get_ocr_pool()
+        f_sh = ocr_pool.submit(extract_superheavy_data, sh_speed_roi, sh_altitude_roi, display_rois, debug)
+        f_ss = ocr_pool.submit(extract_starship_data, ss_speed_roi, ss_altitude_roi, display_rois, debug)
+        # Fuel and engine checks are short compiled/NumPy passes; run them on this
+        # thread while the OCR workers are busy instead of after them
+        sh_fuel, ss_fuel = _extract_fuel_data(image, has_fuel_roi, debug)
+        sh_engines, ss_engines = _extract_engine_data(image, debug, roi_manager, frame_idx)
+        superheavy_data = f_sh.result()
+        starship_data = f_ss.result()
 
     # Cache values to avoid repeated dictionary lookups
     sh_speed = superheavy_data.get("speed")
@@ -340,7 +478,7 @@ def extract_data(image: np.ndarray, display_rois: bool = False, debug: bool = Fa
     
     # Handle Starship data fallback
     if not ss_speed or not ss_altitude:
-        if debug:
+        if log_debug:
             logger.debug("Starship data incomplete, using Superheavy data as fallback")
             logger.debug(f"Before fallback - SS speed: {ss_speed}, SS altitude: {ss_altitude}")
             logger.debug(f"Fallback data - SH speed: {sh_speed}, SH altitude: {sh_altitude}")
@@ -351,62 +489,14 @@ def extract_data(image: np.ndarray, display_rois: bool = False, debug: bool = Fa
         if not ss_altitude:
             starship_data["altitude"] = sh_altitude
     
-    # Extract fuel levels
-    if debug:
-        logger.debug("Extracting fuel levels")
-    
-    try:
-        # Ensure fuel_data is always defined to avoid UnboundLocalError in debug logging
-        fuel_data = None
-        if has_fuel_roi:
-            fuel_data = extract_fuel_levels(image, debug)
-            # Add fuel level data to vehicle data
-            superheavy_data["fuel"] = fuel_data.get("superheavy", {"lox": {"fullness": 0}, "ch4": {"fullness": 0}})
-            starship_data["fuel"] = fuel_data.get("starship", {"lox": {"fullness": 0}, "ch4": {"fullness": 0}})
-        else:
-            if debug:
-                logger.debug("No fuel ROIs configured; skipping fuel extraction")
-            # Reuse same empty dict for both to reduce allocations
-            empty_fuel = {"lox": {"fullness": 0}, "ch4": {"fullness": 0}}
-            superheavy_data["fuel"] = empty_fuel
-            starship_data["fuel"] = empty_fuel
-            # Mirror structure so later debug logging can read from fuel_data if needed
-            fuel_data = {"superheavy": empty_fuel, "starship": empty_fuel}
-        
-        if debug and fuel_data:
-            # Cache fuel values for logging (use .get chains to be defensive)
-            sh_lox = fuel_data.get("superheavy", {}).get("lox", {}).get("fullness", 0)
-            sh_ch4 = fuel_data.get("superheavy", {}).get("ch4", {}).get("fullness", 0)
-            ss_lox = fuel_data.get("starship", {}).get("lox", {}).get("fullness", 0)
-            ss_ch4 = fuel_data.get("starship", {}).get("ch4", {}).get("fullness", 0)
-            logger.debug(f"Fuel levels - SH: LOX {sh_lox:.1f}%, CH4 {sh_ch4:.1f}%, "
-                        f"SS: LOX {ss_lox:.1f}%, CH4 {ss_ch4:.1f}%")
-    except Exception as e:
-        logger.error(f"Error extracting fuel levels: {str(e)}")
-        if debug:
-            logger.debug(traceback.format_exc())
-        # Reuse same empty dict for both to reduce allocations and ensure fuel_data exists
-        empty_fuel = {"lox": {"fullness": 0}, "ch4": {"fullness": 0}}
-        superheavy_data["fuel"] = empty_fuel
-        starship_data["fuel"] = empty_fuel
-        fuel_data = {"superheavy": empty_fuel, "starship": empty_fuel}
-    
-    # Detect engine status via centralized engine_detection.detect_engine_status
-    try:
-        engine_data = detect_engine_status(image, debug, roi_manager=roi_manager, frame_idx=frame_idx)
-        # Add engine data to vehicle data (may be empty dicts if no engine ROIs)
-        superheavy_data["engines"] = engine_data.get("superheavy", {})
-        starship_data["engines"] = engine_data.get("starship", {})
-    except Exception as e:
-        logger.error(f"Error detecting engine status: {str(e)}")
-        if debug:
-            logger.debug(traceback.format_exc())
-        # Add empty engine data to avoid KeyError
-        superheavy_data["engines"] = {}
-        starship_data["engines"] = {}
+    # Add fuel level and engine data to vehicle data
+    superheavy_data["fuel"] = sh_fuel
+    starship_data["fuel"] = ss_fuel
+    superheavy_data["engines"] = sh_engines
+    starship_data["engines"] = ss_engines
 
     # Updated Starship speed/altitude values after possible fallback
-    if debug:
+    if log_debug:
         logger.debug("Data extraction complete")
         ss_speed = starship_data.get("speed")  # Get updated value after fallback
         ss_altitude = starship_data.get("altitude")  # Get updated value after fallback
@@ -1,4 +1,6 @@
 import cv2
+import logging
+import traceback
 import numpy as np
 from typing import Dict, List, Tuple
 from numba import njit
@@ -42,6 +44,31 @@ STRIP_PARAMS = [
     for i in range(4)
 ]
 
+# Bounding box (x_min, y_min, x_max, y_max; max exclusive) of every pixel the strips
+# read, including the +/-5 pixel reference regions. Only this band of the frame is
+# converted to grayscale.
+STRIP_REGION = (
+    min(min(p['x'], p['ref_x'], p['ref_x2']) for p in STRIP_PARAMS) - 5,
+    min(min(p['y'], p['ref_y'], p['ref_y2']) for p in STRIP_PARAMS) - 5,
+    max(max(p['x'] + STRIP_LENGTH, p['ref_x'] + 5, p['ref_x2'] + 5) for p in STRIP_PARAMS),
+    max(max(p['y'] + STRIP_HEIGHT, p['ref_y'] + 5, p['ref_y2'] + 5) for p in STRIP_PARAMS),
+)
+
+def _crop_strip_region(image: np.ndarray) -> Tuple[np.ndarray, int, int]:
+    """
+    Crop an image to STRIP_REGION, clipped to the image bounds.
+    
+    Returns:
+        Tuple of (cropped view, x offset, y offset). The whole image with a zero
+        offset is returned if the region lies outside it.
+    """
+    h, w = image.shape[:2]
+    x0, y0 = max(0, STRIP_REGION[0]), max(0, STRIP_REGION[1])
+    x1, y1 = min(w, STRIP_REGION[2]), min(h, STRIP_REGION[3])
+    if x0 >= x1 or y0 >= y1:
+        return image, 0, 0
+    return image[y0:y1, x0:x1], x0, y0
+
 @njit
 def process_strip_numba(gray_img: np.ndarray, x: int, y: int, ref_x: int, ref_y: int, ref_x2: int, ref_y2: int, strip_length: int, strip_height: int, brightness_threshold: float, ref_diff_threshold: float) -> Dict:
     """
@@ -139,9 +166,16 @@ def process_strip_numba(gray_img: np.ndarray, x: int, y: int, ref_x: int, ref_y:
     # Default return if strip couldn't be processed
     return {"fullness": 0.0, "length": 0, "ref_diff": pixel_diff}
 
-def process_strip(gray_img: np.ndarray, strip_idx: int, debug: bool = False) -> Dict:
+def process_strip(gray_img: np.ndarray, strip_idx: int, debug: bool = False,
+                  offset: Tuple[int, int] = (0, 0)) -> Dict:
     """
     Process a single fuel level strip from the image.
+    
+    Args:
+        gray_img (np.ndarray): Grayscale frame, or a crop of one
+        strip_idx (int): Index of the strip (0-3)
+        debug (bool): Enable debug logging
+        offset (Tuple[int, int]): (x, y) position of gray_img's top-left corner in the frame
     """
     if strip_idx < 0 or strip_idx > 3:
         logger.error(f"Invalid strip index: {strip_idx}, must be 0-3")
@@ -149,17 +183,18 @@ def process_strip(gray_img: np.ndarray, strip_idx: int, debug: bool = False) ->
 
     # Use pre-computed parameters for speed
     params = STRIP_PARAMS[strip_idx]
+    ox, oy = offset
 
     result = process_strip_numba(
         gray_img, 
-        params['x'], params['y'], 
-        params['ref_x'], params['ref_y'], 
-        params['ref_x2'], params['ref_y2'], 
+        params['x'] - ox, params['y'] - oy, 
+        params['ref_x'] - ox, params['ref_y'] - oy, 
+        params['ref_x2'] - ox, params['ref_y2'] - oy, 
         STRIP_LENGTH, STRIP_HEIGHT, 
         BRIGHTNESS_THRESHOLD, REF_DIFF_THRESHOLD
     )
 
-    if debug:
+    if debug and logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"Strip {strip_idx+1} - Length: {result['length']}, Fullness: {result['fullness']:.1f}%, Ref Diff: {result['ref_diff']:.3f}")
 
     return result
@@ -179,16 +214,20 @@ def extract_fuel_levels(image: np.ndarray, debug: bool = False) -> Dict:
     logger.debug("Extracting fuel levels from image")
     
     try:
+        # The strips sit in a thin band near the bottom of the frame, so only that
+        # band is converted to grayscale
+        region, ox, oy = _crop_strip_region(image)
+        
         # Convert to grayscale if necessary
-        if len(image.shape) == 3:
-            gray_img = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if len(region.shape) == 3:
+            gray_img = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)
         else:
-            gray_img = image
+            gray_img = region
         
         # Process each strip
         strip_results = []
         for i in range(4):
-            result = process_strip(gray_img, i, debug)
+            result = process_strip(gray_img, i, debug, offset=(ox, oy))
             strip_results.append(result)
         
         # Create result dictionary directly from strip results without applying grouping rules
@@ -211,17 +250,19 @@ def extract_fuel_levels(image: np.ndarray, debug: bool = False) -> Dict:
             }
         }
         
-        logger.debug(f"Extracted fuel levels - SH: LOX {fuel_data['superheavy']['lox']['fullness']:.1f}%, " +
-                    f"CH4 {fuel_data['superheavy']['ch4']['fullness']:.1f}%, " +
-                    f"SS: LOX {fuel_data['starship']['lox']['fullness']:.1f}%, " +
-                    f"CH4 {fuel_data['starship']['ch4']['fullness']:.1f}%")
+        # Lazy %-formatting: this runs for every frame, usually with DEBUG disabled
+        logger.debug("Extracted fuel levels - SH: LOX %.1f%%, CH4 %.1f%%, SS: LOX %.1f%%, CH4 %.1f%%",
+                     fuel_data['superheavy']['lox']['fullness'],
+                     fuel_data['superheavy']['ch4']['fullness'],
+                     fuel_data['starship']['lox']['fullness'],
+                     fuel_data['starship']['ch4']['fullness'])
         
         return fuel_data
         
     except Exception as e:
         logger.error(f"Error extracting fuel levels: {str(e)}")
-        import traceback
-        logger.debug(traceback.format_exc())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
         
         # Return empty data structure in case of error
         return {
@@ -1,7 +1,7 @@
 import re
-import easyocr
+import importlib
+import logging
 import numpy as np
-import torch
 import os
 import gc
 import threading
@@ -12,6 +12,30 @@ from utils.logger import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
+# Patterns applied to every OCR result, compiled once
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+_TIME_RE = re.compile(r'([+-])(\d{2}):(\d{2}):(\d{2})')
+
+
+class _LazyModule:
+    """
+    Stand-in for a module that is only imported when one of its attributes is used.
+    
+    EasyOCR and torch take seconds to import, so deferring them keeps application
+    startup and the menus that never run OCR fast.
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+    
+    def __getattr__(self, attr):
+        # import_module is a sys.modules lookup after the first call
+        return getattr(importlib.import_module(self._name), attr)
+
+
+easyocr = _LazyModule("easyocr")
+torch = _LazyModule("torch")
+
 # Process-global EasyOCR reader to avoid duplicated model loads on GPU.
 # One reader per process reduces GPU memory usage compared to per-thread readers.
 _reader = None
@@ -20,7 +44,7 @@ _device_initialized = False
 _device_id: Optional[int] = None
 
 
-def _init_reader(gpu: bool) -> easyocr.Reader:
+def _init_reader(gpu: bool) -> "easyocr.Reader":
     """Initialize and return the process-global EasyOCR reader.
 
     If GPU initialization fails, this will fall back to a CPU reader and return it.
@@ -71,7 +95,7 @@ def _init_reader(gpu: bool) -> easyocr.Reader:
     return _reader
 
 
-def get_reader() -> easyocr.Reader:
+def get_reader() -> "easyocr.Reader":
     """Return the process-global EasyOCR reader, initializing it on first use."""
     global _reader
     if _reader is None:
@@ -101,7 +125,9 @@ def extract_values_from_roi(roi: np.ndarray, mode: str = "data", display_transfo
                 logger.warning("Empty or invalid ROI provided to OCR")
             return {}
             
-        if debug:
+        # Everything below only logs at DEBUG, so check the level once per ROI
+        log_debug = debug and logger.isEnabledFor(logging.DEBUG)
+        if log_debug:
             logger.debug(f"Processing ROI of shape {roi.shape} in mode: {mode}")
             # Log memory usage if debug is enabled
             if torch.cuda.is_available():
@@ -116,13 +142,13 @@ def extract_values_from_roi(roi: np.ndarray, mode: str = "data", display_transfo
                 
         # Process the image with error handling
         try:
-            if debug:
+            if log_debug:
                 logger.debug(f"Starting OCR with allowlist: {allowlist}")
                 
             results = ocr_reader.readtext(roi, detail=0, allowlist=allowlist)
             text = ''.join(results) if results else ""
             
-            if debug:
+            if log_debug:
                 logger.debug(f"OCR results: {results}")
                 
         except RuntimeError as e:
@@ -158,7 +184,7 @@ def extract_values_from_roi(roi: np.ndarray, mode: str = "data", display_transfo
                 logger.error(f"RuntimeError in OCR: {str(e)}")
                 raise
         
-        if debug:
+        if log_debug:
             logger.debug(f"Raw OCR result for {mode}: {text}")
             
     except Exception as e:
@@ -166,30 +192,30 @@ def extract_values_from_roi(roi: np.ndarray, mode: str = "data", display_transfo
         return {}
     
     # Use the OCR result directly since we're already using an allowlist
-    if debug:
+    if log_debug:
         logger.debug(f"OCR result for {mode}: {text}")
     
     # Process according to mode
     if mode == "speed":
         speed = extract_single_value(text)
-        if debug:
+        if log_debug:
             logger.debug(f"Extracted speed value: {speed}")
         return {"value": speed}
     elif mode == "altitude":
         altitude = extract_single_value(text)
-        if debug:
+        if log_debug:
             logger.debug(f"Extracted altitude value: {altitude}")
         return {"value": altitude}
     elif mode == "time":
         time = extract_time(text)
-        if debug:
+        if log_debug:
             if time:
                 logger.debug(f"Extracted time: {time['sign']} {time.get('hours', 0):02}:{time.get('minutes', 0):02}:{time.get('seconds', 0):02}")
             else:
                 logger.debug("Failed to extract time")
         return time if time else {}
     else:
-        if debug:
+        if log_debug:
             logger.debug(f"Unknown mode: {mode}")
         return {}
 
@@ -203,10 +229,10 @@ def extract_single_value(text: str) -> Optional[int]:
     Returns:
         Optional[int]: The extracted numeric value, or None if no value was found.
     """
-    numbers = re.findall(r'\d+(?:\.\d+)?', text)
-    if numbers:
-        return float(numbers[0])
-    logger.debug(f"No numeric value found in text: '{text}'")
+    match = _NUMBER_RE.search(text)
+    if match:
+        return float(match.group(0))
+    logger.debug("No numeric value found in text: '%s'", text)
     return None
 
 def extract_time(text: str) -> Optional[Dict[str, int]]:
@@ -219,11 +245,9 @@ def extract_time(text: str) -> Optional[Dict[str, int]]:
     Returns:
         dict: A dictionary containing the extracted time.
     """
-    match = re.search(r'[+-]\d{2}:\d{2}:\d{2}', text)
+    match = _TIME_RE.search(text)
     if match:
-        time_str = match.group(0)
-        sign = time_str[0]
-        hours, minutes, seconds = map(int, time_str[1:].split(':'))
-        return {"sign": sign, "hours": hours, "minutes": minutes, "seconds": seconds}
-    logger.debug(f"No time format found in text: '{text}'")
+        sign, hours, minutes, seconds = match.groups()
+        return {"sign": sign, "hours": int(hours), "minutes": int(minutes), "seconds": int(seconds)}
+    logger.debug("No time format found in text: '%s'", text)
     return None
\ No newline at end of file
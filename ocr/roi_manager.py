@@ -1,7 +1,8 @@
 import json
 import threading
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import numpy as np
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,6 +41,17 @@ class ROI:
                 # If the structure is unexpected, keep raw value to allow downstream handling
                 normalized = pts
             self.points = normalized
+        # Cache the points as (N, 2) int32 arrays so per-frame engine checks
+        # can index images directly without rebuilding arrays every frame
+        self.point_arrays: Optional[Dict[str, np.ndarray]] = None
+        if isinstance(self.points, dict):
+            try:
+                self.point_arrays = {
+                    section: np.asarray(coords, dtype=np.int32).reshape(-1, 2)
+                    for section, coords in self.points.items()
+                }
+            except (TypeError, ValueError):
+                self.point_arrays = None
 
     def is_active(self, frame_idx: Optional[int]) -> bool:
         # If frame_idx is None, treat ROI as active
@@ -73,11 +85,15 @@ class ROIManager:
         self.version = None
         self.time_unit = None
         self._rois: List[ROI] = []
+        # (frame_idx, active ROIs) for the most recently queried frame; every
+        # frame asks for its active ROIs several times, so keep the last answer
+        self._active_memo: Optional[Tuple[Optional[int], List[ROI]]] = None
         self.reload()
 
     def reload(self) -> None:
         """Reload the ROI config file. Safe to call at runtime."""
         with self._lock:
+            self._active_memo = None
             try:
                 logger.debug(f"Loading ROI config from {self.config_path}")
                 text = self.config_path.read_text(encoding="utf-8")
@@ -100,16 +116,24 @@ class ROIManager:
                 logger.exception(f"Error loading ROI config: {e}")
                 self._rois = []
 
+    def _active_for(self, frame_idx: Optional[int]) -> List[ROI]:
+        """Return the (memoized) ROIs active at frame_idx. Caller must hold the lock."""
+        memo = self._active_memo
+        if memo is None or memo[0] != frame_idx:
+            memo = (frame_idx, [r for r in self._rois if r.is_active(frame_idx)])
+            self._active_memo = memo
+        return memo[1]
+
     def get_active_rois(self, frame_idx: Optional[int] = None) -> List[ROI]:
         """Return list of ROIs active for a given frame index (or all if None)."""
         with self._lock:
-            return [r for r in self._rois if r.is_active(frame_idx)]
+            return list(self._active_for(frame_idx))
 
     def get_roi_for_role(self, role: str, frame_idx: Optional[int] = None) -> Optional[ROI]:
         """Return the first ROI matching match_to_role==role and active at frame_idx, or None."""
         with self._lock:
-            for r in self._rois:
-                if r.match_to_role == role and r.is_active(frame_idx):
+            for r in self._active_for(frame_idx):
+                if r.match_to_role == role:
                     return r
             return None
 
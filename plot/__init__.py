@@ -1,3 +1,14 @@
+import os
+import sys
+
+import matplotlib
+
+# Fall back to the non-interactive Agg backend on headless Linux hosts so that
+# batch plotting never tries to open a GUI window. The interactive viewer embeds
+# figures through its own TkAgg canvas and is unaffected by this choice.
+if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+    matplotlib.use('Agg')
+
 from .flight_plotting import plot_flight_data
 from .comparison_plotting import compare_multiple_launches
 from .interactive_viewer import show_plots_interactively, InteractivePlotViewer
@@ -4,7 +4,10 @@ import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
 from statsmodels.nonparametric.smoothers_lowess import lowess
-from .data_processing import load_and_clean_data, compute_acceleration, compute_g_force, prepare_fuel_data_columns
+from .data_processing import (load_and_clean_data, compute_acceleration, compute_g_force,
+                              prepare_fuel_data_columns, filter_time_window,
+                              centered_rolling_mean)
+from .figure_utils import maximize_figure_window, save_figure
 from utils.constants import (PLOT_MULTIPLE_LAUNCHES_PARAMS, COMPARE_FUEL_LEVEL_PARAMS,
                       FIGURE_SIZE, TITLE_FONT_SIZE, SUBTITLE_FONT_SIZE, LABEL_FONT_SIZE, 
                       LEGEND_FONT_SIZE, TICK_FONT_SIZE, MARKER_SIZE, MARKER_ALPHA, 
@@ -15,48 +18,15 @@ from utils.logger import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
-# Set seaborn style globally for all plots - slightly bigger font size
-sns.set_theme(style="whitegrid", context="talk",
-              palette="colorblind", font_scale=1.1)
-
-
-def maximize_figure_window():
-    """
-    Maximize the current figure window to take all available screen space without going full screen.
-    This preserves window decorations and taskbar visibility.
-    """
-    try:
-        # Get the figure manager
-        fig_manager = plt.get_current_fig_manager()
-        
-        # Try different approaches based on backend, prioritizing maximize over full screen
-        if hasattr(fig_manager, 'window') and hasattr(fig_manager.window, 'showMaximized'):
-            # Qt backend (most common)
-            fig_manager.window.showMaximized()
-        elif hasattr(fig_manager, 'window') and hasattr(fig_manager.window, 'state') and hasattr(fig_manager.window, 'tk'):
-            # TkAgg backend
-            fig_manager.window.state('zoomed')  # Windows 'zoomed' state
-        elif hasattr(fig_manager, 'frame') and hasattr(fig_manager.frame, 'Maximize'):
-            # WX backend
-            fig_manager.frame.Maximize(True)
-        elif hasattr(fig_manager, 'window') and hasattr(fig_manager.window, 'maximize'):
-            # Other backends with maximize function
-            fig_manager.window.maximize()
-        elif hasattr(fig_manager, 'full_screen_toggle'):
-            # Only use full screen as a last resort
-            logger.debug("Using full_screen_toggle as fallback")
-            fig_manager.full_screen_toggle()
-        elif hasattr(fig_manager, 'resize'):
-            # MacOSX backend
-            fig_manager.resize(*fig_manager.window.get_screen().get_size())
-    except Exception as e:
-        logger.debug(f"Could not maximize window: {str(e)}")
+# Every comparison plot rendered by compare_multiple_launches. The fuel entries
+# appear in both constant tables, so duplicates are dropped to render each once.
+COMPARISON_PLOT_TABLE = list(dict.fromkeys(PLOT_MULTIPLE_LAUNCHES_PARAMS + COMPARE_FUEL_LEVEL_PARAMS))
 
 
 def plot_multiple_launches(df_list: list, x: str, y: str, title: str, filename: str, folder: str,
                            labels: list[str], x_axis: str = None, y_axis: str = None, show_figures: bool = True) -> None:
     """
-    Plot a comparison of multiple dataframes using seaborn.
+    Plot a comparison of multiple dataframes using matplotlib.
 
     Args:
         df_list (list): List of dataframes to compare.
@@ -74,7 +44,7 @@ def plot_multiple_launches(df_list: list, x: str, y: str, title: str, filename:
     logger.debug(f"Comparing {len(df_list)} launches: {', '.join(labels)}")
     
     # Create figure (fullscreen)
-    fig = plt.figure(figsize=FIGURE_SIZE)
+    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
 
     # Custom color palette with distinct colors for each launch
     palette = sns.color_palette("husl", len(df_list))
@@ -87,16 +57,9 @@ def plot_multiple_launches(df_list: list, x: str, y: str, title: str, filename:
         data_count = df[y].notna().sum()
         logger.debug(f"Launch {label}: {data_count} data points for {y}")
 
-        # Add scatter plot with seaborn
-        scatter = sns.scatterplot(
-            x=x,
-            y=y,
-            data=df,
-            label=f"{label}",
-            color=color,
-            alpha=MARKER_ALPHA,
-            s=MARKER_SIZE
-        )
+        # Plain matplotlib scatter on NumPy arrays; NaN points are skipped by matplotlib
+        ax.scatter(df[x].to_numpy(), df[y].to_numpy(), label=f"{label}",
+                   color=color, alpha=MARKER_ALPHA, s=MARKER_SIZE, rasterized=True)
 
         # Add trendline only for acceleration and g-force plots
         if ('acceleration' in y or 'g_force' in y) and len(df[[x, y]].dropna()) > 30:
@@ -107,26 +70,25 @@ def plot_multiple_launches(df_list: list, x: str, y: str, title: str, filename:
             # Sort data by x-axis value to ensure proper rolling window calculation
             valid_data = valid_data.sort_values(by=x)
             
-            # Use pandas rolling window (30 points) instead of LOWESS smoothing
-            valid_data['trend'] = valid_data[y].rolling(window=30, center=True, min_periods=5).mean()
+            # 30-point centered rolling average computed on the raw array
+            trend = centered_rolling_mean(valid_data[y].to_numpy(dtype=np.float64), 30, 5)
             
             # Plot the rolling average trendline
-            plt.plot(valid_data[x], valid_data['trend'], '-', linewidth=LINE_WIDTH,
-                     label=f"{label} (30-point Rolling Avg)", color=color)
+            ax.plot(valid_data[x].to_numpy(), trend, '-', linewidth=LINE_WIDTH,
+                    label=f"{label} (30-point Rolling Avg)", color=color)
 
     # Set labels with consistent styling
-    plt.xlabel(x_axis, fontsize=LABEL_FONT_SIZE)
-    plt.ylabel(y_axis, fontsize=LABEL_FONT_SIZE)
-    plt.title(title, fontsize=TITLE_FONT_SIZE)
-    plt.tick_params(labelsize=TICK_FONT_SIZE)
+    ax.set_xlabel(x_axis, fontsize=LABEL_FONT_SIZE)
+    ax.set_ylabel(y_axis, fontsize=LABEL_FONT_SIZE)
+    ax.set_title(title, fontsize=TITLE_FONT_SIZE)
+    ax.tick_params(labelsize=TICK_FONT_SIZE)
 
     # Add legend with improved visibility
-    plt.legend(frameon=True, fontsize=LEGEND_FONT_SIZE)
+    ax.legend(frameon=True, fontsize=LEGEND_FONT_SIZE)
 
     # Save figure with high quality
-    os.makedirs(folder, exist_ok=True)
     save_path = os.path.join(folder, filename)
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_figure(fig, save_path)
     logger.info(f"Saved comparison plot to {save_path}")
 
     # If showing figures, add to interactive viewer instead of displaying individually
@@ -141,6 +103,7 @@ def plot_multiple_launches(df_list: list, x: str, y: str, title: str, filename:
             # Fall back to regular display
             maximize_figure_window()
             plt.show()
+            plt.close(fig)
     else:
         plt.close(fig)
 
@@ -181,9 +144,7 @@ def compare_multiple_launches(start_time: int, end_time: int, *json_paths: str,
 
             # Filter by time window
             original_count = len(df)
-            df = df[df['real_time_seconds'] >= start_time]
-            if end_time != -1:
-                df = df[df['real_time_seconds'] <= end_time]
+            df = filter_time_window(df, start_time, end_time)
             logger.debug(f"Using {len(df)} of {original_count} data points after time filtering")
 
             # Calculate acceleration using 30-frame distance
@@ -225,29 +186,14 @@ def compare_multiple_launches(start_time: int, end_time: int, *json_paths: str,
         "results", "compare_launches", f"launches_{'_'.join([l.replace('Launch ', '') for l in labels])}")
     logger.info(f"Creating comparison plots in folder {folder_name}")
 
-    # Create all comparison plots defined in constants
-    logger.info(f"Creating {len(PLOT_MULTIPLE_LAUNCHES_PARAMS)} comparison plots")
-    for params in PLOT_MULTIPLE_LAUNCHES_PARAMS:
-        if len(params) == 4:
-            plot_multiple_launches(
-                df_list, *params, folder_name, labels, show_figures=show_figures)
-        else:
-            # Unpack: x, y, title, filename, x_axis, y_axis.
-            x, y, title, filename, x_axis, y_axis = params
-            plot_multiple_launches(df_list, x, y, title, filename, folder_name,
-                                   labels, x_axis, y_axis, show_figures=show_figures)
-    
-    # Create fuel level comparison plots
-    logger.info(f"Creating {len(COMPARE_FUEL_LEVEL_PARAMS)} fuel level comparison plots")
-    for params in COMPARE_FUEL_LEVEL_PARAMS:
-        if len(params) == 4:
-            plot_multiple_launches(
-                df_list, *params, folder_name, labels, show_figures=show_figures)
-        else:
-            # Unpack: x, y, title, filename, x_axis, y_axis.
-            x, y, title, filename, x_axis, y_axis = params
-            plot_multiple_launches(df_list, x, y, title, filename, folder_name,
-                                   labels, x_axis, y_axis, show_figures=show_figures)
+    # Create the output folder once; plot_multiple_launches assumes it exists
+    os.makedirs(folder_name, exist_ok=True)
+
+    # Create all comparison plots from the precomputed dispatch table
+    logger.info(f"Creating {len(COMPARISON_PLOT_TABLE)} comparison plots")
+    for x, y, title, filename, x_axis, y_axis in COMPARISON_PLOT_TABLE:
+        plot_multiple_launches(df_list, x, y, title, filename, folder_name,
+                               labels, x_axis, y_axis, show_figures=show_figures)
     
     logger.info("Completed all comparison plots")
     
@@ -2,30 +2,151 @@ import json
 import pandas as pd
 import numpy as np
 import traceback
-from tqdm import tqdm
-from utils.constants import G_FORCE_CONVERSION
+from numba import njit
+from utils.constants import G_FORCE_CONVERSION, DATA_CLEANING_LIMITS
 from utils.logger import get_logger
 
+# orjson is an optional, much faster parser; fall back to the stdlib if missing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Initialize logger
 logger = get_logger(__name__)
 
 
-def validate_json(data: list) -> bool:
+REQUIRED_JSON_KEYS = {"frame_number", "superheavy", "starship", "time", "real_time_seconds"}
+
+# DATA_CLEANING_LIMITS split once into per-column float32 bound arrays, in column order
+CLEANING_COLUMNS = list(DATA_CLEANING_LIMITS)
+CLEANING_LOWS, CLEANING_HIGHS, CLEANING_MAX_JUMPS = (
+    np.array(bounds, dtype=np.float32) for bounds in zip(*DATA_CLEANING_LIMITS.values())
+)
+
+
+def validate_json(data: list, df: pd.DataFrame) -> tuple:
     """
-    Validate the structure of the JSON data.
+    Validate the structure of the JSON data against its normalized DataFrame.
+
+    The check runs once over the DataFrame columns; the raw records are only
+    scanned when a required key is missing, to report an offending entry.
 
     Args:
-        data (list): The JSON data to validate.
+        data (list): The raw JSON records.
+        df (pd.DataFrame): The DataFrame produced from ``data`` by json_normalize.
 
     Returns:
-        bool: True if the structure is valid, False otherwise.
+        tuple: (True, None) if the structure is valid, otherwise (False, entry)
+            with the first entry missing a required key.
     """
-    required_keys = {"frame_number", "superheavy",
-                     "starship", "time", "real_time_seconds"}
+    # json_normalize flattens nested dicts, so 'superheavy' shows up as 'superheavy.speed' etc.
+    top_level_columns = {str(column).split(".", 1)[0] for column in df.columns}
+    if REQUIRED_JSON_KEYS.issubset(top_level_columns):
+        return (True, None)
+
     for entry in data:
-        if not required_keys.issubset(entry.keys()):
+        if not REQUIRED_JSON_KEYS.issubset(entry.keys()):
             return (False, entry)
-    return (True, None)
+    return (False, data[0] if data else None)
+
+
+def split_pair_column(column: pd.Series) -> np.ndarray:
+    """
+    Split a column of [speed, altitude] pairs into a two-column float array.
+
+    Args:
+        column (pd.Series): Column whose values are two-element lists.
+
+    Returns:
+        np.ndarray: Array of shape (len(column), 2); malformed rows are NaN.
+    """
+    values = column.tolist()
+    try:
+        pairs = np.asarray(values, dtype=np.float64)
+        if pairs.ndim == 2 and pairs.shape[1] == 2:
+            return pairs
+    except (TypeError, ValueError):
+        pass
+
+    # Ragged or partially missing rows: only walk the list in this slow path
+    return np.array(
+        [v if isinstance(v, (list, tuple)) and len(v) == 2 else (np.nan, np.nan) for v in values],
+        dtype=np.float64
+    ).reshape(len(values), 2)
+
+
+@njit
+def mask_abrupt_changes(values: np.ndarray, max_jump: float) -> int:
+    """
+    Replace samples that jump more than max_jump from the previous sample with NaN.
+
+    The comparison always uses the previous *original* sample, matching a
+    diff computed before masking. The array is modified in place.
+
+    Args:
+        values: 1-D float array of telemetry samples
+        max_jump: Largest allowed absolute change between consecutive samples
+
+    Returns:
+        Number of samples that were masked
+    """
+    n = values.shape[0]
+    if n == 0:
+        return 0
+
+    masked = 0
+    previous = values[0]
+    for i in range(1, n):
+        current = values[i]
+        if abs(current - previous) > max_jump:
+            values[i] = np.nan
+            masked += 1
+        previous = current
+    return masked
+
+
+@njit
+def centered_rolling_mean(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """
+    Centered rolling mean matching pandas ``rolling(window, center=True, min_periods).mean()``.
+
+    Uses prefix sums of the non-NaN samples, so each output costs O(1) regardless
+    of the window size.
+
+    Args:
+        values: 1-D float array of samples
+        window: Number of samples in each window
+        min_periods: Minimum number of non-NaN samples required for a result
+
+    Returns:
+        Array of the same length with the rolling means (NaN where too few samples)
+    """
+    n = values.shape[0]
+    sums = np.zeros(n + 1)
+    counts = np.zeros(n + 1, dtype=np.int64)
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            sums[i + 1] = sums[i]
+            counts[i + 1] = counts[i]
+        else:
+            sums[i + 1] = sums[i] + value
+            counts[i + 1] = counts[i] + 1
+
+    # Same window placement as pandas: [i - window // 2, i + (window - 1) // 2]
+    offset = (window - 1) // 2
+    result = np.empty(n)
+    for i in range(n):
+        end = min(i + offset + 1, n)
+        start = max(i + offset + 1 - window, 0)
+        count = counts[end] - counts[start]
+        if count >= min_periods and count > 0:
+            result[i] = (sums[end] - sums[start]) / count
+        else:
+            result[i] = np.nan
+    return result
 
 
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -40,56 +161,31 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Cleaning dataframe and removing outliers")
     
-    # Step 1: Ensure numeric values
-    for column in ['starship.speed', 'superheavy.speed', 'starship.altitude', 'superheavy.altitude']:
-        df[column] = pd.to_numeric(df[column], errors='coerce')
+    columns = CLEANING_COLUMNS
+    lows, highs, max_jumps = CLEANING_LOWS, CLEANING_HIGHS, CLEANING_MAX_JUMPS
+    
+    # Step 1: Ensure numeric values, gathered into one column-major float32 block.
+    # Speeds and altitudes stay well within float32 precision, and half-width
+    # columns halve the memory traffic of every later vectorized pass.
+    values = np.empty((len(df), len(columns)), dtype=np.float32, order='F')
+    for i, column in enumerate(columns):
+        values[:, i] = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float32)
+    nan_counts = np.isnan(values).sum(axis=0)
+    
+    # Step 2: Remove impossible values with a single broadcast clip over all columns
+    out_of_range = ((values < lows) | (values > highs)).sum(axis=0)
+    np.clip(values, lows, highs, out=values)
+    
+    for i, column in enumerate(columns):
+        logger.debug(f"{nan_counts[i]} NaN values in {column} after numeric conversion")
+        logger.debug(f"Clipped {out_of_range[i]} impossible values from {column}")
         
-    # Log the number of NaN values after conversion
-    nan_counts = df[['starship.speed', 'superheavy.speed', 'starship.altitude', 'superheavy.altitude']].isna().sum()
-    logger.debug(f"NaN values after numeric conversion: {nan_counts.to_dict()}")
-
-    # Step 2: Remove impossible values
-    prev_count = (~df['starship.speed'].isna()).sum()
-    df['starship.speed'] = df['starship.speed'].clip(lower=0, upper=28000)
-    current_count = (~df['starship.speed'].isna()).sum()
-    logger.debug(f"Clipped {prev_count - current_count} impossible values from starship.speed")
-    
-    prev_count = (~df['superheavy.speed'].isna()).sum()
-    df['superheavy.speed'] = df['superheavy.speed'].clip(lower=0, upper=6000)
-    current_count = (~df['superheavy.speed'].isna()).sum()
-    logger.debug(f"Clipped {prev_count - current_count} impossible values from superheavy.speed")
-    
-    prev_count = (~df['starship.altitude'].isna()).sum()
-    df['starship.altitude'] = df['starship.altitude'].clip(lower=0, upper=200)
-    current_count = (~df['starship.altitude'].isna()).sum()
-    logger.debug(f"Clipped {prev_count - current_count} impossible values from starship.altitude")
-    
-    prev_count = (~df['superheavy.altitude'].isna()).sum()
-    df['superheavy.altitude'] = df['superheavy.altitude'].clip(
-        lower=0, upper=100)
-    current_count = (~df['superheavy.altitude'].isna()).sum()
-    logger.debug(f"Clipped {prev_count - current_count} impossible values from superheavy.altitude")
-
-    # Step 3: Detect abrupt changes
-    df['starship.speed_diff'] = df['starship.speed'].diff().abs()
-    abrupt_changes = (df['starship.speed_diff'] > 50).sum()
-    logger.debug(f"Detected {abrupt_changes} abrupt changes in starship.speed")
-    df.loc[df['starship.speed_diff'] > 50, 'starship.speed'] = None
-    
-    df['superheavy.speed_diff'] = df['superheavy.speed'].diff().abs()
-    abrupt_changes = (df['superheavy.speed_diff'] > 50).sum()
-    logger.debug(f"Detected {abrupt_changes} abrupt changes in superheavy.speed")
-    df.loc[df['superheavy.speed_diff'] > 50, 'superheavy.speed'] = None
-    
-    df['starship.altitude_diff'] = df['starship.altitude'].diff().abs()
-    abrupt_changes = (df['starship.altitude_diff'] > 1).sum()
-    logger.debug(f"Detected {abrupt_changes} abrupt changes in starship.altitude")
-    df.loc[df['starship.altitude_diff'] > 1, 'starship.altitude'] = None
-    
-    df['superheavy.altitude_diff'] = df['superheavy.altitude'].diff().abs()
-    abrupt_changes = (df['superheavy.altitude_diff'] > 1).sum()
-    logger.debug(f"Detected {abrupt_changes} abrupt changes in superheavy.altitude")
-    df.loc[df['superheavy.altitude_diff'] > 1, 'superheavy.altitude'] = None
+        # Step 3: Detect abrupt changes between consecutive samples (columns are contiguous)
+        abrupt_changes = mask_abrupt_changes(values[:, i], max_jumps[i])
+        logger.debug(f"Detected {abrupt_changes} abrupt changes in {column}")
+    
+    for i, column in enumerate(columns):
+        df[column] = values[:, i]
 
     logger.info("DataFrame cleaning complete")
     return df
@@ -135,7 +231,7 @@ def process_engine_data(df: pd.DataFrame) -> pd.DataFrame:
             'starship.engines.rvac': 'starship_rvac_active'
         }
         
-        for src_col, dest_col in tqdm(engine_columns.items(), desc="Processing engine columns"):
+        for src_col, dest_col in engine_columns.items():
             if src_col in df.columns:
                 # Sum the boolean values in each row to get active engine count
                 # Each row contains a list of boolean values (True = engine active)
@@ -236,41 +332,27 @@ def normalize_fuel_levels(df: pd.DataFrame) -> pd.DataFrame:
         logger.warning("Missing required columns for fuel normalization")
         return df
     
-    # Process each row
-    normalized_count = {'superheavy': 0, 'starship': 0}
+    # Apply the rule to whole columns at once instead of iterating rows
+    early = df['real_time_seconds'].to_numpy() < 200
+    normalized_count = {}
     
-    for idx, row in df.iterrows():
-        current_time = row['real_time_seconds']
+    for vehicle in ['superheavy', 'starship']:
+        lox_col = f'{vehicle}.fuel.lox.fullness'
+        ch4_col = f'{vehicle}.fuel.ch4.fullness'
+        lox = df[lox_col].to_numpy(dtype=np.float64, copy=True)
+        ch4 = df[ch4_col].to_numpy(dtype=np.float64, copy=True)
         
-        # Group 1: Superheavy LOX and CH4
-        sh_lox = row['superheavy.fuel.lox.fullness']
-        sh_ch4 = row['superheavy.fuel.ch4.fullness']
-        
-        if abs(sh_lox - sh_ch4) > 30:
-            # Use max value in first 200s, min value after
-            if current_time < 200:
-                chosen_value = max(sh_lox, sh_ch4)
-            else:
-                chosen_value = min(sh_lox, sh_ch4)
-                
-            df.at[idx, 'superheavy.fuel.lox.fullness'] = chosen_value
-            df.at[idx, 'superheavy.fuel.ch4.fullness'] = chosen_value
-            normalized_count['superheavy'] += 1
+        # NaN differences compare False, so incomplete readings are left untouched
+        diverged = np.abs(lox - ch4) > 30
         
-        # Group 2: Starship LOX and CH4
-        ss_lox = row['starship.fuel.lox.fullness']
-        ss_ch4 = row['starship.fuel.ch4.fullness']
+        # Use max value in first 200s, min value after
+        chosen = np.where(early, np.maximum(lox, ch4), np.minimum(lox, ch4))
+        lox[diverged] = chosen[diverged]
+        ch4[diverged] = chosen[diverged]
         
-        if abs(ss_lox - ss_ch4) > 30:
-            # Use max value in first 200s, min value after
-            if current_time < 200:
-                chosen_value = max(ss_lox, ss_ch4)
-            else:
-                chosen_value = min(ss_lox, ss_ch4)
-                
-            df.at[idx, 'starship.fuel.lox.fullness'] = chosen_value
-            df.at[idx, 'starship.fuel.ch4.fullness'] = chosen_value
-            normalized_count['starship'] += 1
+        df[lox_col] = lox
+        df[ch4_col] = ch4
+        normalized_count[vehicle] = int(diverged.sum())
     
     logger.info(f"Normalized {normalized_count['superheavy']} Superheavy and {normalized_count['starship']} Starship fuel readings")
     return df
@@ -289,19 +371,27 @@ def load_and_clean_data(json_path: str) -> pd.DataFrame:
     logger.info(f"Loading data from {json_path}")
     
     try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
+        # Read raw bytes in one call and parse them without a text decoding pass
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
         
         logger.info(f"Loaded {len(data)} records from JSON file")
         
+        # Use json_normalize with sep='.' to flatten nested dictionaries with dot notation
+        df = pd.json_normalize(data)
+        logger.debug(f"Normalized JSON to DataFrame with {len(df)} rows and {len(df.columns)} columns")
+        
         # Validate the JSON data structure
-        is_valid, invalid_entry = validate_json(data)
+        is_valid, invalid_entry = validate_json(data, df)
         if not is_valid:
             logger.warning(f"Invalid data structure in JSON. Example invalid entry: {invalid_entry}")
         
-        # Use json_normalize with sep='.' to flatten nested dictionaries with dot notation
-        df = pd.json_normalize(data)
-        logger.debug(f"Normalized JSON to DataFrame with {len(df)} rows and {len(df.columns)} columns")
+        # The DataFrame now owns the data; release the raw records before processing
+        del data, invalid_entry
+        
+        # Frame numbers are small integers, so keep them as a compact int32 column
+        if 'frame_number' in df.columns and pd.api.types.is_integer_dtype(df['frame_number']):
+            df['frame_number'] = df['frame_number'].astype(np.int32)
         
         # Process engine data
         df = process_engine_data(df)
@@ -317,15 +407,20 @@ def load_and_clean_data(json_path: str) -> pd.DataFrame:
         if 'superheavy.speed' not in df.columns and 'superheavy.speed' not in df.columns:
             logger.debug("Superheavy and Starship data need extraction from nested columns")
             # Extract speed and altitude from nested dictionaries if needed
-            for column in tqdm(["superheavy", "starship"], desc="Separating columns"):
+            for column in ["superheavy", "starship"]:
                 if column in df.columns:
-                    df[[f"{column}.speed", f"{column}.altitude"]] = df[column].apply(pd.Series)
+                    pairs = split_pair_column(df[column])
+                    df[f"{column}.speed"] = pairs[:, 0]
+                    df[f"{column}.altitude"] = pairs[:, 1]
                     df.drop(columns=[column], inplace=True)
                     logger.debug(f"Extracted speed and altitude from {column} column")
                     
-        # Sort by time
-        df.sort_values(by="real_time_seconds", inplace=True)
-        logger.debug("Sorted DataFrame by real_time_seconds")
+        # Sort by time with one stable argsort over the time array; frames are
+        # usually written in order already, in which case no reshuffle happens
+        if not df["real_time_seconds"].is_monotonic_increasing:
+            order = np.argsort(df["real_time_seconds"].to_numpy(), kind="stable")
+            df = df.take(order)
+            logger.debug("Sorted DataFrame by real_time_seconds")
         
         # Ensure fuel data columns are properly named
         df = prepare_fuel_data_columns(df)
@@ -349,6 +444,25 @@ def load_and_clean_data(json_path: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def filter_time_window(df: pd.DataFrame, start_time: float = 0, end_time: float = -1) -> pd.DataFrame:
+    """
+    Keep only the rows whose real_time_seconds falls inside a time window.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the data.
+        start_time (float): Minimum time in seconds to keep.
+        end_time (float): Maximum time in seconds to keep. Use -1 for no upper limit.
+
+    Returns:
+        pd.DataFrame: The filtered DataFrame.
+    """
+    times = df['real_time_seconds'].to_numpy()
+    keep = times >= start_time
+    if end_time != -1:
+        keep &= times <= end_time
+    return df[keep]
+
+
 def compute_acceleration(df: pd.DataFrame, speed_column: str, frame_distance: int = 30, max_accel: float = 100.0) -> pd.Series:
     """
     Calculate acceleration from speed data using a fixed frame distance.
@@ -1,57 +1,32 @@
 import os
+import logging
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
 from statsmodels.nonparametric.smoothers_lowess import lowess
-from .data_processing import load_and_clean_data, compute_acceleration, compute_g_force, prepare_fuel_data_columns
+from .data_processing import (load_and_clean_data, compute_acceleration, compute_g_force,
+                              prepare_fuel_data_columns, filter_time_window,
+                              centered_rolling_mean)
+from .figure_utils import maximize_figure_window, save_figure
 from utils.constants import (ANALYZE_RESULTS_PLOT_PARAMS, FUEL_LEVEL_PLOT_PARAMS, 
                       FIGURE_SIZE, TITLE_FONT_SIZE, SUBTITLE_FONT_SIZE, LABEL_FONT_SIZE, 
                       LEGEND_FONT_SIZE, TICK_FONT_SIZE, MARKER_SIZE, MARKER_ALPHA, 
                       LINE_WIDTH, LINE_ALPHA, ENGINE_TIMELINE_PARAMS, 
-                      ENGINE_PERFORMANCE_PARAMS)
+                      ENGINE_PERFORMANCE_PARAMS, SUPERHEAVY_DATA_CUTOFF_SECONDS)
 from utils import extract_launch_number
 from utils.logger import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
-# Set seaborn style globally for all plots - slightly bigger font size
-sns.set_theme(style="whitegrid", context="talk",
-              palette="colorblind", font_scale=1.1)
-
-
-def maximize_figure_window():
-    """
-    Maximize the current figure window to take all available screen space without going full screen.
-    This preserves window decorations and taskbar visibility.
-    """
-    try:
-        # Get the figure manager
-        fig_manager = plt.get_current_fig_manager()
-        
-        # Try different approaches based on backend, prioritizing maximize over full screen
-        if hasattr(fig_manager, 'window') and hasattr(fig_manager.window, 'showMaximized'):
-            # Qt backend (most common)
-            fig_manager.window.showMaximized()
-        elif hasattr(fig_manager, 'window') and hasattr(fig_manager.window, 'state') and hasattr(fig_manager.window, 'tk'):
-            # TkAgg backend
-            fig_manager.window.state('zoomed')  # Windows 'zoomed' state
-        elif hasattr(fig_manager, 'frame') and hasattr(fig_manager.frame, 'Maximize'):
-            # WX backend
-            fig_manager.frame.Maximize(True)
-        elif hasattr(fig_manager, 'window') and hasattr(fig_manager.window, 'maximize'):
-            # Other backends with maximize function
-            fig_manager.window.maximize()
-        elif hasattr(fig_manager, 'full_screen_toggle'):
-            # Only use full screen as a last resort
-            logger.debug("Using full_screen_toggle as fallback")
-            fig_manager.full_screen_toggle()
-        elif hasattr(fig_manager, 'resize'):
-            # MacOSX backend
-            fig_manager.resize(*fig_manager.window.get_screen().get_size())
-    except Exception as e:
-        logger.debug(f"Could not maximize window: {str(e)}")
+# Worker processes start by importing matplotlib, seaborn and this package (with
+# spawn, the Windows default, from scratch), which costs a few seconds before the
+# first plot is drawn. Below these limits the pool is slower than drawing serially.
+PARALLEL_PLOT_MIN_ROWS = 5000
+PARALLEL_PLOT_MIN_WORKERS = 2
 
 
 def create_engine_group_plot(df: pd.DataFrame, vehicle: str, folder: str, launch_number: str, show_figures: bool = True):
@@ -88,10 +63,9 @@ def create_engine_group_plot(df: pd.DataFrame, vehicle: str, folder: str, launch
     plt.tight_layout()
 
     # Save figure
-    os.makedirs(folder, exist_ok=True)
     vehicle_name = "superheavy" if vehicle == "superheavy" else "starship"
     save_path = f"{folder}/{vehicle_name}_engine_timeline.png"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_figure(fig, save_path)
     logger.info(f"Saved {vehicle} engine plot to {save_path}")
 
     # If we're showing figures, check for interactive viewer
@@ -105,6 +79,7 @@ def create_engine_group_plot(df: pd.DataFrame, vehicle: str, folder: str, launch
             # Fall back to regular display
             maximize_figure_window()
             plt.show()
+            plt.close(fig)
     else:
         plt.close(fig)
 
@@ -129,7 +104,7 @@ def create_engine_timeline_plot(df: pd.DataFrame, folder: str, launch_number: st
 def create_scatter_plot(df: pd.DataFrame, x: str, y: str, title: str, filename: str, label: str, 
                         x_axis: str, y_axis: str, folder: str, launch_number: str, show_figures: bool) -> None:
     """
-    Create and save a scatter plot for the data using seaborn.
+    Create and save a scatter plot for the data using matplotlib.
 
     Args:
         df (pd.DataFrame): The DataFrame containing the data.
@@ -148,18 +123,15 @@ def create_scatter_plot(df: pd.DataFrame, x: str, y: str, title: str, filename:
     title_with_launch = f"Launch {launch_number} - {title}"
     logger.info(f"Creating scatter plot: {title_with_launch}")
     
-    # Create plots directory if it doesn't exist
-    os.makedirs(folder, exist_ok=True)
-
     # Create figure (fullscreen)
-    fig = plt.figure(figsize=FIGURE_SIZE)
+    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
 
-    # Create scatter plot with seaborn
+    # Plain matplotlib scatter on NumPy arrays; NaN points are skipped by matplotlib
     data_count = df[y].notna().sum()
     logger.debug(f"Plotting {data_count} data points for {y}")
     
-    scatter_plot = sns.scatterplot(x=x, y=y, data=df, label=f"{label}",
-                                   s=MARKER_SIZE, alpha=MARKER_ALPHA, edgecolor=None)
+    ax.scatter(df[x].to_numpy(), df[y].to_numpy(), label=f"{label}",
+               s=MARKER_SIZE, alpha=MARKER_ALPHA, rasterized=True)
 
     # Add trendline only for acceleration and g-force plots
     if 'acceleration' in y or 'g_force' in y:
@@ -172,25 +144,25 @@ def create_scatter_plot(df: pd.DataFrame, x: str, y: str, title: str, filename:
             # Sort data by x-axis value to ensure proper rolling window calculation
             valid_data = valid_data.sort_values(by=x)
             
-            # Use pandas rolling window (30 points) instead of LOWESS smoothing
-            valid_data['trend'] = valid_data[y].rolling(window=30, center=True, min_periods=5).mean()
+            # 30-point centered rolling average computed on the raw array
+            trend = centered_rolling_mean(valid_data[y].to_numpy(dtype=np.float64), 30, 5)
             
             # Plot the rolling average trendline
-            plt.plot(valid_data[x], valid_data['trend'], color='crimson',
-                     linewidth=LINE_WIDTH, label=f"{label} (30-point Rolling Average)")
+            ax.plot(valid_data[x].to_numpy(), trend, color='crimson',
+                    linewidth=LINE_WIDTH, label=f"{label} (30-point Rolling Average)")
 
     # Set labels with consistent styling
-    plt.xlabel(x_axis, fontsize=LABEL_FONT_SIZE)
-    plt.ylabel(y_axis, fontsize=LABEL_FONT_SIZE)
-    plt.title(title_with_launch, fontsize=TITLE_FONT_SIZE)
-    plt.tick_params(labelsize=TICK_FONT_SIZE)
+    ax.set_xlabel(x_axis, fontsize=LABEL_FONT_SIZE)
+    ax.set_ylabel(y_axis, fontsize=LABEL_FONT_SIZE)
+    ax.set_title(title_with_launch, fontsize=TITLE_FONT_SIZE)
+    ax.tick_params(labelsize=TICK_FONT_SIZE)
 
     # Add legend with improved visibility
-    plt.legend(frameon=True, fontsize=LEGEND_FONT_SIZE)
+    ax.legend(frameon=True, fontsize=LEGEND_FONT_SIZE)
 
     # Save with high quality
     save_path = f"{folder}/{filename}"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_figure(fig, save_path)
     logger.info(f"Saved scatter plot to {save_path}")
 
     # If showing figures, add to interactive viewer instead of displaying
@@ -205,6 +177,7 @@ def create_scatter_plot(df: pd.DataFrame, x: str, y: str, title: str, filename:
             # Fall back to regular display
             maximize_figure_window()
             plt.show()
+            plt.close(fig)
     else:
         plt.close(fig)
 
@@ -255,9 +228,8 @@ def create_engine_performance_correlation(df: pd.DataFrame, vehicle: str, folder
     plt.tick_params(labelsize=TICK_FONT_SIZE)
 
     # Save figure with high quality
-    os.makedirs(folder, exist_ok=True)
     save_path = f"{folder}/{params['filename']}"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_figure(fig, save_path)
     logger.info(f"Saved correlation plot to {save_path}")
 
     # If showing figures, check for interactive viewer
@@ -271,6 +243,7 @@ def create_engine_performance_correlation(df: pd.DataFrame, vehicle: str, folder
             # Fall back to regular display
             maximize_figure_window()
             plt.show()
+            plt.close(fig)
     else:
         plt.close(fig)
 
@@ -297,9 +270,6 @@ def create_fuel_level_plot(df: pd.DataFrame, x: str, y_cols: list, title: str, f
     title_with_launch = f"Launch {launch_number} - {title}"
     logger.info(f"Creating fuel level plot: {title_with_launch}")
     
-    # Create plots directory if it doesn't exist
-    os.makedirs(folder, exist_ok=True)
-
     # Create figure
     fig = plt.figure(figsize=FIGURE_SIZE)
     
@@ -345,7 +315,7 @@ def create_fuel_level_plot(df: pd.DataFrame, x: str, y_cols: list, title: str, f
 
     # Save with high quality
     save_path = f"{folder}/{filename}"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_figure(fig, save_path)
     logger.info(f"Saved fuel level plot to {save_path}")
 
     # If showing figures, add to interactive viewer instead of displaying
@@ -358,9 +328,79 @@ def create_fuel_level_plot(df: pd.DataFrame, x: str, y_cols: list, title: str, f
         else:
             maximize_figure_window()
             plt.show()
+            plt.close(fig)
     else:
         plt.close(fig)
 
+def _render_scatter_plot(job: tuple) -> str:
+    """
+    Render and save one scatter plot inside a worker process.
+
+    Args:
+        job (tuple): (df, params, folder, launch_number) where params is one entry
+            of ANALYZE_RESULTS_PLOT_PARAMS and df holds only its two columns.
+
+    Returns:
+        str: The filename of the saved plot.
+    """
+    # Workers only save files, so never try to create GUI windows
+    plt.switch_backend('Agg')
+    df, params, folder, launch_number = job
+    create_scatter_plot(df, *params, folder, launch_number, False)
+    return params[3]
+
+
+def render_scatter_plots_parallel(df: pd.DataFrame, folder: str, launch_number: str,
+                                  min_rows: int = PARALLEL_PLOT_MIN_ROWS) -> list[str]:
+    """
+    Save every plot in ANALYZE_RESULTS_PLOT_PARAMS using a pool of worker processes.
+
+    Each plot is independent and CPU-bound in matplotlib, so processes are used
+    rather than threads. Only the two columns a plot needs are sent to its worker.
+    Small launches (fewer than min_rows rows) and single-core machines render
+    serially in this process instead, since worker startup would dominate.
+
+    Args:
+        df (pd.DataFrame): DataFrame with the computed flight data.
+        folder (str): Folder to save the plots in.
+        launch_number (str): Launch number to include in the titles.
+        min_rows (int): Smallest DataFrame that is rendered with the process pool.
+
+    Returns:
+        list[str]: Filenames of the plots that failed to render.
+    """
+    failed = []
+    max_workers = min(len(ANALYZE_RESULTS_PLOT_PARAMS), os.cpu_count() or 1)
+
+    if len(df) < min_rows or max_workers < PARALLEL_PLOT_MIN_WORKERS:
+        logger.info(f"Rendering {len(ANALYZE_RESULTS_PLOT_PARAMS)} plots serially")
+        for params in ANALYZE_RESULTS_PLOT_PARAMS:
+            try:
+                create_scatter_plot(df, *params, folder, launch_number, False)
+            except Exception as e:
+                logger.error(f"Error rendering {params[3]}: {str(e)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(traceback.format_exc())
+                failed.append(params[3])
+        return failed
+
+    jobs = [(df[[params[0], params[1]]], params, folder, launch_number)
+            for params in ANALYZE_RESULTS_PLOT_PARAMS]
+    logger.info(f"Rendering {len(jobs)} plots with {max_workers} worker processes")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_render_scatter_plot, job): job[1][3] for job in jobs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error rendering {futures[future]}: {str(e)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(traceback.format_exc())
+                failed.append(futures[future])
+    return failed
+
+
 def plot_flight_data(json_path: str, start_time: int = 0, end_time: int = -1, show_figures: bool = True) -> None:
     """
     Plot flight data from a JSON file with optional time window limits.
@@ -387,21 +427,18 @@ def plot_flight_data(json_path: str, start_time: int = 0, end_time: int = -1, sh
 
     # Filter data by time window
     original_count = len(df)
-    df = df[df['real_time_seconds'] >= start_time]
-    if end_time != -1:
-        df = df[df['real_time_seconds'] <= end_time]
+    df = filter_time_window(df, start_time, end_time)
     logger.info(f"Using {len(df)} of {original_count} data points after time filtering")
 
-    # Set all Superheavy's data to None after 7 minutes and 30 seconds
-    seven_minutes = 7 * 60 + 30  # 7 minutes and 30 seconds in seconds
-    logger.debug(f"Nullifying Superheavy data after {seven_minutes}s (post-separation)")
+    # Set all Superheavy's data to NaN after 7 minutes and 30 seconds
+    logger.debug(f"Nullifying Superheavy data after {SUPERHEAVY_DATA_CUTOFF_SECONDS}s (post-separation)")
     
     # Check which column naming scheme is used and set values accordingly
     speed_col = 'superheavy.speed' if 'superheavy.speed' in df.columns else 'superheavy_speed'
     alt_col = 'superheavy.altitude' if 'superheavy.altitude' in df.columns else 'superheavy_altitude'
-    nullified_count = df[df['real_time_seconds'] > seven_minutes].shape[0]
-    df.loc[df['real_time_seconds'] > seven_minutes, [speed_col, alt_col]] = None
-    logger.debug(f"Nullified {nullified_count} data points for Superheavy after separation")
+    late = df['real_time_seconds'].to_numpy() > SUPERHEAVY_DATA_CUTOFF_SECONDS
+    df.loc[late, [speed_col, alt_col]] = np.nan
+    logger.debug(f"Nullified {np.count_nonzero(late)} data points for Superheavy after separation")
     
     # Make sure to use the correct column names
     sh_speed_col = 'superheavy.speed' if 'superheavy.speed' in df.columns else 'superheavy_speed'
@@ -421,63 +458,18 @@ def plot_flight_data(json_path: str, start_time: int = 0, end_time: int = -1, sh
     folder = os.path.join("results", f"launch_{launch_number}")
     logger.info(f"Creating plots for launch {launch_number} in folder {folder}")
     
+    # Create the output folder once; the plot helpers assume it exists
+    os.makedirs(folder, exist_ok=True)
+    
     # Create fuel level plots
     logger.info(f"Creating {len(FUEL_LEVEL_PLOT_PARAMS)} fuel level plots")
     for params in FUEL_LEVEL_PLOT_PARAMS:
         create_fuel_level_plot(df, *params, folder, launch_number, show_figures)
     
-    # Create engine timeline plots - create separately and add to viewer
-    # Superheavy engine plot
+    # Create engine timeline plots; called from here so the helper finds the viewer
     logger.info(f"Creating engine timeline plots for Launch {launch_number}")
-    
-    # Create Superheavy engine plot
-    fig_sh = plt.figure(figsize=FIGURE_SIZE)
-    vehicle_params = ENGINE_TIMELINE_PARAMS["superheavy"]
-    for group in vehicle_params["groups"]:
-        sns.lineplot(x='real_time_seconds', y=group["column"], data=df,
-                    label=group["label"], marker='o', 
-                    alpha=MARKER_ALPHA, color=group["color"],
-                    linewidth=LINE_WIDTH if "All" in group["label"] else LINE_WIDTH-0.5)
-    plt.title(f"Launch {launch_number} - {vehicle_params['title']}", fontsize=TITLE_FONT_SIZE)
-    plt.xlabel(ENGINE_TIMELINE_PARAMS["xlabel"], fontsize=LABEL_FONT_SIZE)
-    plt.ylabel(vehicle_params["ylabel"], fontsize=LABEL_FONT_SIZE)
-    plt.ylim(*vehicle_params["ylim"])
-    plt.tick_params(labelsize=TICK_FONT_SIZE)
-    plt.legend(fontsize=LEGEND_FONT_SIZE)
-    plt.tight_layout()
-    
-    # Save figure
-    os.makedirs(folder, exist_ok=True)
-    plt.savefig(f"{folder}/superheavy_engine_timeline.png", dpi=300, bbox_inches='tight')
-    
-    # Add to viewer if showing figures
-    if show_figures and viewer:
-        viewer.add_figure(fig_sh, f"Launch {launch_number} - {vehicle_params['title']}")
-    plt.close(fig_sh)
-    
-    # Create Starship engine plot
-    fig_ss = plt.figure(figsize=FIGURE_SIZE)
-    vehicle_params = ENGINE_TIMELINE_PARAMS["starship"]
-    for group in vehicle_params["groups"]:
-        sns.lineplot(x='real_time_seconds', y=group["column"], data=df,
-                    label=group["label"], marker='o', 
-                    alpha=MARKER_ALPHA, color=group["color"],
-                    linewidth=LINE_WIDTH if "All" in group["label"] else LINE_WIDTH-0.5)
-    plt.title(f"Launch {launch_number} - {vehicle_params['title']}", fontsize=TITLE_FONT_SIZE)
-    plt.xlabel(ENGINE_TIMELINE_PARAMS["xlabel"], fontsize=LABEL_FONT_SIZE)
-    plt.ylabel(vehicle_params["ylabel"], fontsize=LABEL_FONT_SIZE)
-    plt.ylim(*vehicle_params["ylim"])
-    plt.tick_params(labelsize=TICK_FONT_SIZE)
-    plt.legend(fontsize=LEGEND_FONT_SIZE)
-    plt.tight_layout()
-    
-    # Save figure
-    plt.savefig(f"{folder}/starship_engine_timeline.png", dpi=300, bbox_inches='tight')
-    
-    # Add to viewer if showing figures
-    if show_figures and viewer:
-        viewer.add_figure(fig_ss, f"Launch {launch_number} - {vehicle_params['title']}")
-    plt.close(fig_ss)
+    for vehicle in ("superheavy", "starship"):
+        create_engine_group_plot(df, vehicle, folder, launch_number, show_figures)
     
     # Create correlation plots between engine activity and performance
     create_engine_performance_correlation(df, "superheavy", folder, launch_number, show_figures)
@@ -485,12 +477,15 @@ def plot_flight_data(json_path: str, start_time: int = 0, end_time: int = -1, sh
     
     # Create standard plots based on parameters from constants
     logger.info(f"Creating {len(ANALYZE_RESULTS_PLOT_PARAMS)} standard plot types")
-    for params in ANALYZE_RESULTS_PLOT_PARAMS:
-        if len(params) == 5:
-            create_scatter_plot(df, *params, folder, launch_number, show_figures)
-        else:
-            # Unpack: x, y, title, filename, label, x_axis, y_axis.
-            create_scatter_plot(df, *params, folder, launch_number, show_figures)
+    if show_figures:
+        # Figures are handed to the interactive viewer, so they must be drawn here
+        for x, y, title, filename, label, x_axis, y_axis in ANALYZE_RESULTS_PLOT_PARAMS:
+            create_scatter_plot(df, x, y, title, filename, label, x_axis, y_axis,
+                                folder, launch_number, show_figures)
+    else:
+        failed = render_scatter_plots_parallel(df, folder, launch_number)
+        if failed:
+            logger.warning(f"{len(failed)} plots could not be rendered: {', '.join(failed)}")
     
     logger.info(f"Completed all plots for launch {launch_number}")
     
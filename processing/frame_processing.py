@@ -1,36 +1,48 @@
 import random
-import os
 import cv2
-from typing import Optional
+import logging
+import traceback
+import numpy as np
+from typing import Optional, Union
 from ocr import extract_data
 from utils.logger import get_logger
+from utils.video_utils import get_cached_capture, grab_frame
 
 # Initialize logger
 logger = get_logger(__name__)
 
-def process_image(image_path: str, display_rois: bool, debug: bool) -> None:
+def process_image(image_path: Union[str, np.ndarray], display_rois: bool, debug: bool) -> None:
     """
     Process a single image and extract data.
 
     Args:
-        image_path (str): The path to the image file.
+        image_path (str or numpy.ndarray): The path to the image file, or an already
+            decoded frame which is used as is.
         display_rois (bool): Whether to display the ROIs.
         debug (bool): Whether to enable debug prints.
     """
-    logger.debug(f"Processing image from {image_path}")
+    if isinstance(image_path, np.ndarray):
+        image = image_path
+        image_path = "<in-memory frame>"
+    else:
+        image = None
+    
+    logger.debug("Processing image from %s", image_path)
     
     try:
-        image = cv2.imread(image_path)
+        if image is None:
+            image = cv2.imread(image_path)
         if image is None:
             logger.error(f"Failed to load image from {image_path}")
             return
             
-        logger.debug(f"Image loaded successfully, shape: {image.shape}")
+        logger.debug("Image loaded successfully, shape: %s", image.shape)
         
         superheavy_data, starship_data, time_data = extract_data(
             image, display_rois=display_rois, debug=debug)
             
-        if debug:
+        # Skip building the summary when DEBUG records would be dropped anyway
+        if debug and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Superheavy - Speed: {superheavy_data.get('speed')}, Altitude: {superheavy_data.get('altitude')}"
             )
@@ -46,19 +58,19 @@ def process_image(image_path: str, display_rois: bool, debug: bool) -> None:
                 
             # Also output engine data if available
             if 'engines' in superheavy_data:
-                sh_active = sum(sum(1 for e in engines if e) for engines in superheavy_data['engines'].values())
+                sh_active = sum(engines.count(True) for engines in superheavy_data['engines'].values())
                 sh_total = sum(len(engines) for engines in superheavy_data['engines'].values())
                 logger.debug(f"Superheavy engines: {sh_active}/{sh_total} active")
                 
             if 'engines' in starship_data:
-                ss_active = sum(sum(1 for e in engines if e) for engines in starship_data['engines'].values())
+                ss_active = sum(engines.count(True) for engines in starship_data['engines'].values())
                 ss_total = sum(len(engines) for engines in starship_data['engines'].values())
                 logger.debug(f"Starship engines: {ss_active}/{ss_total} active")
                 
     except Exception as e:
         logger.error(f"Error processing image {image_path}: {str(e)}")
-        import traceback
-        logger.debug(traceback.format_exc())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
 
 
 def process_video_frame(video_path: str, display_rois: bool, debug: bool, start_frame: Optional[int], end_frame: Optional[int]) -> None:
@@ -76,8 +88,9 @@ def process_video_frame(video_path: str, display_rois: bool, debug: bool, start_
     logger.debug(f"Parameters: display_rois={display_rois}, debug={debug}, start_frame={start_frame}, end_frame={end_frame}")
     
     try:
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
+        # The capture stays open so further frames from this video skip reopening it
+        cap = get_cached_capture(video_path)
+        if cap is None:
             logger.error(f"Failed to open video file: {video_path}")
             return
             
@@ -96,39 +109,21 @@ def process_video_frame(video_path: str, display_rois: bool, debug: bool, start_
 
         if start_frame >= end_frame:
             logger.error(f"Start frame must be less than end frame (start={start_frame}, end={end_frame})")
-            cap.release()
             return
 
         random_frame_number = random.randint(start_frame, end_frame)
         logger.info(f"Selected random frame number: {random_frame_number} (time: ~{random_frame_number/fps:.2f}s)")
         
-        cap.set(cv2.CAP_PROP_POS_FRAMES, random_frame_number)
-        ret, frame = cap.read()
-        cap.release()
-        
-        if not ret:
-            logger.error(f"Failed to extract frame {random_frame_number} from video")
-            return
-
-        tmp_dir = os.path.join('.', '.tmp')
-        os.makedirs(tmp_dir, exist_ok=True)
-        image_path = os.path.join(tmp_dir, "random_frame.jpg")
-        
-        logger.debug(f"Saving extracted frame to {image_path}")
-        
-        cv2.imwrite(image_path, frame)
-        print(f"Extracted frame number: {random_frame_number}")
-        
-        logger.debug("Processing extracted frame")
-        process_image(image_path, display_rois, debug)
+        process_frame(video_path, random_frame_number, display_rois, debug)
         
     except Exception as e:
         logger.error(f"Error processing video frame: {str(e)}")
-        import traceback
-        logger.debug(traceback.format_exc())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
 
 
-def process_frame(video_path: str, frame_number: int, display_rois: bool, debug: bool, output_filename: str) -> None:
+def process_frame(video_path: str, frame_number: int, display_rois: bool, debug: bool,
+                  output_filename: Optional[str] = None) -> None:
     """
     Extract data from a specified frame in a video.
 
@@ -137,38 +132,38 @@ def process_frame(video_path: str, frame_number: int, display_rois: bool, debug:
         frame_number (int): The frame number to extract.
         display_rois (bool): Whether to display the ROIs.
         debug (bool): Whether to enable debug prints.
-        output_filename (str): The filename to save the extracted frame as.
+        output_filename (str, optional): The filename to save the extracted frame as.
+            The frame is not written to disk when omitted.
     """
     logger.info(f"Processing frame {frame_number} from {video_path}")
     logger.debug(f"Parameters: display_rois={display_rois}, debug={debug}, output_filename={output_filename}")
     
     try:
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
+        cap = get_cached_capture(video_path)
+        if cap is None:
             logger.error(f"Failed to open video file: {video_path}")
             return
             
         frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         if frame_number >= frame_count:
             logger.error(f"Frame number {frame_number} exceeds total frames in video ({frame_count})")
-            cap.release()
             return
             
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-        ret, frame = cap.read()
-        cap.release()
+        frame = grab_frame(video_path, frame_number)
         
-        if ret:
-            logger.debug(f"Saving frame to {output_filename}")
-            cv2.imwrite(output_filename, frame)
-            image_path = output_filename
+        if frame is not None:
+            # The saved frame is an artifact for the user; processing uses the
+            # decoded frame rather than reading the lossy JPEG back
+            if output_filename:
+                logger.debug(f"Saving frame to {output_filename}")
+                cv2.imwrite(output_filename, frame)
             print(f"Extracted frame number: {frame_number}")
             
             logger.debug("Processing extracted frame")
-            process_image(image_path, display_rois, debug)
+            process_image(frame, display_rois, debug)
         else:
             logger.error(f"Failed to extract frame {frame_number} from video")
     except Exception as e:
         logger.error(f"Error in process_frame: {str(e)}")
-        import traceback
-        logger.debug(traceback.format_exc())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
@@ -2,18 +2,25 @@
 Functions for batch processing of video frames.
 """
 import os
+import logging
 import cv2
+import queue
+import threading
 import traceback
 import multiprocessing
-from typing import List, Dict, Tuple
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
 from utils.logger import get_logger
+from utils.video_utils import open_capture, MAX_FORWARD_GRAB
 from .frame_processing import process_frame
 from ocr import roi_manager as roi_manager
 
 logger = get_logger(__name__)
 
+# Decoded frames each worker buffers ahead of the frame being processed
+FRAME_PREFETCH_DEPTH = 4
+
 
 def create_batches(frame_count: int, batch_size: int, sample_rate: int = 1) -> List[List[int]]:
     """
@@ -32,7 +39,90 @@ def create_batches(frame_count: int, batch_size: int, sample_rate: int = 1) -> L
     return [frame_numbers[i:i + batch_size] for i in range(0, len(frame_numbers), batch_size)]
 
 
-def process_batch(batch: List[int], video_path: str, display_rois: bool, debug: bool, zero_time_met: bool, progress_counter=None) -> List[Dict]:
+def _read_frames(cap: cv2.VideoCapture, frame_numbers: Iterable[int]) -> Iterator[Tuple[int, bool, Optional[object]]]:
+    """
+    Read the given frames from an open capture.
+
+    With sampling, the next frame is usually a few frames ahead. A seek restarts
+    decoding from the previous keyframe, so gaps of at most MAX_FORWARD_GRAB frames
+    are skipped with cap.grab(), which decodes without converting to BGR.
+
+    Yields:
+        Tuple of (frame_number, ret, frame) as returned by cap.read().
+    """
+    position = None  # Index of the frame the next read() returns, if known
+    for frame_number in frame_numbers:
+        ret = True
+        gap = frame_number - position if position is not None else -1
+        if 0 <= gap <= MAX_FORWARD_GRAB:
+            for _ in range(gap):
+                if not cap.grab():
+                    ret = False
+                    break
+        else:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+
+        frame = None
+        if ret:
+            ret, frame = cap.read()
+        position = frame_number + 1 if ret else None
+        yield frame_number, ret, frame
+
+
+def _prefetch_frames(cap: cv2.VideoCapture, frame_numbers: Iterable[int],
+                     depth: int = FRAME_PREFETCH_DEPTH) -> Iterator[Tuple[int, bool, Optional[object]]]:
+    """
+    Decode frames on a background thread while the caller processes earlier ones.
+
+    OpenCV releases the GIL while decoding, and OCR spends most of its time in
+    native code, so decoding the next frames overlaps with processing the current
+    one. At most ``depth`` decoded frames are held in memory. Closing the generator
+    stops the decoder thread before returning, so the capture can then be released.
+
+    Yields:
+        Tuple of (frame_number, ret, frame) in the order of frame_numbers.
+    """
+    frames = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+    done = object()
+    errors = []
+
+    def put(item) -> bool:
+        # Blocks while the buffer is full, giving up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def decode() -> None:
+        try:
+            for item in _read_frames(cap, frame_numbers):
+                if not put(item):
+                    return
+        except Exception as e:
+            errors.append(e)
+        put(done)
+
+    decoder = threading.Thread(target=decode, name="frame-decoder", daemon=True)
+    decoder.start()
+    try:
+        while True:
+            item = frames.get()
+            if item is done:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        decoder.join()
+
+
+def process_batch(batch: List[int], video_path: str, display_rois: bool, debug: bool, zero_time_met: bool, progress_counter=None,
+                  num_threads: Optional[int] = None, hw_decode: bool = False) -> List[Dict]:
     """
     Process a batch of frames and extract data.
 
@@ -43,6 +133,8 @@ def process_batch(batch: List[int], video_path: str, display_rois: bool, debug:
         debug (bool): Whether to enable debug prints.
         zero_time_met (bool): Whether a frame with time 0:0:0 has been met.
         progress_counter (multiprocessing.Value, optional): Shared counter for progress tracking.
+        num_threads (int, optional): Number of FFmpeg decoder threads for the video capture.
+        hw_decode (bool): Whether to request hardware-accelerated decoding.
 
     Returns:
         list: A list of dictionaries containing the extracted data for each frame.
@@ -56,27 +148,29 @@ def process_batch(batch: List[int], video_path: str, display_rois: bool, debug:
             # Empty CUDA cache at the start of each batch
             torch.cuda.empty_cache()
             
-        cap = cv2.VideoCapture(video_path)
+        cap = open_capture(video_path, num_threads, hw_decode)
         if not cap.isOpened():
             raise ValueError(f"Failed to open video file: {video_path}")
             
         results = []
-        for frame_number in batch:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            ret, frame = cap.read()
-            if ret:
-                frame_result = process_frame(
-                    frame_number, frame, display_rois, debug, zero_time_met)
-                results.append(frame_result)
-                if frame_result["time"] and frame_result["time"].get('hours') == 0 and frame_result["time"].get('minutes') == 0 and frame_result["time"].get('seconds') == 0:
-                    zero_time_met = True
-            
-            # Update progress counter if provided - fixed to work with ValueProxy
-            if progress_counter is not None:
-                # No need to call get_lock() on ValueProxy objects
-                progress_counter.value += 1
-                    
-        cap.release()
+        frames = _prefetch_frames(cap, batch)
+        try:
+            for frame_number, ret, frame in frames:
+                if ret:
+                    frame_result = process_frame(
+                        frame_number, frame, display_rois, debug, zero_time_met)
+                    results.append(frame_result)
+                    if frame_result["time"] and frame_result["time"].get('hours') == 0 and frame_result["time"].get('minutes') == 0 and frame_result["time"].get('seconds') == 0:
+                        zero_time_met = True
+                
+                # Update progress counter if provided - fixed to work with ValueProxy
+                if progress_counter is not None:
+                    # No need to call get_lock() on ValueProxy objects
+                    progress_counter.value += 1
+        finally:
+            # Stop the decoder thread before the capture goes away
+            frames.close()
+            cap.release()
         
         # Release GPU resources at the end of batch processing
         if torch.cuda.is_available():
@@ -90,7 +184,8 @@ def process_batch(batch: List[int], video_path: str, display_rois: bool, debug:
         return [{"frame_number": fn, "error": str(e)} for fn in batch]
 
 
-def process_video_frames(batches: List[List[int]], video_path: str, display_rois: bool, debug: bool) -> Tuple[List[Dict], int]:
+def process_video_frames(batches: List[List[int]], video_path: str, display_rois: bool, debug: bool,
+                         num_threads: Optional[int] = None, hw_decode: bool = False) -> Tuple[List[Dict], int]:
     """
     Process all batches of frames.
 
@@ -99,6 +194,8 @@ def process_video_frames(batches: List[List[int]], video_path: str, display_rois
         video_path (str): The path to the video file.
         display_rois (bool): Whether to display the ROIs.
         debug (bool): Whether to enable debug prints.
+        num_threads (int, optional): Number of FFmpeg decoder threads per worker's video capture.
+        hw_decode (bool): Whether workers request hardware-accelerated decoding.
 
     Returns:
         tuple: (results, zero_time_frame)
@@ -154,7 +251,8 @@ def process_video_frames(batches: List[List[int]], video_path: str, display_rois
         # Submit all batch jobs with the shared counter
         for batch in batches:
             futures.append(executor.submit(process_batch, batch, video_path,
-                                         display_rois, debug, zero_time_met, progress_counter))
+                                         display_rois, debug, zero_time_met, progress_counter,
+                                         num_threads, hw_decode))
         
         # Create a progress bar that tracks frame processing, not batch completion
         with tqdm(total=total_frames, desc="Processing frames") as pbar:
@@ -181,7 +279,8 @@ def process_video_frames(batches: List[List[int]], video_path: str, display_rois
                                 break
                 except Exception as e:
                     logger.error(f"Error processing batch: {str(e)}")
-                    logger.debug(traceback.format_exc())
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(traceback.format_exc())
 
     return results, zero_time_frame
 
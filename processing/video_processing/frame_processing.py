@@ -7,6 +7,7 @@ import random
 import numpy as np
 from typing import Dict, Optional
 from utils.logger import get_logger
+from utils.video_utils import get_cached_capture, grab_frame
 from ocr import extract_data
 from ocr.roi_manager import ROIManager
 
@@ -108,9 +109,9 @@ def process_video_frame(video_path: str, display_rois: bool = False, debug: bool
     logger.debug(f"Processing random frame from {video_path} (start_time={start_time}, end_time={end_time})")
     
     try:
-        # Open the video file
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
+        # Open the video file; the capture is kept open for further random frames
+        cap = get_cached_capture(video_path)
+        if cap is None:
             logger.error(f"Failed to open video file at {video_path}")
             return {"error": "Failed to open video file"}
         
@@ -124,19 +125,16 @@ def process_video_frame(video_path: str, display_rois: bool = False, debug: bool
         
         if start_frame >= end_frame:
             logger.error(f"Invalid time range: start_frame ({start_frame}) >= end_frame ({end_frame})")
-            cap.release()
             return {"error": "Invalid time range"}
         
         # Choose a random frame within the range
         random_frame = random.randint(start_frame, end_frame)
         logger.info(f"Selected random frame {random_frame} (out of {frame_count})")
         
-        # Set the frame position and read the frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, random_frame)
-        ret, frame = cap.read()
-        cap.release()
+        # Seek to the frame and decode it
+        frame = grab_frame(video_path, random_frame)
         
-        if not ret:
+        if frame is None:
             logger.error(f"Failed to read frame {random_frame}")
             return {"error": f"Failed to read frame {random_frame}"}
             
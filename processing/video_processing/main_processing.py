@@ -5,6 +5,8 @@ import cv2
 import multiprocessing
 from typing import List, Dict, Optional
 from utils.logger import get_logger
+from utils.constants import DEFAULT_DECODE_THREADS
+from utils.video_utils import fourcc_to_str, opened_capture
 from .validation import validate_video
 from .batch_processing import create_batches, process_video_frames, summarize_batch
 from .frame_processing import process_single_frame
@@ -15,7 +17,8 @@ logger = get_logger(__name__)
 
 def iterate_through_frames(video_path: str, launch_number: int, display_rois: bool = False, debug: bool = False, 
                           max_frames: Optional[int] = None, batch_size: int = 10, sample_rate: int = 1,
-                          start_frame: Optional[int] = None, end_frame: Optional[int] = None) -> None:
+                          start_frame: Optional[int] = None, end_frame: Optional[int] = None,
+                          num_threads: Optional[int] = DEFAULT_DECODE_THREADS, hw_decode: bool = False) -> None:
     """
     Iterate through all frames in a video and extract data.
 
@@ -29,9 +32,14 @@ def iterate_through_frames(video_path: str, launch_number: int, display_rois: bo
         sample_rate (int): The sampling rate (process every Nth frame). Defaults to 1.
         start_frame (int, optional): Start frame number (overrides start_time if provided). Defaults to None.
         end_frame (int, optional): End frame number (overrides end_time if provided). Defaults to None.
+        num_threads (int, optional): FFmpeg decoder threads per worker's video capture.
+            None leaves the choice to OpenCV. Defaults to DEFAULT_DECODE_THREADS.
+        hw_decode (bool): Decode on the GPU when FFmpeg has a hardware decoder for the
+            video, falling back to software decoding otherwise. Defaults to False.
     """
     logger.info(f"Starting video processing for launch {launch_number}")
-    logger.info(f"Video path: {video_path}, batch size: {batch_size}, sample rate: 1/{sample_rate}")
+    logger.info(f"Video path: {video_path}, batch size: {batch_size}, sample rate: 1/{sample_rate}, "
+                f"decode threads: {num_threads or 'auto'}, hardware decoding: {'on' if hw_decode else 'off'}")
     
     if debug:
         logger.debug("Debug mode is enabled for video processing")
@@ -50,10 +58,17 @@ def iterate_through_frames(video_path: str, launch_number: int, display_rois: bo
         logger.error("Video validation failed, aborting processing")
         return
 
-    # Get video properties
-    cap = cv2.VideoCapture(video_path)
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    total_frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    # Get video properties (and, for debugging, resolution and codec) from a single open
+    video_details = None
+    with opened_capture(video_path) as cap:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        total_frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if debug and cap.isOpened():
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            video_codec = int(cap.get(cv2.CAP_PROP_FOURCC))
+            codec_str = fourcc_to_str(video_codec)
+            video_details = (width, height, codec_str)
     
     # Determine start and end frames (time-based selection was removed; callers should provide frames)
     if start_frame is not None:
@@ -71,23 +86,15 @@ def iterate_through_frames(video_path: str, launch_number: int, display_rois: bo
         end_pos = min(end_pos, start_pos + max_frames)
     
     frame_count = end_pos - start_pos
-    cap.release()
     
     logger.info(f"Processing from frame {start_pos} to {end_pos} ({frame_count} frames) at {fps} fps")
     
     if debug:
         logger.debug(f"Video processing borders: start_frame={start_pos}, end_frame={end_pos}")
-        
-        # Get additional video properties for debugging
-        cap = cv2.VideoCapture(video_path)
-        if cap.isOpened():
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if video_details:
+            width, height, codec_str = video_details
             logger.debug(f"Video resolution: {width}x{height}")
-            video_codec = int(cap.get(cv2.CAP_PROP_FOURCC))
-            codec_str = "".join([chr((video_codec >> 8 * i) & 0xFF) for i in range(4)])
             logger.debug(f"Video codec: {codec_str}")
-            cap.release()
     
     # Create batches with sampling, ensuring we respect the start and end positions
     frame_range = range(start_pos, end_pos, sample_rate)
@@ -100,7 +107,7 @@ def iterate_through_frames(video_path: str, launch_number: int, display_rois: bo
 
     # Process video frames
     logger.debug("Starting parallel video frame processing")
-    results, zero_time_frame = process_video_frames(batches, video_path, display_rois, debug)
+    results, zero_time_frame = process_video_frames(batches, video_path, display_rois, debug, num_threads, hw_decode)
     logger.info(f"Processing complete. Analyzed {len(results)} frames successfully.")
     
     if debug:
@@ -5,6 +5,7 @@ import os
 import cv2
 from typing import Optional, Tuple
 from utils.logger import get_logger
+from utils.video_utils import fourcc_to_str, opened_capture
 
 logger = get_logger(__name__)
 
@@ -59,7 +60,7 @@ def validate_video(video_path: str) -> bool:
     
     # Check video codec
     fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
-    codec_str = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
+    codec_str = fourcc_to_str(fourcc)
     logger.debug(f"Video codec: {codec_str}")
     
     # Get video duration
@@ -82,10 +83,9 @@ def get_video_properties(video_path: str, max_frames: Optional[int] = None) -> T
     Returns:
         tuple: (frame_count, fps)
     """
-    cap = cv2.VideoCapture(video_path)
-    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    cap.release()
+    with opened_capture(video_path) as cap:
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS)
 
     if max_frames is not None:
         frame_count = min(frame_count, max_frames)
@@ -60,7 +60,8 @@ def check_cuda_version(step_num=3, debug=False) -> str | Any | None:
             for base_path in cuda_paths:
                 print_debug(f"Checking CUDA path: {base_path}", debug)
                 if os.path.exists(base_path):
-                    versions = [d for d in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, d)) and d.startswith("v")]
+                    with os.scandir(base_path) as entries:
+                        versions = [e.name for e in entries if e.is_dir() and e.name.startswith("v")]
                     if versions:
                         # Sort versions and take the latest
                         versions.sort(reverse=True)
@@ -182,7 +182,7 @@ def test_clean_dataframe_performance(benchmark, sample_dataframe):
     # Basic validation
     assert isinstance(result, pd.DataFrame)
     assert len(result) == len(sample_dataframe)
-    assert 'starship.speed_diff' in result.columns
+    assert 'starship.speed_diff' not in result.columns
 
 
 @pytest.mark.performance
@@ -229,11 +229,11 @@ def test_normalize_fuel_levels_performance(benchmark, sample_fuel_dataframe):
 
 @pytest.mark.performance
 @patch('builtins.open', new_callable=mock_open)
-@patch('json.load')
-def test_load_and_clean_data_performance(mock_json_load, mock_open, benchmark, mock_json_data):
+@patch('plot.data_processing._json_loads')
+def test_load_and_clean_data_performance(mock_json_loads, mock_open, benchmark, mock_json_data):
     """Test performance of the complete data loading and cleaning pipeline."""
     # Configure mock to return our test data
-    mock_json_load.return_value = mock_json_data
+    mock_json_loads.return_value = mock_json_data
     
     # Benchmark the function
     result = benchmark(load_and_clean_data, "dummy.json")
@@ -273,7 +273,7 @@ def test_compute_g_force_performance(benchmark, sample_dataframe):
 def test_data_processing_pipeline_scaling(benchmark, mock_json_data):
     """Test how the complete data processing pipeline scales with input size."""
     with patch('builtins.open', new_callable=mock_open):
-        with patch('json.load', return_value=mock_json_data):
+        with patch('plot.data_processing._json_loads', return_value=mock_json_data):
             
             # Define a function that runs the complete pipeline
             def run_complete_pipeline():
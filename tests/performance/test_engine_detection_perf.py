@@ -3,7 +3,7 @@ Performance tests for engine detection functions.
 """
 import pytest
 import numpy as np
-from ocr.engine_detection import check_engines, check_engines_numba, detect_engine_status
+from ocr.engine_detection import check_engines, check_engine_points, detect_engine_status
 
 # Define image sizes for performance testing
 IMAGE_SIZES = [
@@ -69,8 +69,8 @@ def engine_coordinates():
 
 
 @pytest.mark.performance
-def test_check_engines_numba_performance(benchmark, test_images, engine_coordinates):
-    """Test performance of the check_engines_numba function."""
+def test_check_engine_points_performance(benchmark, test_images, engine_coordinates):
+    """Test performance of the check_engine_points function."""
     # Extract coordinates for testing
     coords = engine_coordinates['central']
     
@@ -78,7 +78,7 @@ def test_check_engines_numba_performance(benchmark, test_images, engine_coordina
     threshold = 150
     
     # Benchmark the function
-    result = benchmark(check_engines_numba, test_images, coords, threshold)
+    result = benchmark(check_engine_points, test_images, coords, threshold)
     
     # Basic validation
     assert isinstance(result, list)
@@ -99,7 +99,7 @@ def sample_dataframe(request):
 
 
 class NoopFigure:
-    """A do-nothing placeholder for plt.figure to eliminate side effects."""
+    """A do-nothing placeholder figure for plt.figure/plt.subplots to eliminate side effects."""
     def __init__(self, *args, **kwargs):
         pass
     
@@ -118,7 +118,7 @@ def test_create_scatter_plot_performance(benchmark, sample_dataframe):
     
     # Global patch of all plt and seaborn functions
     with patch.multiple(plt, 
-                        figure=MagicMock(return_value=NoopFigure()),
+                        subplots=MagicMock(return_value=(NoopFigure(), MagicMock())),
                         savefig=MagicMock(), 
                         close=MagicMock(),
                         xlabel=MagicMock(),
@@ -127,7 +127,7 @@ def test_create_scatter_plot_performance(benchmark, sample_dataframe):
                         tick_params=MagicMock(),
                         legend=MagicMock(),
                         plot=MagicMock()), \
-         patch('os.makedirs', MagicMock()), \
+         patch('plot.flight_plotting.save_figure', MagicMock()), \
          patch('seaborn.scatterplot', MagicMock()):
         
         def create_plot():
@@ -166,7 +166,7 @@ def test_create_engine_group_plot_performance(benchmark, sample_dataframe):
                         legend=MagicMock(),
                         ylim=MagicMock(),
                         tight_layout=MagicMock()), \
-         patch('os.makedirs', MagicMock()), \
+         patch('plot.flight_plotting.save_figure', MagicMock()), \
          patch('seaborn.lineplot', MagicMock()):
         
         def create_plot():
@@ -210,7 +210,7 @@ def test_create_engine_performance_correlation_performance(benchmark, sample_dat
                         title=MagicMock(),
                         tick_params=MagicMock(),
                         setp=MagicMock()), \
-         patch('os.makedirs', MagicMock()), \
+         patch('plot.flight_plotting.save_figure', MagicMock()), \
          patch('seaborn.scatterplot', MagicMock(return_value=MagicMock(legend=MagicMock(return_value=MagicMock())))):
         
         def run_test():
@@ -238,7 +238,7 @@ def test_create_fuel_level_plot_performance(benchmark, sample_dataframe):
                         ylim=MagicMock(),
                         grid=MagicMock(),
                         tight_layout=MagicMock()), \
-         patch('os.makedirs', MagicMock()), \
+         patch('plot.flight_plotting.save_figure', MagicMock()), \
          patch('seaborn.lineplot', MagicMock()):
         
         def create_plot():
@@ -268,7 +268,7 @@ def test_plot_multiple_launches_performance(benchmark, sample_dataframe):
     
     # Global patch of all plt and seaborn functions
     with patch.multiple(plt, 
-                        figure=MagicMock(return_value=NoopFigure()),
+                        subplots=MagicMock(return_value=(NoopFigure(), MagicMock())),
                         savefig=MagicMock(), 
                         close=MagicMock(),
                         xlabel=MagicMock(),
@@ -277,7 +277,7 @@ def test_plot_multiple_launches_performance(benchmark, sample_dataframe):
                         tick_params=MagicMock(),
                         legend=MagicMock(),
                         plot=MagicMock()), \
-         patch('os.makedirs', MagicMock()), \
+         patch('plot.comparison_plotting.save_figure', MagicMock()), \
          patch('seaborn.scatterplot', MagicMock()):
         
         def create_plot():
@@ -311,6 +311,7 @@ def test_generate_combined_plots_performance(benchmark, sample_dataframe):
          patch('plot.flight_plotting.create_fuel_level_plot', MagicMock()), \
          patch('plot.flight_plotting.create_engine_performance_correlation', MagicMock()), \
          patch('plot.flight_plotting.create_scatter_plot', MagicMock()), \
+         patch('plot.flight_plotting.render_scatter_plots_parallel', MagicMock(return_value=[])), \
          patch.multiple(plt, 
                        figure=MagicMock(return_value=NoopFigure()),
                        savefig=MagicMock(), 
@@ -323,7 +324,8 @@ def test_generate_combined_plots_performance(benchmark, sample_dataframe):
                        ylim=MagicMock(),
                        tight_layout=MagicMock()), \
          patch('seaborn.lineplot', MagicMock()), \
-         patch('os.makedirs', MagicMock()):
+         patch('os.makedirs', MagicMock()), \
+         patch('plot.flight_plotting.save_figure', MagicMock()):
         
         def plot_all():
             plot_flight_data("dummy_json.json", show_figures=False)
@@ -343,7 +345,7 @@ def test_plot_resolution_impact(benchmark, sample_dataframe, dpi):
     
     # Global patch of all plt and seaborn functions
     with patch.multiple(plt, 
-                        figure=MagicMock(return_value=NoopFigure()),
+                        subplots=MagicMock(return_value=(NoopFigure(), MagicMock())),
                         savefig=mock_savefig, 
                         close=MagicMock(),
                         xlabel=MagicMock(),
@@ -352,7 +354,7 @@ def test_plot_resolution_impact(benchmark, sample_dataframe, dpi):
                         tick_params=MagicMock(),
                         legend=MagicMock(),
                         plot=MagicMock()), \
-         patch('os.makedirs', MagicMock()), \
+         patch('plot.flight_plotting.save_figure', MagicMock()), \
          patch('seaborn.scatterplot', MagicMock()):
         
         # Define the function to be benchmarked
@@ -387,6 +389,7 @@ def test_real_world_plot_generation(benchmark, sample_dataframe):
     # Global patch of all plt and seaborn functions
     with patch.multiple(plt, 
                         figure=MagicMock(return_value=NoopFigure()),
+                        subplots=MagicMock(return_value=(NoopFigure(), MagicMock())),
                         savefig=MagicMock(), 
                         close=MagicMock(),
                         xlabel=MagicMock(),
@@ -398,7 +401,7 @@ def test_real_world_plot_generation(benchmark, sample_dataframe):
                         grid=MagicMock(),
                         tight_layout=MagicMock(),
                         plot=MagicMock()), \
-         patch('os.makedirs', MagicMock()), \
+         patch('plot.flight_plotting.save_figure', MagicMock()), \
          patch('seaborn.scatterplot', MagicMock()), \
          patch('seaborn.lineplot', MagicMock()):
         
@@ -6,7 +6,12 @@ from unittest.mock import patch, MagicMock
 import os
 import subprocess
 
-from download.downloader import download_twitter_broadcast, download_youtube_video
+from download.downloader import (
+    build_ytdlp_command,
+    download_twitter_broadcast,
+    download_youtube_video,
+    download_flights_concurrently
+)
 
 class TestDownloader:
     """Tests for the downloader functions."""
@@ -32,9 +37,9 @@ class TestDownloader:
         assert args[0][1] == "-f"
         assert args[0][2] == "bestvideo[height<=1080][ext=mp4]/bestvideo[height<=1080]/best[height<=1080]"
         assert args[0][3] == "--no-audio"
-        assert args[0][4] == "-o"
-        assert args[0][5] == "flight_recordings/flight_5.%(ext)s"
-        assert args[0][6] == "https://twitter.com/video"
+        assert args[0][-3] == "-o"
+        assert args[0][-2] == "flight_recordings/flight_5.%(ext)s"
+        assert args[0][-1] == "https://twitter.com/video"
         assert kwargs.get('check') is True
     
     @patch('os.makedirs')
@@ -55,7 +60,7 @@ class TestDownloader:
         
         # Verify the subprocess.run command uses the custom path with video-only parameters
         args, kwargs = mock_run.call_args
-        assert args[0][5] == f"{custom_path}/flight_10.%(ext)s"
+        assert args[0][-2] == f"{custom_path}/flight_10.%(ext)s"
     
     @patch('os.makedirs')
     @patch('subprocess.run')
@@ -112,9 +117,9 @@ class TestDownloader:
         assert args[0][1] == "-f"
         assert args[0][2] == "bestvideo[height<=1080][ext=mp4]/bestvideo[height<=1080]/best[height<=1080]"
         assert args[0][3] == "--no-audio"
-        assert args[0][4] == "-o"
-        assert args[0][5] == "flight_recordings/flight_5.%(ext)s"
-        assert args[0][6] == "https://youtube.com/watch"
+        assert args[0][-3] == "-o"
+        assert args[0][-2] == "flight_recordings/flight_5.%(ext)s"
+        assert args[0][-1] == "https://youtube.com/watch"
         assert kwargs.get('check') is True
     
     @patch('os.makedirs')
@@ -135,7 +140,7 @@ class TestDownloader:
         
         # Verify the subprocess.run command uses the custom path with video-only parameters
         args, kwargs = mock_run.call_args
-        assert args[0][5] == f"{custom_path}/flight_10.%(ext)s"
+        assert args[0][-2] == f"{custom_path}/flight_10.%(ext)s"
     
     @patch('os.makedirs')
     @patch('subprocess.run')
@@ -170,3 +175,106 @@ class TestDownloader:
             assert result is False
             mock_makedirs.assert_called_once()
             mock_print.assert_called_with("An unexpected error occurred: Unexpected error")
+
+
+class TestBuildYtdlpCommand:
+    """Tests for the yt-dlp command line builder."""
+    
+    @patch('shutil.which', return_value=None)
+    def test_concurrent_fragment_flags(self, mock_which):
+        """Test that fragment concurrency and chunking flags are passed."""
+        command = build_ytdlp_command("https://x.com/video", "out/flight_1.%(ext)s")
+        
+        assert command[command.index("--concurrent-fragments") + 1] == "8"
+        assert command[command.index("--http-chunk-size") + 1] == "10M"
+        assert "--downloader" not in command
+        assert command[-3:] == ["-o", "out/flight_1.%(ext)s", "https://x.com/video"]
+    
+    @patch('shutil.which', return_value="/usr/bin/aria2c")
+    def test_uses_aria2c_when_available(self, mock_which):
+        """Test that aria2c is selected as external downloader when installed."""
+        command = build_ytdlp_command("https://x.com/video", "out/flight_1.%(ext)s")
+        
+        mock_which.assert_called_once_with("aria2c")
+        assert command[command.index("--downloader") + 1] == "aria2c"
+        assert command[command.index("--downloader-args") + 1] == "aria2c:-x 4 -s 4"
+        assert "--http-chunk-size" not in command
+        assert command[-1] == "https://x.com/video"
+    
+    @patch('shutil.which', return_value="/usr/bin/aria2c")
+    def test_aria2c_connections_configurable(self, mock_which):
+        """Test that the aria2c connection count can be overridden."""
+        command = build_ytdlp_command("https://x.com/video", "out/flight_1.%(ext)s", aria2c_connections=2)
+        
+        assert command[command.index("--downloader-args") + 1] == "aria2c:-x 2 -s 2"
+
+
+class TestConcurrentDownloads:
+    """Tests for concurrent downloading of several flights."""
+    
+    @staticmethod
+    def _make_process(returncode, stderr=b""):
+        """Create a fake asyncio subprocess with the given exit code."""
+        process = MagicMock(returncode=returncode)
+        
+        async def communicate():
+            return b"", stderr
+        
+        process.communicate = communicate
+        return process
+    
+    @patch('os.makedirs')
+    def test_download_flights_concurrently_results(self, mock_makedirs):
+        """Test that each flight reports its own download result."""
+        processes = {
+            "url1": self._make_process(0),
+            "url2": self._make_process(1, b"ERROR: unavailable")
+        }
+        commands = []
+        
+        async def fake_exec(*args, **kwargs):
+            commands.append(args)
+            return processes[args[-1]]
+        
+        with patch('asyncio.create_subprocess_exec', side_effect=fake_exec):
+            result = download_flights_concurrently([(1, "url1"), (2, "url2")], output_path="out")
+        
+        # Verify results
+        assert result == {1: True, 2: False}
+        mock_makedirs.assert_called_once_with("out", exist_ok=True)
+        assert len(commands) == 2
+        assert all(command[0] == "yt-dlp" for command in commands)
+        assert ("out/flight_1.%(ext)s" in commands[0]) or ("out/flight_1.%(ext)s" in commands[1])
+    
+    @patch('os.makedirs')
+    def test_download_flights_concurrently_respects_limit(self, mock_makedirs):
+        """Test that no more than max_concurrent downloads run at the same time."""
+        import asyncio
+        running = 0
+        peak = 0
+        
+        async def fake_exec(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            process = MagicMock(returncode=0)
+            
+            async def communicate():
+                nonlocal running
+                await asyncio.sleep(0.01)
+                running -= 1
+                return b"", b""
+            
+            process.communicate = communicate
+            return process
+        
+        flights = [(n, f"url{n}") for n in range(6)]
+        with patch('asyncio.create_subprocess_exec', side_effect=fake_exec):
+            result = download_flights_concurrently(flights, max_concurrent=2)
+        
+        assert all(result.values())
+        assert peak == 2
+    
+    def test_download_flights_concurrently_empty(self):
+        """Test that an empty flight list does nothing."""
+        assert download_flights_concurrently([]) == {}
@@ -19,7 +19,8 @@ from download.menu import (
     select_platform,
     get_url_and_flight_number,
     download_from_platform,
-    execute_download
+    execute_download,
+    download_all_missing_flights
 )
 
 class TestMainDownloadMenu:
@@ -44,6 +45,7 @@ class TestMainDownloadMenu:
         mock_clear.assert_called_once()
         mock_prompt.assert_called_once_with("Select download option:", [
             'Download from launch list',
+            'Download all missing flights',
             'Download from custom URL',
             'Back to main menu'
         ])
@@ -188,6 +190,54 @@ class TestMainDownloadMenu:
         mock_prompt.assert_called_once_with(True, 1)
 
 
+    @patch('download.menu.clear_screen')
+    @patch('download.menu.get_flight_data')
+    @patch('download.menu.get_available_flights')
+    @patch('download.menu.download_flights_concurrently')
+    @patch('builtins.input')
+    def test_download_all_missing_flights(self, mock_input, mock_download_all, mock_get_flights,
+                                          mock_get_data, mock_clear):
+        """Test downloading every missing flight in one batch."""
+        # Setup mocks
+        mock_get_data.return_value = {
+            "flight_1": {"url": "url1", "type": "youtube"},
+            "flight_2": {"url": "url2", "type": "twitter/x"}
+        }
+        mock_get_flights.return_value = [("Flight 1 (YouTube)", 1), ("Flight 2 (Twitter/X)", 2)]
+        mock_download_all.return_value = {1: True, 2: False}
+        
+        # Call function
+        with patch('builtins.print') as mock_print:
+            result = download_all_missing_flights()
+        
+        # Verify results
+        assert result is True
+        mock_download_all.assert_called_once_with([(1, "url1"), (2, "url2")])
+        mock_print.assert_any_call("Downloaded 1 of 2 flights.")
+        mock_print.assert_any_call("Failed flights: 2")
+    
+    @patch('download.menu.clear_screen')
+    @patch('download.menu.get_flight_data')
+    @patch('download.menu.get_available_flights')
+    @patch('download.menu.handle_error')
+    @patch('download.menu.download_flights_concurrently')
+    def test_download_all_missing_flights_none_available(self, mock_download_all, mock_error,
+                                                         mock_get_flights, mock_get_data, mock_clear):
+        """Test downloading all flights when everything is already downloaded."""
+        # Setup mocks
+        mock_get_data.return_value = {"flight_1": {"url": "url1", "type": "youtube"}}
+        mock_get_flights.return_value = []
+        mock_error.return_value = True
+        
+        # Call function
+        result = download_all_missing_flights()
+        
+        # Verify results
+        assert result is True
+        mock_error.assert_called_once_with("All flights have already been downloaded or no flights are available.")
+        mock_download_all.assert_not_called()
+
+
 class TestMenuUtilities:
     """Tests for menu utility functions."""
     
@@ -259,7 +309,7 @@ class TestFlightData:
     def test_get_available_flights(self, mock_get_downloaded):
         """Test getting available flights."""
         # Setup mock
-        mock_get_downloaded.return_value = [2, 3]
+        mock_get_downloaded.return_value = {2, 3}
         flight_data = {
             "flight_1": {"url": "url1", "type": "youtube"},
             "flight_2": {"url": "url2", "type": "twitter/x"},
@@ -283,7 +333,7 @@ class TestFlightData:
     def test_get_available_flights_with_invalid_entries(self, mock_get_downloaded, mock_logger):
         """Test handling of invalid entries in flight data."""
         # Setup mock
-        mock_get_downloaded.return_value = []
+        mock_get_downloaded.return_value = set()
         flight_data = {
             "flight_1": {"url": "url1", "type": "youtube"},
             "malformed": {"url": "url2"}, # Missing type
@@ -299,6 +349,20 @@ class TestFlightData:
         assert ("Flight 1 (YouTube)", 1) in result
         mock_get_downloaded.assert_called_once()
         assert mock_logger.warning.call_count == 3  # Should log warnings for the 3 invalid entries
+    
+    @patch('download.menu.get_downloaded_launches')
+    def test_get_available_flights_reflects_changes(self, mock_get_downloaded):
+        """Test that each call reflects the current flight data and downloads."""
+        mock_get_downloaded.return_value = set()
+        flight_data = {"flight_2": {"url": "url2", "type": "twitter"}}
+        
+        assert get_available_flights(flight_data) == [("Flight 2 (Twitter/X)", 2)]
+        
+        # Entries added to the same dict and finished downloads both show up
+        flight_data["flight_1"] = {"url": "url1", "type": "youtube"}
+        assert get_available_flights(flight_data) == [("Flight 1 (YouTube)", 1), ("Flight 2 (Twitter/X)", 2)]
+        mock_get_downloaded.return_value = {1}
+        assert get_available_flights(flight_data) == [("Flight 2 (Twitter/X)", 2)]
 
 
 class TestFlightSelection:
@@ -4,19 +4,39 @@ Tests for download utility functions in download/utils.py.
 import pytest
 from unittest.mock import patch, MagicMock
 import json
+import time
 import requests
 
-from download.utils import get_launch_data, get_downloaded_launches, FLIGHTS_URL
+from download.utils import get_launch_data, get_downloaded_launches, invalidate_launch_cache, FLIGHTS_URL
+
+
+@pytest.fixture(autouse=True)
+def flights_cache_path(tmp_path):
+    """Keep the on-disk flight data cache inside a temporary directory."""
+    cache_path = tmp_path / "flights.json"
+    with patch('download.utils.FLIGHTS_CACHE_PATH', str(cache_path)), \
+         patch.dict('download.utils._launch_data_memo', {"data": None, "ts": 0.0}):
+        yield cache_path
+
+
+def write_cache(cache_path, data, etag="\"abc\"", age=0):
+    """Write a flight data cache entry that is `age` seconds old."""
+    cache_path.write_text(json.dumps({
+        "_cache_version": 1,
+        "_cached_at": time.time() - age,
+        "etag": etag,
+        "data": data
+    }))
 
 class TestGetLaunchData:
     """Test suite for get_launch_data function."""
     
-    @patch('download.utils.requests.get')
+    @patch('download.utils._SESSION.get')
     def test_get_launch_data_success(self, mock_get):
         """Test successful retrieval of launch data."""
         # Setup mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = [{"flight": 1, "name": "Test"}, {"flight": 2, "name": "Test2"}]
+        mock_response.content = json.dumps([{"flight": 1, "name": "Test"}, {"flight": 2, "name": "Test2"}]).encode()
         mock_get.return_value = mock_response
         
         # Call the function
@@ -29,7 +49,7 @@ class TestGetLaunchData:
         assert result[1]["name"] == "Test2"
         mock_get.assert_called_once_with(FLIGHTS_URL, timeout=10)
     
-    @patch('download.utils.requests.get')
+    @patch('download.utils._SESSION.get')
     def test_get_launch_data_request_error(self, mock_get):
         """Test handling of request exceptions."""
         # Setup mock to raise exception
@@ -43,7 +63,7 @@ class TestGetLaunchData:
             assert result is None
             mock_print.assert_called_with("Error fetching flight data: Connection error")
     
-    @patch('download.utils.requests.get')
+    @patch('download.utils._SESSION.get')
     def test_get_launch_data_http_error(self, mock_get):
         """Test handling of HTTP errors."""
         # Setup mock to raise exception
@@ -59,12 +79,12 @@ class TestGetLaunchData:
             assert result is None
             mock_print.assert_called_with("Error fetching flight data: 404 Client Error")
     
-    @patch('download.utils.requests.get')
+    @patch('download.utils._SESSION.get')
     def test_get_launch_data_json_error(self, mock_get):
         """Test handling of JSON decoding errors."""
         # Setup mock response with invalid JSON
         mock_response = MagicMock()
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"{not valid json"
         mock_get.return_value = mock_response
         
         # Call the function with mocked print
@@ -73,97 +93,162 @@ class TestGetLaunchData:
             
             # Assert results
             assert result is None
-            mock_print.assert_called_with("Error parsing flight data: Invalid JSON: line 1 column 1 (char 0)")
+            mock_print.assert_called_once()
+            assert mock_print.call_args[0][0].startswith("Error parsing flight data: ")
+
+
+
+class TestLaunchDataCache:
+    """Test suite for the on-disk flight data cache used by get_launch_data."""
+    
+    @patch('download.utils._SESSION.get')
+    def test_fresh_cache_skips_network(self, mock_get, flights_cache_path):
+        """A recently written cache is returned without a request."""
+        write_cache(flights_cache_path, {"flight_1": {"url": "u", "type": "youtube"}})
+        
+        result = get_launch_data()
+        
+        assert result == {"flight_1": {"url": "u", "type": "youtube"}}
+        mock_get.assert_not_called()
+    
+    @patch('download.utils._SESSION.get')
+    def test_stale_cache_revalidated_with_etag(self, mock_get, flights_cache_path):
+        """A stale cache is revalidated and reused when the server answers 304."""
+        write_cache(flights_cache_path, {"flight_1": {}}, etag="\"abc\"", age=2 * 60 * 60)
+        mock_get.return_value = MagicMock(status_code=304)
+        
+        result = get_launch_data()
+        
+        assert result == {"flight_1": {}}
+        mock_get.assert_called_once_with(FLIGHTS_URL, headers={"If-None-Match": "\"abc\""}, timeout=10)
+        assert time.time() - json.loads(flights_cache_path.read_text())["_cached_at"] < 60
+    
+    @patch('download.utils._SESSION.get')
+    def test_successful_fetch_writes_cache(self, mock_get, flights_cache_path):
+        """Fresh data and its ETag are stored on disk."""
+        mock_response = MagicMock(status_code=200, headers={"ETag": "\"xyz\""})
+        mock_response.content = b'{"flight_2": {}}'
+        mock_get.return_value = mock_response
+        
+        result = get_launch_data()
+        
+        assert result == {"flight_2": {}}
+        cache = json.loads(flights_cache_path.read_text())
+        assert cache["data"] == {"flight_2": {}}
+        assert cache["etag"] == "\"xyz\""
+    
+    @patch('download.utils._SESSION.get')
+    def test_network_error_falls_back_to_cache(self, mock_get, flights_cache_path):
+        """Stale cached data is served when the server cannot be reached."""
+        write_cache(flights_cache_path, {"flight_1": {}}, age=2 * 60 * 60)
+        mock_get.side_effect = requests.ConnectionError("offline")
+        
+        result = get_launch_data()
+        
+        assert result == {"flight_1": {}}
+
+    
+    @patch('download.utils._SESSION.get')
+    def test_repeated_calls_are_memoized(self, mock_get):
+        """Repeated calls within one session reuse the first result."""
+        mock_response = MagicMock(status_code=200, headers={})
+        mock_response.content = b'{"flight_1": {}}'
+        mock_get.return_value = mock_response
+        
+        assert get_launch_data() == {"flight_1": {}}
+        assert get_launch_data() == {"flight_1": {}}
+        mock_get.assert_called_once()
+    
+    @patch('download.utils._SESSION.get')
+    def test_invalidate_launch_cache_forces_revalidation(self, mock_get, flights_cache_path):
+        """After invalidation the cached data is revalidated with the server."""
+        write_cache(flights_cache_path, {"flight_1": {}}, etag="\"abc\"")
+        mock_get.return_value = MagicMock(status_code=304)
+        
+        assert get_launch_data() == {"flight_1": {}}
+        mock_get.assert_not_called()
+        
+        invalidate_launch_cache()
+        assert get_launch_data() == {"flight_1": {}}
+        mock_get.assert_called_once_with(FLIGHTS_URL, headers={"If-None-Match": "\"abc\""}, timeout=10)
+    
+    def test_session_retries_transient_errors(self):
+        """The shared session retries gateway errors on HTTPS requests."""
+        from download.utils import _SESSION
+        
+        retries = _SESSION.get_adapter(FLIGHTS_URL).max_retries
+        assert retries.total == 3
+        assert 503 in retries.status_forcelist
 
 
 class TestGetDownloadedLaunches:
     """Test suite for get_downloaded_launches function."""
     
-    @patch('os.path.exists')
-    def test_get_downloaded_launches_path_not_exists(self, mock_exists):
+    @staticmethod
+    def _make_files(directory, names):
+        """Create empty files with the given names."""
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            (directory / name).touch()
+    
+    def test_get_downloaded_launches_path_not_exists(self, tmp_path):
         """Test when output path does not exist."""
-        # Setup mock
-        mock_exists.return_value = False
-        
-        # Call the function
-        result = get_downloaded_launches()
+        result = get_downloaded_launches(output_path=str(tmp_path / "missing"))
         
         # Assert results
-        assert result == []
-        mock_exists.assert_called_once_with("flight_recordings")
+        assert result == set()
     
-    @patch('os.path.exists')
-    @patch('os.listdir')
-    def test_get_downloaded_launches_empty_dir(self, mock_listdir, mock_exists):
+    def test_get_downloaded_launches_empty_dir(self, tmp_path):
         """Test when output directory is empty."""
-        # Setup mocks
-        mock_exists.return_value = True
-        mock_listdir.return_value = []
-        
-        # Call the function
-        result = get_downloaded_launches()
+        result = get_downloaded_launches(output_path=str(tmp_path))
         
         # Assert results
-        assert result == []
-        mock_exists.assert_called_once_with("flight_recordings")
-        mock_listdir.assert_called_once_with("flight_recordings")
+        assert result == set()
     
-    @patch('os.path.exists')
-    @patch('os.listdir')
-    def test_get_downloaded_launches_with_files(self, mock_listdir, mock_exists):
+    def test_get_downloaded_launches_with_files(self, tmp_path):
         """Test when output directory contains flight files."""
-        # Setup mocks
-        mock_exists.return_value = True
-        mock_listdir.return_value = [
+        self._make_files(tmp_path, [
             "flight_1.mp4", 
             "flight_2.mp4", 
             "flight_5.mp4",
             "other_file.mp4",
             "not_a_flight.txt"
-        ]
+        ])
         
-        # Call the function
-        result = get_downloaded_launches()
+        result = get_downloaded_launches(output_path=str(tmp_path))
         
         # Assert results
-        assert sorted(result) == [1, 2, 5]
-        mock_exists.assert_called_once_with("flight_recordings")
-        mock_listdir.assert_called_once_with("flight_recordings")
+        assert result == {1, 2, 5}
     
-    @patch('os.path.exists')
-    @patch('os.listdir')
-    def test_get_downloaded_launches_invalid_filenames(self, mock_listdir, mock_exists):
+    def test_get_downloaded_launches_invalid_filenames(self, tmp_path):
         """Test handling of invalid filenames."""
-        # Setup mocks
-        mock_exists.return_value = True
-        mock_listdir.return_value = [
+        self._make_files(tmp_path, [
             "flight_.mp4",  # Missing number
             "flight_abc.mp4",  # Non-numeric
             "flight_1",  # Missing extension
             "flight_2.mp4.part"  # Multiple extensions
-        ]
+        ])
         
-        # Call the function
-        result = get_downloaded_launches()
+        result = get_downloaded_launches(output_path=str(tmp_path))
         
         # Assert results - should only get valid ones
-        assert result == [1, 2]
-        mock_exists.assert_called_once_with("flight_recordings")
-        mock_listdir.assert_called_once_with("flight_recordings")
+        assert result == {1, 2}
     
-    @patch('os.path.exists')
-    @patch('os.listdir')
-    def test_get_downloaded_launches_custom_path(self, mock_listdir, mock_exists):
+    def test_get_downloaded_launches_name_variants(self, tmp_path):
+        """Test that the number ends at the first "_" or "." and any entry type counts."""
+        self._make_files(tmp_path, ["flight_5_part.mp4", "flight_7_1080p", "flight_8x.mp4"])
+        (tmp_path / "flight_3").mkdir()
+        
+        result = get_downloaded_launches(output_path=str(tmp_path))
+        
+        assert result == {3, 5, 7}
+    
+    def test_get_downloaded_launches_custom_path(self, tmp_path):
         """Test using a custom output path."""
-        # Setup mocks
-        mock_exists.return_value = True
-        mock_listdir.return_value = ["flight_1.mp4", "flight_2.mp4"]
-        custom_path = "custom/path"
+        custom_path = tmp_path / "custom" / "path"
+        self._make_files(custom_path, ["flight_1.mp4", "flight_2.mp4"])
         
-        # Call the function
-        result = get_downloaded_launches(output_path=custom_path)
+        result = get_downloaded_launches(output_path=str(custom_path))
         
         # Assert results
-        assert sorted(result) == [1, 2]
-        mock_exists.assert_called_once_with(custom_path)
-        mock_listdir.assert_called_once_with(custom_path)
+        assert result == {1, 2}
@@ -5,7 +5,9 @@ from unittest.mock import patch, MagicMock, ANY
 from numpy.testing import assert_array_equal
 
 from ocr.engine_detection import (
+    check_engine_points,
     check_engines_numba,
+    engines_on_numba,
     check_engines,
     detect_engine_status
 )
@@ -41,11 +43,11 @@ def test_engine_coords():
         "outer": np.array([(2, 6), (8, 8)])   # Black pixel and out of bounds (OFF)
     }
 
-class TestCheckEnginesNumba:
-    """Tests for check_engines_numba function."""
+class TestCheckEnginePoints:
+    """Tests for check_engine_points function."""
     
     def test_basic_functionality(self):
-        """Test the numba-optimized engine check function."""
+        """Test the per-point engine check function."""
         # Create a simple test image
         image = np.zeros((5, 5, 3), dtype=np.uint8)
         image[1, 2] = [255, 255, 255]  # White pixel at x=2, y=1
@@ -56,12 +58,12 @@ class TestCheckEnginesNumba:
         
         # Test with high threshold (only very bright pixels are ON)
         high_threshold = 200
-        result_high = check_engines_numba(image, coordinates, high_threshold)
+        result_high = check_engine_points(image, coordinates, high_threshold)
         assert result_high == [True, False, False]
         
         # Test with low threshold (both bright and dark pixels are ON)
         low_threshold = 50
-        result_low = check_engines_numba(image, coordinates, low_threshold)
+        result_low = check_engine_points(image, coordinates, low_threshold)
         assert result_low == [True, True, False]
     
     def test_out_of_bounds(self):
@@ -73,8 +75,27 @@ class TestCheckEnginesNumba:
         coordinates = np.array([(-1, -1), (5, 5), (3, 3)])
         
         # Check result
-        result = check_engines_numba(image, coordinates, 100)
+        result = check_engine_points(image, coordinates, 100)
         assert result == [False, False, False]
+    
+    def test_former_name_is_alias(self):
+        """Test the former check_engines_numba name still works."""
+        assert check_engines_numba is check_engine_points
+
+
+class TestEnginesOnNumba:
+    """Tests for engines_on_numba function."""
+    
+    def test_basic_functionality(self):
+        """Test the fused gather-and-threshold kernel."""
+        image = np.zeros((5, 5, 3), dtype=np.uint8)
+        image[1, 2] = [255, 255, 255]  # White pixel at x=2, y=1
+        image[3, 3] = [255, 255, 100]  # One dim channel at x=3, y=3
+        xs = np.array([2, 3, 10, -1], dtype=np.intp)
+        ys = np.array([1, 3, 1, 1], dtype=np.intp)
+        
+        assert engines_on_numba(image, xs, ys, 200).tolist() == [True, False, False, False]
+        assert engines_on_numba(image, xs, ys, 50).tolist() == [True, True, False, False]
 
 
 class TestCheckEngines:
@@ -101,6 +122,46 @@ class TestCheckEngines:
             # Verify debug logs were called when debug=True
             assert mock_logger.debug.called
     
+    def test_matches_per_point_check(self, test_image, test_engine_coords):
+        """Test the vectorized check agrees with the per-point numba check."""
+        from ocr.engine_detection import WHITE_THRESHOLD
+        
+        result = check_engines(test_image, test_engine_coords, False, "Test")
+        
+        for section, coords in test_engine_coords.items():
+            assert result[section] == check_engine_points(test_image, coords, WHITE_THRESHOLD)
+    
+    def test_reuses_layout_for_same_coordinates(self, test_image, test_engine_coords):
+        """Test the flattened coordinates are rebuilt only for a new coordinates object."""
+        from ocr import engine_detection
+        
+        check_engines(test_image, test_engine_coords, False, "Reuse")
+        layout = engine_detection._engine_layouts["Reuse"][1]
+        check_engines(test_image, test_engine_coords, False, "Reuse")
+        assert engine_detection._engine_layouts["Reuse"][1] is layout
+        
+        result = check_engines(test_image, {"inner": [(3, 2)]}, False, "Reuse")
+        assert engine_detection._engine_layouts["Reuse"][1] is not layout
+        assert result == {"inner": [True]}
+    
+    def test_grayscale_image(self, test_image, test_engine_coords):
+        """Test single-channel images use the pixel value directly."""
+        gray = test_image[:, :, 0].copy()
+        
+        result = check_engines(gray, test_engine_coords, False, "Gray")
+        
+        assert result == check_engines(test_image, test_engine_coords, False, "Color")
+    
+    def test_debug_skipped_when_level_disabled(self, test_image, test_engine_coords):
+        """Test debug summaries are not built when DEBUG records would be dropped."""
+        with patch('ocr.engine_detection.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            
+            result = check_engines(test_image, test_engine_coords, True, "Test")
+            
+            assert set(result) == set(test_engine_coords)
+            mock_logger.debug.assert_not_called()
+    
     @patch('ocr.engine_detection.WHITE_THRESHOLD', 200)  # Patch the threshold value
     def test_debug_logging(self, test_image, test_engine_coords):
         """Test debug logging functionality."""
@@ -162,6 +223,23 @@ class TestDetectEngineStatus:
             np.array([(2, 2)])
         )
     
+    def test_reads_engine_points_from_roi_manager(self, test_image):
+        """Test engine points come from the active ROIs, listed once per frame."""
+        from types import SimpleNamespace
+        mgr = MagicMock()
+        mgr.get_active_rois.return_value = [
+            SimpleNamespace(match_to_role="time", points=None),
+            SimpleNamespace(match_to_role="sh_engines", points={"inner": [(3, 2)]},
+                            point_arrays={"inner": np.array([(3, 2)])}),
+            SimpleNamespace(match_to_role="ss_engines", points={"rvac": [(8, 8)]},
+                            point_arrays=None),
+        ]
+        
+        result = detect_engine_status(test_image, roi_manager=mgr, frame_idx=5)
+        
+        mgr.get_active_rois.assert_called_once_with(5)
+        assert result == {"superheavy": {"inner": [True]}, "starship": {"rvac": [False]}}
+    
     def test_integration(self, test_image):
         """Test the full integration of detect_engine_status with real dependencies."""
         with patch('ocr.engine_detection.SUPERHEAVY_ENGINES', {'inner': np.array([(3, 2)])}), \
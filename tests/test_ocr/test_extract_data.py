@@ -1,3 +1,4 @@
+import os
 import pytest
 import numpy as np
 from unittest.mock import patch, MagicMock
@@ -71,6 +72,24 @@ def mock_extract_fuel_levels():
         yield mock
 
 
+def _make_roi_manager():
+    """Create a manager mock whose active ROIs cover time, speed and altitude."""
+    from types import SimpleNamespace
+    mgr = MagicMock()
+    roles = ["time", "sh_speed", "sh_altitude", "ss_speed", "ss_altitude"]
+    mgr.get_active_rois.return_value = [
+        SimpleNamespace(id=role, x=0, y=0, w=10, h=10, match_to_role=role) for role in roles
+    ]
+    mgr.get_roi_for_role.side_effect = lambda role, frame_idx=None: SimpleNamespace(id=role)
+    return mgr
+
+
+def _extract_speed_in_child(image, results):
+    """Run extract_data in a forked child and report the Superheavy speed."""
+    superheavy_data, _, _ = extract_data(image, roi_manager=_make_roi_manager(), frame_idx=0)
+    results.put(superheavy_data["speed"])
+
+
 class TestPreprocessImage:
     """Tests for preprocess_image function."""
     
@@ -120,6 +139,26 @@ class TestPreprocessImage:
                 assert roi.shape == (1, 1, 3), f"Expected empty ROI with shape (1, 1, 3), got {roi.shape}"
 
 
+    def test_rois_from_manager_are_clipped(self):
+        """Test ROIs from the manager are cropped and clipped to the frame."""
+        from types import SimpleNamespace
+        image = np.arange(20 * 30, dtype=np.uint8).reshape(20, 30)
+        mgr = MagicMock()
+        mgr.get_active_rois.return_value = [
+            SimpleNamespace(id="speed", x=2, y=3, w=4, h=5, match_to_role=None),
+            SimpleNamespace(id="edge", x=25, y=-2, w=10, h=4, match_to_role=None),
+            SimpleNamespace(id="outside", x=40, y=0, w=5, h=5, match_to_role=None),
+        ]
+        
+        for _ in range(2):
+            rois = preprocess_image(image, roi_manager=mgr)
+            
+            np.testing.assert_array_equal(rois["speed"], image[3:8, 2:6])
+            np.testing.assert_array_equal(rois["edge"], image[0:2, 25:30])
+            assert rois["outside"] is None
+            assert rois["speed"].flags["C_CONTIGUOUS"]
+
+
 class TestExtractSuperheavyData:
     """Tests for extract_superheavy_data function."""
     
@@ -456,3 +495,71 @@ class TestExtractData:
                         # Verify empty engine dicts were set
                         assert superheavy_data["engines"] == {}
                         assert starship_data["engines"] == {}
+
+    def test_fuel_and_engines_run_while_ocr_is_pending(self, test_image, mock_extract_values,
+                                                      mock_detect_engine_status, mock_extract_fuel_levels):
+        """Test fuel and engine checks run on the caller thread while vehicle OCR is in flight."""
+        import threading
+        from types import SimpleNamespace
+        mgr = MagicMock()
+        roles = ["time", "sh_speed", "sh_altitude", "ss_speed", "ss_altitude", "sh_fuel", "sh_engines"]
+        mgr.get_active_rois.return_value = [
+            SimpleNamespace(id=role, x=0, y=0, w=10, h=10, match_to_role=role) for role in roles
+        ]
+        mgr.get_roi_for_role.side_effect = lambda role, frame_idx=None: SimpleNamespace(id=role)
+
+        engines_checked = threading.Event()
+        mock_detect_engine_status.side_effect = lambda *args, **kwargs: (
+            engines_checked.set(), {"superheavy": {"inner": [True]}, "starship": {}})[1]
+
+        def vehicle_data(*args):
+            # Blocks (and times out) if the engine check waits for OCR to finish
+            assert engines_checked.wait(timeout=5)
+            return {"speed": 100, "altitude": 5000}
+
+        with patch('ocr.extract_data.extract_superheavy_data', side_effect=vehicle_data), \
+             patch('ocr.extract_data.extract_starship_data', side_effect=vehicle_data):
+            superheavy_data, starship_data, time_data = extract_data(test_image, roi_manager=mgr, frame_idx=0)
+
+        assert superheavy_data["speed"] == 100
+        assert superheavy_data["engines"] == {"inner": [True]}
+        assert starship_data["engines"] == {}
+        assert superheavy_data["fuel"]["lox"]["fullness"] == 85.5
+        assert starship_data["fuel"]["ch4"]["fullness"] == 80.3
+        assert time_data["minutes"] == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires the fork start method")
+    def test_ocr_pool_works_in_forked_child(self, test_image, mock_extract_values,
+                                            mock_detect_engine_status, mock_extract_fuel_levels):
+        """Test a child forked after the parent used the OCR pool still completes extraction."""
+        import multiprocessing
+        import threading
+        
+        parent_pid = os.getpid()
+        both_running = threading.Barrier(2, timeout=5)
+        
+        def vehicle_data(*args):
+            # In the parent, hold both OCR calls until they overlap so the pool
+            # really starts two threads, as slow OCR does
+            if os.getpid() == parent_pid:
+                both_running.wait()
+            return {"speed": 100, "altitude": 5000}
+        
+        with patch('ocr.extract_data.extract_superheavy_data', side_effect=vehicle_data), \
+             patch('ocr.extract_data.extract_starship_data', side_effect=vehicle_data):
+            # Use the pool in the parent, as the menu does before a whole-video run
+            superheavy_data, _, _ = extract_data(test_image, roi_manager=_make_roi_manager(), frame_idx=0)
+            assert superheavy_data["speed"] == 100
+            
+            ctx = multiprocessing.get_context("fork")
+            results = ctx.Queue()
+            child = ctx.Process(target=_extract_speed_in_child, args=(test_image, results))
+            child.start()
+            child.join(timeout=20)
+            if child.is_alive():
+                child.kill()
+                child.join()
+                pytest.fail("extract_data hung in the forked child")
+        
+        assert child.exitcode == 0
+        assert results.get(timeout=5) == 100
@@ -174,6 +174,20 @@ class TestExtractFuelLevels:
             assert result["starship"]["lox"]["fullness"] == 60
             assert result["starship"]["ch4"]["fullness"] == 45
     
+    def test_color_image_matches_full_frame(self, synthetic_image):
+        """Test converting only the strip band gives the same levels as the full frame."""
+        color_image = cv2.cvtColor(synthetic_image, cv2.COLOR_GRAY2BGR)
+        
+        result = extract_fuel_levels(color_image)
+        
+        expected = [process_strip(synthetic_image, i)["fullness"] for i in range(4)]
+        assert [
+            result["superheavy"]["lox"]["fullness"],
+            result["superheavy"]["ch4"]["fullness"],
+            result["starship"]["lox"]["fullness"],
+            result["starship"]["ch4"]["fullness"],
+        ] == expected
+    
     def test_error_handling(self):
         """Test error handling in extract_fuel_levels."""
         # Create an invalid image (None)
@@ -264,6 +264,24 @@ class TestExtractValuesFromROI:
             # Verify empty result
             assert result == {}
     
+    @patch('ocr.ocr.torch.cuda.is_available')
+    @patch('ocr.ocr.get_reader')
+    def test_debug_skipped_when_level_disabled(self, mock_get_reader, mock_cuda_available, test_rois):
+        """Test that debug=True does no debug work when DEBUG logging is off."""
+        speed_roi, _, _, _ = test_rois
+
+        mock_reader = MagicMock()
+        mock_reader.readtext.return_value = ["100"]
+        mock_get_reader.return_value = mock_reader
+
+        with patch('ocr.ocr.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            result = extract_values_from_roi(speed_roi, mode="speed", debug=True)
+
+            assert result == {"value": 100}
+            mock_logger.debug.assert_not_called()
+            mock_cuda_available.assert_not_called()
+    
     @patch('ocr.ocr.get_reader')
     def test_cuda_out_of_memory(self, mock_get_reader, test_rois):
         """Test handling of CUDA out of memory error."""        
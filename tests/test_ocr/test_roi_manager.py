@@ -0,0 +1,38 @@
+import json
+
+from ocr.roi_manager import ROIManager
+
+
+def _write_config(path, rois):
+    path.write_text(json.dumps({"version": 1, "time_unit": "frames", "rois": rois}), encoding="utf-8")
+
+
+class TestROIManager:
+    def test_active_rois_follow_frame_window(self, tmp_path):
+        """Only ROIs whose frame window contains the frame are active."""
+        config = tmp_path / "rois.json"
+        _write_config(config, [
+            {"id": "early", "match_to_role": "time", "start_time": None, "end_time": 10},
+            {"id": "late", "match_to_role": "time", "start_time": 10, "end_time": None},
+        ])
+        mgr = ROIManager(str(config))
+
+        assert [r.id for r in mgr.get_active_rois(5)] == ["early"]
+        assert [r.id for r in mgr.get_active_rois(10)] == ["late"]
+        assert mgr.get_roi_for_role("time", 5).id == "early"
+        assert mgr.get_roi_for_role("time", 10).id == "late"
+        assert mgr.get_roi_for_role("sh_speed", 10) is None
+
+    def test_active_rois_memoized_per_frame(self, tmp_path):
+        """Repeated lookups for one frame reuse the active list until reload."""
+        config = tmp_path / "rois.json"
+        _write_config(config, [{"id": "a", "match_to_role": "time"}])
+        mgr = ROIManager(str(config))
+
+        first = mgr.get_active_rois(3)
+        first.clear()  # callers get a copy and cannot corrupt the memo
+        assert [r.id for r in mgr.get_active_rois(3)] == ["a"]
+
+        _write_config(config, [{"id": "b", "match_to_role": "time"}])
+        mgr.reload()
+        assert [r.id for r in mgr.get_active_rois(3)] == ["b"]
@@ -0,0 +1,103 @@
+"""
+Tests for data processing helpers in plot/data_processing.py.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from plot.data_processing import centered_rolling_mean, clean_dataframe, normalize_fuel_levels
+
+
+@pytest.fixture
+def fuel_df():
+    """Create a small DataFrame with diverging and agreeing fuel readings."""
+    return pd.DataFrame({
+        "real_time_seconds": [10.0, 150.0, 250.0, 300.0],
+        "superheavy.fuel.lox.fullness": [90.0, 40.0, 80.0, np.nan],
+        "superheavy.fuel.ch4.fullness": [85.0, 95.0, 20.0, 50.0],
+        "starship.fuel.lox.fullness": [100.0, 100.0, 70.0, 60.0],
+        "starship.fuel.ch4.fullness": [100.0, 100.0, 10.0, 55.0],
+    })
+
+
+class TestNormalizeFuelLevels:
+    """Tests for normalize_fuel_levels function."""
+
+    def test_uses_max_before_200s_and_min_after(self, fuel_df):
+        """Diverging readings are replaced by max early in flight and min later."""
+        result = normalize_fuel_levels(fuel_df)
+
+        # Row 1 (t=150s): 40 vs 95 diverge, max is used
+        assert result.loc[1, "superheavy.fuel.lox.fullness"] == 95.0
+        assert result.loc[1, "superheavy.fuel.ch4.fullness"] == 95.0
+
+        # Row 2 (t=250s): 80 vs 20 and 70 vs 10 diverge, min is used
+        assert result.loc[2, "superheavy.fuel.lox.fullness"] == 20.0
+        assert result.loc[2, "superheavy.fuel.ch4.fullness"] == 20.0
+        assert result.loc[2, "starship.fuel.lox.fullness"] == 10.0
+        assert result.loc[2, "starship.fuel.ch4.fullness"] == 10.0
+
+    def test_leaves_close_and_missing_readings_untouched(self, fuel_df):
+        """Readings within 30% of each other or with NaN are not modified."""
+        result = normalize_fuel_levels(fuel_df)
+
+        assert result.loc[0, "superheavy.fuel.lox.fullness"] == 90.0
+        assert result.loc[0, "superheavy.fuel.ch4.fullness"] == 85.0
+        assert np.isnan(result.loc[3, "superheavy.fuel.lox.fullness"])
+        assert result.loc[3, "superheavy.fuel.ch4.fullness"] == 50.0
+
+    def test_missing_columns_returns_input(self):
+        """DataFrames without fuel columns are returned unchanged."""
+        df = pd.DataFrame({"real_time_seconds": [1.0, 2.0]})
+        result = normalize_fuel_levels(df)
+        assert list(result.columns) == ["real_time_seconds"]
+
+
+class TestCleanDataframe:
+    """Tests for clean_dataframe function."""
+
+    def test_clips_and_stores_float32(self):
+        """Metric columns are clipped to their limits and stored as float32."""
+        df = pd.DataFrame({
+            "starship.speed": [100.0, 30000.0, -5.0],
+            "superheavy.speed": [100.0, 110.0, 120.0],
+            "starship.altitude": [1.0, 1.5, 2.0],
+            "superheavy.altitude": ["1.0", "bad", "1.2"],
+        })
+        result = clean_dataframe(df)
+
+        for column in ["starship.speed", "superheavy.speed", "starship.altitude", "superheavy.altitude"]:
+            assert result[column].dtype == np.float32
+
+        # 30000 is clipped to 28000 and then masked as an abrupt change from 100
+        assert np.isnan(result.loc[1, "starship.speed"])
+        assert np.isnan(result.loc[1, "superheavy.altitude"])
+        assert result.loc[2, "superheavy.altitude"] == pytest.approx(1.2)
+
+    def test_does_not_add_diff_columns(self):
+        """Cleaning keeps intermediates local instead of adding *_diff columns."""
+        df = pd.DataFrame({
+            "starship.speed": [100.0, 120.0],
+            "superheavy.speed": [100.0, 110.0],
+            "starship.altitude": [1.0, 1.5],
+            "superheavy.altitude": [1.0, 1.1],
+        })
+        result = clean_dataframe(df)
+
+        assert not any(column.endswith("_diff") for column in result.columns)
+        assert len(result.columns) == 4
+
+
+class TestCenteredRollingMean:
+    """Tests for centered_rolling_mean function."""
+
+    @pytest.mark.parametrize("window,min_periods", [(30, 5), (5, 1), (4, 4)])
+    def test_matches_pandas_rolling(self, window, min_periods):
+        """Results match pandas centered rolling means, including NaN handling."""
+        values = np.random.default_rng(0).normal(size=200)
+        values[[3, 50, 51, 52]] = np.nan
+
+        expected = pd.Series(values).rolling(window=window, center=True, min_periods=min_periods).mean()
+        result = centered_rolling_mean(values, window, min_periods)
+
+        np.testing.assert_allclose(result, expected.to_numpy(), equal_nan=True)
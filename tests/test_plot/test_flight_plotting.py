@@ -0,0 +1,70 @@
+"""
+Tests for the scatter plot rendering in plot/flight_plotting.py.
+"""
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plot.flight_plotting import render_scatter_plots_parallel
+
+# Two plots keep the worker pool test short; the second one also draws a trendline
+PLOT_PARAMS = [
+    ('real_time_seconds', 'starship.speed', 'Starship Velocity',
+     'starship_velocity.png', 'Ship', 'Mission Time (seconds)', 'Velocity (km/h)'),
+    ('real_time_seconds', 'starship_acceleration', 'Starship Acceleration',
+     'starship_acceleration.png', 'Ship', 'Mission Time (seconds)', 'Acceleration (m/s²)'),
+]
+
+# Saving into a folder that does not exist makes the worker raise
+FAILING_PARAMS = ('real_time_seconds', 'starship.speed', 'Broken',
+                  os.path.join('missing', 'broken.png'), 'Ship', 'Time', 'Speed')
+
+
+@pytest.fixture
+def flight_df():
+    """Create a small DataFrame with the columns used by PLOT_PARAMS."""
+    time_values = np.linspace(0, 100, 50)
+    return pd.DataFrame({
+        "real_time_seconds": time_values,
+        "starship.speed": time_values * 20,
+        "starship_acceleration": np.full(50, 9.8),
+    })
+
+
+class TestRenderScatterPlotsParallel:
+    """Tests for render_scatter_plots_parallel function."""
+
+    @patch('plot.flight_plotting.os.cpu_count', return_value=2)
+    def test_worker_pool_writes_plots(self, mock_cpu_count, flight_df, tmp_path):
+        """Every plot is saved by the worker processes."""
+        with patch('plot.flight_plotting.ANALYZE_RESULTS_PLOT_PARAMS', PLOT_PARAMS):
+            failed = render_scatter_plots_parallel(flight_df, str(tmp_path), "5", min_rows=0)
+
+        assert failed == []
+        assert sorted(os.listdir(tmp_path)) == ["starship_acceleration.png", "starship_velocity.png"]
+
+    @patch('plot.flight_plotting.os.cpu_count', return_value=2)
+    def test_worker_failure_is_reported(self, mock_cpu_count, flight_df, tmp_path):
+        """A plot failing in a worker is logged and returned; the others are still saved."""
+        with patch('plot.flight_plotting.ANALYZE_RESULTS_PLOT_PARAMS', [PLOT_PARAMS[0], FAILING_PARAMS]), \
+             patch('plot.flight_plotting.logger') as mock_logger:
+            failed = render_scatter_plots_parallel(flight_df, str(tmp_path), "5", min_rows=0)
+
+        assert failed == [FAILING_PARAMS[3]]
+        mock_logger.error.assert_called_once()
+        assert os.listdir(tmp_path) == ["starship_velocity.png"]
+
+    def test_small_dataframe_renders_serially(self, flight_df, tmp_path):
+        """DataFrames below the row threshold skip the process pool."""
+        with patch('plot.flight_plotting.ANALYZE_RESULTS_PLOT_PARAMS', PLOT_PARAMS), \
+             patch('plot.flight_plotting.ProcessPoolExecutor') as mock_pool, \
+             patch('plot.flight_plotting.create_scatter_plot') as mock_create:
+            failed = render_scatter_plots_parallel(flight_df, str(tmp_path), "5")
+
+        assert failed == []
+        mock_pool.assert_not_called()
+        assert mock_create.call_count == len(PLOT_PARAMS)
+        mock_create.assert_any_call(flight_df, *PLOT_PARAMS[0], str(tmp_path), "5", False)
@@ -181,9 +181,20 @@ class TestProcessingParameters:
         
         # Verify that the questions list was passed to prompt
         args, _ = mock_prompt.call_args
-        assert len(args[0]) == 4  # Should have 4 questions
+        assert len(args[0]) == 10  # 6 parameters plus the start/end time and frame borders
         assert args[0][0].name == 'launch_number'
-        assert args[0][3].name == 'border_type'
+        assert args[0][3].name == 'num_threads'
+        assert args[0][4].name == 'border_type'
+        assert args[0][-1].name == 'hw_decode'
+        
+        # Border questions are only asked for the matching border type
+        questions = {question.name: question for question in args[0]}
+        for question in questions.values():
+            question.answers = {'border_type': 'Time-based (seconds)'}
+        assert not questions['start_time'].ignore
+        assert questions['start_frame'].ignore
+        questions['end_time'].answers = {'border_type': 'Process entire video'}
+        assert questions['end_time'].ignore
 
 
 class TestBorderSelection:
@@ -308,9 +319,10 @@ class TestCompleteVideoProcessing:
             'launch_number': '5',
             'batch_size': '10',
             'sample_rate': '2',
-            'border_type': 'Time-based (seconds)'
+            'border_type': 'Time-based (seconds)',
+            'start_time': '5',
+            'end_time': '30'
         }
-        mock_get_time.return_value = (5.0, 30.0)
         
         # Mock DEBUG_MODE import
         with patch.dict('sys.modules', {'main': MagicMock()}):
@@ -322,7 +334,7 @@ class TestCompleteVideoProcessing:
             mock_select.assert_called_once()
             mock_display.assert_called_once_with('video1.mp4')
             mock_get_params.assert_called_once()
-            mock_get_time.assert_called_once()
+            mock_get_time.assert_not_called()  # Borders come from the parameters form
             mock_get_frame.assert_not_called()
             mock_process.assert_called_once_with(
                 'video1.mp4', '5', 10, 2, 5.0, 30.0, None, None
@@ -348,9 +360,10 @@ class TestCompleteVideoProcessing:
             'launch_number': '5',
             'batch_size': '10',
             'sample_rate': '2',
-            'border_type': 'Frame-based'
+            'border_type': 'Frame-based',
+            'start_frame': '100',
+            'end_frame': '500'
         }
-        mock_get_frame.return_value = (100, 500)
         
         # Mock DEBUG_MODE import
         with patch.dict('sys.modules', {'main': MagicMock()}):
@@ -363,4 +376,4 @@ class TestCompleteVideoProcessing:
             mock_display.assert_called_once_with('video1.mp4')
             mock_get_params.assert_called_once()
             mock_get_time.assert_not_called()
-            mock_get_frame.assert_called_once()
\ No newline at end of file
+            mock_get_frame.assert_not_called()  # Borders come from the parameters form
\ No newline at end of file
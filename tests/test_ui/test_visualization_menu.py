@@ -86,18 +86,16 @@ class TestMainVisualizationMenu:
 class TestFlightDataVisualization:
     """Tests for flight data visualization functionality."""
     
-    @patch('ui.visualization_menu.os.listdir')
-    @patch('ui.visualization_menu.os.path.isdir')
+    @patch('ui.visualization_menu.get_launch_folders')
     @patch('ui.visualization_menu.inquirer.prompt')
     @patch('ui.visualization_menu.plot_flight_data')
     @patch('ui.visualization_menu.input')  # To mock the "Press Enter to continue"
     @patch('ui.visualization_menu.clear_screen')
     def test_visualize_flight_data(self, mock_clear, mock_input, mock_plot, 
-                                  mock_prompt, mock_isdir, mock_listdir):
+                                  mock_prompt, mock_get_folders):
         """Test visualize flight data functionality."""
         # Setup mocks
-        mock_listdir.return_value = ['launch1', 'launch2', 'compare_launches']
-        mock_isdir.return_value = True
+        mock_get_folders.return_value = ['launch1', 'launch2']
         mock_prompt.return_value = {
             'launch_folder': 'launch1',
             'start_time': '10',
@@ -118,16 +116,14 @@ class TestFlightDataVisualization:
         mock_input.assert_called_once()
         mock_clear.assert_called()
     
-    @patch('ui.visualization_menu.os.listdir')
-    @patch('ui.visualization_menu.os.path.isdir')
+    @patch('ui.visualization_menu.get_launch_folders')
     @patch('ui.visualization_menu.input')  # To mock the "Press Enter to continue"
     @patch('ui.visualization_menu.clear_screen')
     def test_visualize_flight_data_no_folders(self, mock_clear, mock_input, 
-                                            mock_isdir, mock_listdir):
+                                            mock_get_folders):
         """Test visualize flight data when no folders exist."""
         # Setup mocks
-        mock_listdir.return_value = []
-        mock_isdir.return_value = False
+        mock_get_folders.return_value = []
         
         # Call function
         result = visualize_flight_data()
@@ -141,13 +137,14 @@ class TestFlightDataVisualization:
 class TestLaunchFolders:
     """Tests for launch folder management."""
     
-    @patch('ui.visualization_menu.os.listdir')
-    @patch('ui.visualization_menu.os.path.isdir')
-    def test_get_launch_folders(self, mock_isdir, mock_listdir):
+    def test_get_launch_folders(self, tmp_path, monkeypatch):
         """Test getting launch folders."""
-        # Setup mocks
-        mock_listdir.return_value = ['launch1', 'launch2', 'compare_launches']
-        mock_isdir.return_value = True
+        # Setup a results directory with launches, the comparison output and a file
+        results_dir = tmp_path / 'results'
+        for folder in ('launch1', 'launch2', 'compare_launches'):
+            (results_dir / folder).mkdir(parents=True)
+        (results_dir / 'notes.txt').write_text('not a launch')
+        monkeypatch.chdir(tmp_path)
         
         # Call function
         result = get_launch_folders()
@@ -158,6 +155,29 @@ class TestLaunchFolders:
         assert 'launch2' in result
         assert 'compare_launches' not in result
     
+    def test_get_launch_folders_without_results_dir(self, tmp_path, monkeypatch):
+        """Test a missing results directory yields no launch folders."""
+        monkeypatch.chdir(tmp_path)
+        
+        assert get_launch_folders() == []
+    
+    def test_get_launch_folders_reuses_listing(self, tmp_path, monkeypatch):
+        """Test that the listing is reused until the results directory changes."""
+        results_dir = tmp_path / 'results'
+        (results_dir / 'launch1').mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+        
+        assert get_launch_folders() == ['launch1']
+        with patch('ui.visualization_menu.os.scandir') as mock_scandir:
+            assert get_launch_folders() == ['launch1']
+            mock_scandir.assert_not_called()
+        
+        # A new launch folder changes the directory's mtime
+        (results_dir / 'launch2').mkdir()
+        stat = os.stat(results_dir)
+        os.utime(results_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert sorted(get_launch_folders()) == ['launch1', 'launch2']
+    
     def test_validate_available_launches_sufficient(self):
         """Test validation when sufficient launch folders exist."""
         launch_folders = ['launch1', 'launch2']
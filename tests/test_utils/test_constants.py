@@ -2,9 +2,11 @@
 Tests for constants defined in utils/constants.py.
 """
 import pytest
+import numpy as np
 from utils.constants import (
     # Engine Detection Constants
     SUPERHEAVY_ENGINES, STARSHIP_ENGINES, 
+    SUPERHEAVY_ENGINE_COORDS, STARSHIP_ENGINE_COORDS,
     # OCR Constants
     WHITE_THRESHOLD,
     # Data Processing Constants
@@ -47,6 +49,17 @@ class TestConstants:
         assert len(STARSHIP_ENGINES["rearth"]) == 3
         assert len(STARSHIP_ENGINES["rvac"]) == 3
     
+    def test_engine_coordinate_arrays(self):
+        """Test that frozen coordinate arrays mirror the coordinate dicts."""
+        for coords_dict, arrays in ((SUPERHEAVY_ENGINES, SUPERHEAVY_ENGINE_COORDS),
+                                    (STARSHIP_ENGINES, STARSHIP_ENGINE_COORDS)):
+            assert set(arrays.keys()) == set(coords_dict.keys())
+            for section, array in arrays.items():
+                assert array.dtype == np.int32
+                assert array.shape == (len(coords_dict[section]), 2)
+                assert array.flags["C_CONTIGUOUS"]
+                assert array.tolist() == [list(coord) for coord in coords_dict[section]]
+    
     def test_ocr_constants(self):
         """Test OCR threshold constants."""
         assert isinstance(WHITE_THRESHOLD, int)
@@ -15,6 +15,8 @@ from utils.logger import (
     start_new_session,
     log_system_info,
     ColoredFormatter,
+    CachedTimeFormatter,
+    BufferedRotatingFileHandler,
     LOG_LEVELS,
     DEFAULT_LOG_LEVEL,
     LOG_FORMAT,
@@ -69,6 +71,38 @@ class TestLoggerCore:
         mock_get_logger.assert_called_once_with("test_module")
         assert logger == mock_logger
 
+    def test_get_logger_shares_handlers(self):
+        """Test that loggers share one set of handlers and do not propagate."""
+        first = get_logger("test_shared_handlers.first")
+        second = get_logger("test_shared_handlers.second")
+
+        assert first.handlers
+        assert first.handlers == second.handlers
+        assert all(a is b for a, b in zip(first.handlers, second.handlers))
+        assert first.propagate is False
+
+    def test_get_logger_enqueues_records(self):
+        """Test that application loggers hand records to the queue listener."""
+        from logging.handlers import QueueHandler
+
+        test_logger = get_logger("test_queue_handler")
+
+        assert len(test_logger.handlers) == 1
+        assert isinstance(test_logger.handlers[0], QueueHandler)
+
+    def test_records_are_emitted_once(self):
+        """Test that a record reaches the output once, not once per logger level."""
+        session_logger = get_logger("starship_analyzer")
+        module_logger = get_logger("starship_analyzer.test_module")
+        queue_handler = module_logger.handlers[0]
+
+        with patch.object(queue_handler, 'enqueue') as mock_enqueue:
+            module_logger.warning("only once")
+            session_logger.warning("and once here")
+
+        assert mock_enqueue.call_count == 2
+        assert module_logger.propagate is False
+
     @patch('logging.getLogger')
     def test_set_global_log_level(self, mock_get_logger):
         """Test setting global log level."""
@@ -83,6 +117,20 @@ class TestLoggerCore:
         mock_get_logger.assert_called_once_with()
         mock_root_logger.setLevel.assert_called_once_with(logging.WARNING)
 
+    def test_set_global_log_level_by_name(self):
+        """Test level names in either case and skipping loggers already at the level."""
+        test_logger = get_logger("test_level_by_name")
+
+        set_global_log_level("debug")
+        assert test_logger.level == logging.DEBUG
+
+        with patch.object(test_logger, 'setLevel') as mock_set_level:
+            set_global_log_level("DEBUG")
+            mock_set_level.assert_not_called()
+
+        set_global_log_level("INFO")
+        assert test_logger.level == logging.INFO
+
 
 class TestLoggerSession:
     """Test suite for logger session management."""
@@ -112,6 +160,41 @@ class TestLoggerSession:
         mock_get_logger.assert_called_with("starship_analyzer")
         assert mock_logger.info.call_count >= 1
 
+    def test_update_file_handlers_opens_file_once(self, tmp_path):
+        """Test that all loggers share one file handler after switching log files."""
+        import utils.logger.core as core
+        for name in ("test_switch_a", "test_switch_b", "test_switch_c"):
+            get_logger(name)
+        original = [h.baseFilename for h in core._output_handlers
+                    if isinstance(h, logging.FileHandler)]
+
+        new_log_file = str(tmp_path / "session.log")
+        try:
+            with patch('utils.logger.core._create_file_handler',
+                       wraps=core._create_file_handler) as mock_create:
+                _update_file_handlers(new_log_file)
+
+            mock_create.assert_called_once_with(new_log_file)
+            file_handlers = [h for h in core._output_handlers
+                             if isinstance(h, logging.FileHandler)]
+            assert len(file_handlers) == 1
+            assert file_handlers[0].baseFilename == new_log_file
+        finally:
+            if original:
+                _update_file_handlers(original[0])
+
+    def test_log_dir_created_once(self, tmp_path):
+        """Test that the log directory is only created on first use."""
+        from utils.logger.core import _ensure_log_dir
+        log_dir = str(tmp_path / "logs")
+
+        with patch('os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            _ensure_log_dir(log_dir)
+            _ensure_log_dir(log_dir)
+
+        mock_makedirs.assert_called_once_with(log_dir, exist_ok=True)
+        assert os.path.isdir(log_dir)
+
 
 class TestSystemInfo:
     """Test suite for system information collection and logging."""
@@ -223,6 +306,53 @@ class TestSystemInfo:
             utils.logger.system_info.write_system_info_section = original_write_system_info_section
 
 
+class TestBufferedRotatingFileHandler:
+    """Test suite for the buffered log file handler."""
+
+    @staticmethod
+    def _record(level, msg):
+        return logging.LogRecord("buffered", level, "test_path", 1, msg, (), None)
+
+    def test_buffers_until_warning(self, tmp_path):
+        """Info records stay buffered; a warning flushes everything."""
+        log_file = tmp_path / "test.log"
+        handler = BufferedRotatingFileHandler(str(log_file), flush_interval=0)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.handle(self._record(logging.INFO, "first"))
+            assert log_file.read_text() == ""
+
+            handler.handle(self._record(logging.WARNING, "second"))
+            assert log_file.read_text() == "first\nsecond\n"
+        finally:
+            handler.close()
+
+    def test_close_flushes(self, tmp_path):
+        """Closing the handler writes out buffered records."""
+        log_file = tmp_path / "test.log"
+        handler = BufferedRotatingFileHandler(str(log_file), flush_interval=0)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.handle(self._record(logging.DEBUG, "buffered"))
+        handler.close()
+
+        assert log_file.read_text() == "buffered\n"
+
+    def test_rollover_on_size(self, tmp_path):
+        """The file rotates once the tracked size would exceed maxBytes."""
+        log_file = tmp_path / "test.log"
+        handler = BufferedRotatingFileHandler(str(log_file), maxBytes=20, backupCount=1, flush_interval=0)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.handle(self._record(logging.INFO, "a" * 12))
+            handler.handle(self._record(logging.INFO, "b" * 12))
+            handler.flush()
+        finally:
+            handler.close()
+
+        assert (tmp_path / "test.log.1").read_text() == "a" * 12 + "\n"
+        assert log_file.read_text() == "b" * 12 + "\n"
+
+
 class TestColoredFormatter:
     """Test suite for colored log formatter."""
 
@@ -248,3 +378,20 @@ class TestColoredFormatter:
         # Verify format is as expected
         assert "INFO" in formatted
         assert "Test message" in formatted
+
+    def test_cached_time_formatter(self):
+        """Test CachedTimeFormatter reuses the timestamp within the same second."""
+        formatter = CachedTimeFormatter(fmt="%(asctime)s %(message)s", datefmt=DATE_FORMAT)
+        record = logging.LogRecord("test_logger", logging.INFO, "test_path", 42, "Test message", (), None)
+        later = logging.LogRecord("test_logger", logging.INFO, "test_path", 42, "Test message", (), None)
+        record.created = 1700000000.1
+        later.created = 1700000000.9
+
+        first = formatter.formatTime(record, DATE_FORMAT)
+        with patch('time.strftime') as mock_strftime:
+            assert formatter.formatTime(later, DATE_FORMAT) == first
+            mock_strftime.assert_not_called()
+
+        # A new second is formatted afresh
+        later.created = 1700000001.0
+        assert formatter.formatTime(later, DATE_FORMAT) == logging.Formatter(datefmt=DATE_FORMAT).formatTime(later, DATE_FORMAT)
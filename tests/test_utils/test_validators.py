@@ -15,6 +15,8 @@ class TestValidators:
         validate_number(None, "-123")  # Should not raise exception
         validate_number(None, "0")  # Should not raise exception
         validate_number(None, "")
+        validate_number(None, "   ")
+        validate_number(None, " +42 ")  # Same inputs int() accepts
         
         # Invalid inputs should raise ValidationError
         with pytest.raises(errors.ValidationError):
@@ -28,6 +30,8 @@ class TestValidators:
         # Valid inputs
         validate_positive_number(None, "123")  # Should not raise exception
         validate_positive_number(None, "")
+        validate_positive_number(None, "007")
+        validate_positive_number(None, " +5 ")
         
         # Invalid inputs should raise ValidationError
         with pytest.raises(errors.ValidationError):
@@ -39,6 +43,9 @@ class TestValidators:
         with pytest.raises(errors.ValidationError):
             validate_positive_number(None, "0")
         
+        with pytest.raises(errors.ValidationError):
+            validate_positive_number(None, "000")
+        
         with pytest.raises(errors.ValidationError):
             validate_positive_number(None, "abc")
 
@@ -4,6 +4,7 @@ Tests for video utility functions in utils/video_utils.py.
 import pytest
 import os
 import cv2
+import numpy as np
 import subprocess
 import json
 from unittest.mock import patch, MagicMock, mock_open
@@ -12,22 +13,27 @@ from utils.video_utils import (
     get_video_files_from_flight_recordings,
     display_video_info,
     get_video_info,
-    try_alternative_decoder
+    try_alternative_decoder,
+    grab_frame,
+    open_capture,
+    opened_capture,
+    fourcc_to_str,
+    release_cached_capture
 )
 
 class TestGetVideoFiles:
     """Test suite for get_video_files_from_flight_recordings function."""
     
-    @patch('os.path.exists')
-    @patch('os.walk')
-    def test_get_video_files_from_flight_recordings(self, mock_walk, mock_exists):
+    def test_get_video_files_from_flight_recordings(self, tmp_path, monkeypatch):
         """Test getting video files from the flight_recordings folder."""
-        # Setup mock responses
-        mock_exists.return_value = True
-        mock_walk.return_value = [
-            ('./flight_recordings', ['folder1'], ['video1.mp4', 'text.txt']),
-            ('./flight_recordings/folder1', [], ['video2.avi', 'video3.mov', 'image.jpg'])
-        ]
+        # Setup a recordings tree with videos and other files
+        recordings = tmp_path / 'flight_recordings'
+        (recordings / 'folder1').mkdir(parents=True)
+        for name in ('video1.mp4', 'text.txt'):
+            (recordings / name).touch()
+        for name in ('video2.avi', 'video3.MOV', 'image.jpg'):
+            (recordings / 'folder1' / name).touch()
+        monkeypatch.chdir(tmp_path)
         
         # Call the function
         result = get_video_files_from_flight_recordings()
@@ -38,21 +44,18 @@ class TestGetVideoFiles:
         # Use platform-appropriate path separators
         expected_path1 = os.path.join('flight_recordings', 'video1.mp4')
         expected_path2 = os.path.join('flight_recordings', 'folder1', 'video2.avi')
-        expected_path3 = os.path.join('flight_recordings', 'folder1', 'video3.mov')
+        expected_path3 = os.path.join('flight_recordings', 'folder1', 'video3.MOV')
         
         assert ('video1.mp4', expected_path1) in result
         assert ('video2.avi', expected_path2) in result
-        assert ('video3.mov', expected_path3) in result
+        assert ('video3.MOV', expected_path3) in result
         
-    @patch('os.path.exists')
-    @patch('os.walk')
-    def test_get_video_files_empty(self, mock_walk, mock_exists):
+    def test_get_video_files_empty(self, tmp_path, monkeypatch):
         """Test getting video files when none exist."""
-        # Setup mock responses
-        mock_exists.return_value = True
-        mock_walk.return_value = [
-            ('./flight_recordings', [], ['text.txt']),
-        ]
+        # Setup a recordings folder without videos
+        (tmp_path / 'flight_recordings').mkdir()
+        (tmp_path / 'flight_recordings' / 'text.txt').touch()
+        monkeypatch.chdir(tmp_path)
         
         # Call the function with patched print to check output
         with patch('builtins.print') as mock_print:
@@ -61,6 +64,39 @@ class TestGetVideoFiles:
             # Verify results
             assert len(result) == 0
             mock_print.assert_called_with("No video files found in flight_recordings folder.")
+    
+    def test_get_video_files_reuses_listing(self, tmp_path, monkeypatch):
+        """Test that the listing is reused until a scanned directory changes."""
+        flight_dir = tmp_path / 'flight_recordings' / 'flight_1'
+        flight_dir.mkdir(parents=True)
+        (flight_dir / 'flight_1.mp4').touch()
+        monkeypatch.chdir(tmp_path)
+        
+        assert len(get_video_files_from_flight_recordings()) == 1
+        
+        # Within the TTL nothing is scanned again
+        with patch('os.scandir') as mock_scandir:
+            assert len(get_video_files_from_flight_recordings()) == 1
+            mock_scandir.assert_not_called()
+        
+        # After the TTL only directory mtimes are checked
+        with patch('utils.video_utils.VIDEO_LISTING_TTL', 0):
+            with patch('os.scandir') as mock_scandir:
+                assert len(get_video_files_from_flight_recordings()) == 1
+                mock_scandir.assert_not_called()
+            
+            # A new recording in a subfolder changes that folder's mtime
+            (flight_dir / 'flight_1_part2.mkv').touch()
+            stat = os.stat(flight_dir)
+            os.utime(flight_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert len(get_video_files_from_flight_recordings()) == 2
+    
+    def test_get_video_files_missing_folder(self, tmp_path, monkeypatch):
+        """Test that a missing flight_recordings folder yields no videos."""
+        monkeypatch.chdir(tmp_path)
+        
+        with patch('builtins.print'):
+            assert get_video_files_from_flight_recordings() == []
 
 
 class TestDisplayVideoInfo:
@@ -112,6 +148,36 @@ class TestDisplayVideoInfo:
             # Verify error message is printed
             mock_print.assert_called_with("Error: Could not open video file invalid_video.mp4")
 
+    
+    @patch('builtins.print')
+    @patch('cv2.VideoCapture')
+    def test_display_video_info_reuses_metadata(self, mock_video_capture, mock_print, tmp_path):
+        """Test the video is only reopened after the file changes."""
+        video = tmp_path / 'flight.mp4'
+        video.write_bytes(b'frames')
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0
+        mock_video_capture.return_value = mock_cap
+        
+        with patch.dict('utils.video_utils._video_meta_cache', clear=True):
+            display_video_info(str(video))
+            display_video_info(str(video))
+            assert mock_video_capture.call_count == 1
+            
+            video.write_bytes(b'more frames')
+            display_video_info(str(video))
+            assert mock_video_capture.call_count == 2
+        
+        mock_print.assert_any_call("Frame Rate: 30.00 fps")
+
+    
+    def test_fourcc_to_str(self):
+        """Test FOURCC values decode to their codec code."""
+        assert fourcc_to_str(875967048.0) == 'H264'
+        assert fourcc_to_str(cv2.VideoWriter_fourcc(*'avc1')) == 'avc1'
+        assert fourcc_to_str(0) == '\x00' * 4
+
 
 class TestGetVideoInfo:
     """Test suite for get_video_info function."""
@@ -205,3 +271,138 @@ class TestTryAlternativeDecoder:
         
         # Verify result
         assert result == False
+
+
+class TestOpenCapture:
+    """Test suite for open_capture."""
+    
+    @patch('cv2.VideoCapture')
+    def test_open_capture_with_threads(self, mock_video_capture):
+        """The decoder thread count is passed as an open parameter."""
+        mock_video_capture.return_value.isOpened.return_value = True
+        
+        open_capture('video.mp4', 3)
+        
+        mock_video_capture.assert_called_once_with(
+            'video.mp4', cv2.CAP_FFMPEG, [cv2.CAP_PROP_N_THREADS, 3])
+    
+    @patch('cv2.VideoCapture')
+    def test_open_capture_falls_back_to_defaults(self, mock_video_capture):
+        """Without a thread count, or if FFmpeg can't open the video, defaults are used."""
+        failed = MagicMock()
+        failed.isOpened.return_value = False
+        mock_video_capture.side_effect = [failed, MagicMock()]
+        
+        open_capture('video.mp4', 3)
+        
+        failed.release.assert_called_once()
+        assert mock_video_capture.call_args_list[-1] == (('video.mp4',),)
+        
+        mock_video_capture.side_effect = None
+        open_capture('video.mp4')
+        assert mock_video_capture.call_args == (('video.mp4',),)
+    
+    @patch('cv2.VideoCapture')
+    def test_open_capture_with_hw_acceleration(self, mock_video_capture):
+        """Hardware decoding is requested through the FFmpeg open parameters."""
+        mock_video_capture.return_value.isOpened.return_value = True
+        
+        open_capture('video.mp4', 2, hw_acceleration=True)
+        
+        mock_video_capture.assert_called_once_with(
+            'video.mp4', cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_N_THREADS, 2, cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+    
+    @patch('cv2.VideoCapture')
+    def test_opened_capture_releases_on_error(self, mock_video_capture):
+        """The capture is released even when the block raises."""
+        with pytest.raises(RuntimeError):
+            with opened_capture('video.mp4') as cap:
+                raise RuntimeError("read failed")
+        
+        cap.release.assert_called_once()
+
+
+class TestGrabFrame:
+    """Test suite for grab_frame and the cached capture behind it."""
+    
+    @pytest.fixture(autouse=True)
+    def reset_capture_cache(self):
+        """Make sure every test starts and ends without a cached capture."""
+        release_cached_capture()
+        yield
+        release_cached_capture()
+    
+    @staticmethod
+    def _make_capture(frame):
+        cap = MagicMock()
+        cap.isOpened.return_value = True
+        cap.read.return_value = (frame is not None, frame)
+        return cap
+    
+    @patch('cv2.VideoCapture')
+    def test_grab_frame_reuses_capture(self, mock_video_capture):
+        """Consecutive grabs from the same video open it only once."""
+        frame = np.zeros((2, 2, 3), dtype=np.uint8)
+        mock_cap = self._make_capture(frame)
+        mock_video_capture.return_value = mock_cap
+        
+        assert grab_frame('video.mp4', 100) is frame
+        assert grab_frame('video.mp4', 500) is frame
+        
+        mock_video_capture.assert_called_once_with('video.mp4')
+        mock_cap.set.assert_called_with(cv2.CAP_PROP_POS_FRAMES, 500)
+        mock_cap.release.assert_not_called()
+    
+    @patch('cv2.VideoCapture')
+    def test_grab_frame_reads_forward_instead_of_seeking(self, mock_video_capture):
+        """Frames shortly after the current position are reached without a seek."""
+        mock_cap = self._make_capture(np.zeros((2, 2, 3), dtype=np.uint8))
+        mock_cap.grab.return_value = True
+        mock_video_capture.return_value = mock_cap
+        
+        grab_frame('video.mp4', 3)
+        
+        mock_cap.set.assert_not_called()
+        assert mock_cap.grab.call_count == 3
+        assert mock_cap.read.call_count == 1
+    
+    @patch('cv2.VideoCapture')
+    def test_grab_frame_returns_recent_frames_from_cache(self, mock_video_capture):
+        """A recently decoded frame is returned as a copy without decoding again."""
+        frame = np.ones((2, 2, 3), dtype=np.uint8)
+        mock_cap = self._make_capture(frame)
+        mock_video_capture.return_value = mock_cap
+        
+        grab_frame('video.mp4', 100)
+        frame[:] = 0  # Caller draws on the returned frame
+        cached = grab_frame('video.mp4', 100)
+        
+        assert mock_cap.read.call_count == 1
+        assert cached is not frame
+        assert cached.min() == 1
+    
+    @patch('cv2.VideoCapture')
+    def test_grab_frame_switching_video_releases_previous(self, mock_video_capture):
+        """Opening a different video releases the cached capture."""
+        first_cap = self._make_capture(np.zeros((2, 2, 3), dtype=np.uint8))
+        second_cap = self._make_capture(np.zeros((2, 2, 3), dtype=np.uint8))
+        mock_video_capture.side_effect = [first_cap, second_cap]
+        
+        grab_frame('first.mp4', 0)
+        grab_frame('second.mp4', 0)
+        
+        first_cap.release.assert_called_once()
+        assert mock_video_capture.call_count == 2
+    
+    @patch('cv2.VideoCapture')
+    def test_grab_frame_failures(self, mock_video_capture):
+        """Unreadable frames and unopenable videos return None."""
+        mock_video_capture.return_value = self._make_capture(None)
+        assert grab_frame('video.mp4', 5) is None
+        
+        release_cached_capture()
+        closed_cap = MagicMock()
+        closed_cap.isOpened.return_value = False
+        mock_video_capture.return_value = closed_cap
+        assert grab_frame('missing.mp4', 0) is None
@@ -10,6 +10,14 @@ from download import download_media_menu
 
 logger = get_logger(__name__)
 
+# Submenus opened from the main menu, looked up by the selected option. Lambdas
+# resolve the menu functions at call time so they can be swapped out in tests.
+MENU_ACTIONS = {
+    'Video Processing': lambda: video_processing_menu(),
+    'Data Visualization': lambda: visualization_menu(),
+    'Download Media': lambda: download_media_menu(),
+}
+
 def display_menu(debug_status) -> bool:
     """
     Display a step-by-step menu for the user to navigate and select options.
@@ -26,9 +34,7 @@ def display_menu(debug_status) -> bool:
             'action',
             message="Main Menu - Select an option:",
             choices=[
-                'Video Processing',
-                'Data Visualization',
-                'Download Media',
+                *MENU_ACTIONS,
                 f'Toggle Debug Mode (Currently: {debug_status})',
                 'Exit'
             ],
@@ -36,21 +42,17 @@ def display_menu(debug_status) -> bool:
     ]
 
     answers = inquirer.prompt(questions)
+    action = answers['action']
     
-    logger.debug(f"Main menu: User selected: {answers['action']}")
+    logger.debug(f"Main menu: User selected: {action}")
 
-    if answers['action'] == 'Video Processing':
-        video_processing_menu()
-        return True
-    elif answers['action'] == 'Data Visualization':
-        visualization_menu()
-        return True
-    elif answers['action'] == 'Download Media':
-        download_media_menu()
+    submenu = MENU_ACTIONS.get(action)
+    if submenu is not None:
+        submenu()
         return True
-    elif answers['action'].startswith('Toggle Debug Mode'):
+    if action.startswith('Toggle Debug Mode'):
         return "TOGGLE_DEBUG"  # Special return value to toggle debug in main
-    elif answers['action'] == 'Exit':
+    if action == 'Exit':
         clear_screen()
         print("Exiting the program.")
         return False  # Return False to break the loop in main()
@@ -5,13 +5,35 @@ import inquirer
 from utils.logger import get_logger
 from utils.terminal import clear_screen
 from utils.validators import validate_number, validate_positive_number
+from utils.constants import DEFAULT_DECODE_THREADS
 from utils.video_utils import get_video_files_from_flight_recordings, display_video_info
-from processing import process_video_frame, iterate_through_frames
-from ocr.roi_manager import set_default_manager_config, get_default_manager
 from pathlib import Path
 
 logger = get_logger(__name__)
 
+# The processing and ocr packages pull in numba (and, on first use, EasyOCR), so
+# they are only imported once the user actually processes a video
+
+def process_video_frame(*args, **kwargs):
+    """Process a random frame of a video; see processing.process_video_frame."""
+    from processing import process_video_frame as _process_video_frame
+    return _process_video_frame(*args, **kwargs)
+
+def iterate_through_frames(*args, **kwargs):
+    """Process every sampled frame of a video; see processing.iterate_through_frames."""
+    from processing import iterate_through_frames as _iterate_through_frames
+    return _iterate_through_frames(*args, **kwargs)
+
+def get_default_manager():
+    """Return the default ROI manager; see ocr.roi_manager.get_default_manager."""
+    from ocr.roi_manager import get_default_manager as _get_default_manager
+    return _get_default_manager()
+
+def set_default_manager_config(*args, **kwargs):
+    """Switch the default ROI config; see ocr.roi_manager.set_default_manager_config."""
+    from ocr.roi_manager import set_default_manager_config as _set_default_manager_config
+    return _set_default_manager_config(*args, **kwargs)
+
 def video_processing_menu():
     """Submenu for video processing options."""
     from main import DEBUG_MODE  # Import here to avoid circular imports
@@ -53,27 +75,17 @@ def process_random_frame():
     from main import DEBUG_MODE  # Import here to avoid circular imports
     
     clear_screen()
-    video_files = get_video_files_from_flight_recordings()
-    if not video_files:
+    video_path = select_video_file()
+    if not video_path:
         return True
     
     logger.debug("Starting random frame processing")
     
+    # Display video information
+    display_video_info(video_path)
+    
     # Allow user to choose ROI config before processing
     select_roi_config_menu()
-
-    # First, get the video path
-    video_question = [
-        inquirer.List(
-            'video_path',
-            message="Select a video file",
-            choices=video_files,
-        )
-    ]
-    video_answer = inquirer.prompt(video_question)
-    
-    # Display video information
-    display_video_info(video_answer['video_path'])
     
     # Continue with other questions
     questions = [
@@ -87,7 +99,7 @@ def process_random_frame():
             'end_time', message="End time in seconds (default: -1 for all)", validate=validate_number),
     ]
     answers = inquirer.prompt(questions)
-    answers['video_path'] = video_answer['video_path']  # Combine answers
+    answers['video_path'] = video_path  # Combine answers
     
     start_time = int(answers['start_time']) if answers['start_time'] else 0
     end_time = int(answers['end_time']) if answers['end_time'] else -1
@@ -109,7 +121,15 @@ def process_random_frame():
     return True
 
 def select_video_file():
-    """Select a video file from available flight recordings."""
+    """
+    Select a video file from available flight recordings.
+    
+    Shared by the menu options that work on a video, so each of them scans the
+    recordings folder once.
+    
+    Returns:
+        str: Path of the selected video, or None if there are no recordings
+    """
     video_files = get_video_files_from_flight_recordings()
     if not video_files:
         return None
@@ -124,8 +144,62 @@ def select_video_file():
     video_answer = inquirer.prompt(video_question)
     return video_answer['video_path']
 
+TIME_BORDERS = 'Time-based (seconds)'
+FRAME_BORDERS = 'Frame-based'
+
+def _time_border_questions(ignore=False):
+    """Build the start/end time questions, optionally skipped via inquirer's ignore."""
+    return [
+        inquirer.Text(
+            'start_time', 
+            message="Start time in seconds (default: 0)", 
+            validate=validate_number,
+            ignore=ignore
+        ),
+        inquirer.Text(
+            'end_time', 
+            message="End time in seconds (default: process to end)", 
+            validate=validate_number,
+            ignore=ignore
+        )
+    ]
+
+def _frame_border_questions(ignore=False):
+    """Build the start/end frame questions, optionally skipped via inquirer's ignore."""
+    return [
+        inquirer.Text(
+            'start_frame', 
+            message="Start frame number (default: 0)", 
+            validate=validate_number,
+            ignore=ignore
+        ),
+        inquirer.Text(
+            'end_frame', 
+            message="End frame number (default: process to end)", 
+            validate=validate_number,
+            ignore=ignore
+        )
+    ]
+
+def _parse_time_borders(answers):
+    """Convert start/end time answers to floats (None when left empty)."""
+    start_time = float(answers['start_time']) if answers.get('start_time') else None
+    end_time = float(answers['end_time']) if answers.get('end_time') else None
+    return start_time, end_time
+
+def _parse_frame_borders(answers):
+    """Convert start/end frame answers to ints (start defaults to 0, end to None)."""
+    start_frame = int(answers['start_frame']) if answers.get('start_frame') else 0
+    end_frame = int(answers['end_frame']) if answers.get('end_frame') else None
+    return start_frame, end_frame
+
 def get_processing_parameters():
-    """Get processing parameters from user."""
+    """
+    Get processing parameters from user.
+    
+    The border questions for the chosen border type are part of the same form,
+    so all parameters are collected in a single prompt.
+    """
     questions = [
         inquirer.Text('launch_number', message="Launch number",
                     validate=validate_number),
@@ -135,57 +209,31 @@ def get_processing_parameters():
         inquirer.Text('sample_rate', 
                      message="Sample rate (process every Nth frame, default: 1)", 
                      validate=validate_positive_number),
+        inquirer.Text('num_threads',
+                     message=f"Decode threads per worker (default: {DEFAULT_DECODE_THREADS})",
+                     validate=validate_positive_number),
         # Add border options
         inquirer.List(
             'border_type',
             message="How would you like to specify processing borders?",
-            choices=['Time-based (seconds)', 'Frame-based', 'Process entire video'],
+            choices=[TIME_BORDERS, FRAME_BORDERS, 'Process entire video'],
             default='Process entire video'
-        )
+        ),
+        *_time_border_questions(ignore=lambda answers: answers.get('border_type') != TIME_BORDERS),
+        *_frame_border_questions(ignore=lambda answers: answers.get('border_type') != FRAME_BORDERS),
+        inquirer.Confirm('hw_decode',
+                        message="Use GPU video decoding if available?",
+                        default=False),
     ]
     return inquirer.prompt(questions)
 
 def get_time_based_borders():
     """Get time-based processing borders from user."""
-    time_questions = [
-        inquirer.Text(
-            'start_time', 
-            message="Start time in seconds (default: 0)", 
-            validate=validate_number
-        ),
-        inquirer.Text(
-            'end_time', 
-            message="End time in seconds (default: process to end)", 
-            validate=validate_number
-        )
-    ]
-    time_answers = inquirer.prompt(time_questions)
-    
-    start_time = float(time_answers['start_time']) if time_answers['start_time'] else None
-    end_time = float(time_answers['end_time']) if time_answers['end_time'] else None
-    
-    return start_time, end_time
+    return _parse_time_borders(inquirer.prompt(_time_border_questions()))
 
 def get_frame_based_borders():
     """Get frame-based processing borders from user."""
-    frame_questions = [
-        inquirer.Text(
-            'start_frame', 
-            message="Start frame number (default: 0)", 
-            validate=validate_number
-        ),
-        inquirer.Text(
-            'end_frame', 
-            message="End frame number (default: process to end)", 
-            validate=validate_number
-        )
-    ]
-    frame_answers = inquirer.prompt(frame_questions)
-    
-    start_frame = int(frame_answers['start_frame']) if frame_answers['start_frame'] else 0
-    end_frame = int(frame_answers['end_frame']) if frame_answers['end_frame'] else None
-    
-    return start_frame, end_frame
+    return _parse_frame_borders(inquirer.prompt(_frame_border_questions()))
 
 # ...process_video_with_parameters removed; its logic is now in process_complete_video
 
@@ -241,6 +289,8 @@ def process_complete_video():
     
     batch_size = int(answers['batch_size']) if answers['batch_size'] else 10
     sample_rate = int(answers['sample_rate']) if answers['sample_rate'] else 1
+    num_threads = int(answers['num_threads']) if answers.get('num_threads') else DEFAULT_DECODE_THREADS
+    hw_decode = bool(answers.get('hw_decode'))
     
     # Initialize borders
     start_time = None
@@ -248,10 +298,10 @@ def process_complete_video():
     start_frame = None
     end_frame = None
     
-    # Get border information based on user's choice
-    if answers['border_type'] == 'Time-based (seconds)':
-        # Get times from user and convert to frame indices immediately using video FPS
-        start_time, end_time = get_time_based_borders()
+    # Get border information based on user's choice (already answered in the same form)
+    if answers['border_type'] == TIME_BORDERS:
+        # Convert times to frame indices immediately using video FPS
+        start_time, end_time = _parse_time_borders(answers)
         try:
             from utils.video_utils import get_video_fps
             fps = get_video_fps(video_path)
@@ -263,8 +313,8 @@ def process_complete_video():
                 logger.warning('Could not determine video FPS; time-based borders will be handled later')
         except Exception:
             logger.exception('Error converting time borders to frames')
-    elif answers['border_type'] == 'Frame-based':
-        start_frame, end_frame = get_frame_based_borders()
+    elif answers['border_type'] == FRAME_BORDERS:
+        start_frame, end_frame = _parse_frame_borders(answers)
     
     # After selecting ROI config, read its time_unit and per-ROI spans to set sensible defaults
     try:
@@ -318,7 +368,8 @@ def process_complete_video():
     iterate_through_frames(
         video_path, int(answers['launch_number']), debug=DEBUG_MODE,
         batch_size=batch_size, sample_rate=sample_rate,
-        start_frame=converted_start_frame, end_frame=converted_end_frame
+        start_frame=converted_start_frame, end_frame=converted_end_frame,
+        num_threads=num_threads, hw_decode=hw_decode
     )
     
     input("\nPress Enter to continue...")
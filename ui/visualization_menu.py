@@ -6,10 +6,28 @@ import os
 from utils.logger import get_logger
 from utils.terminal import clear_screen
 from utils.validators import validate_number
-from plot import plot_flight_data, compare_multiple_launches
 
 logger = get_logger(__name__)
 
+# Folder holding one results subfolder per analysed launch
+RESULTS_DIR = os.path.join('.', 'results')
+
+# Last ./results listing, keyed by the directory's absolute path and mtime
+_launch_folders_memo = {"key": None, "mtime": None, "folders": None}
+
+# The plot package pulls in matplotlib, seaborn and statsmodels, so it is only
+# imported once the user actually asks for a plot
+
+def plot_flight_data(*args, **kwargs):
+    """Plot a single flight's data; see plot.plot_flight_data."""
+    from plot import plot_flight_data as _plot_flight_data
+    return _plot_flight_data(*args, **kwargs)
+
+def compare_multiple_launches(*args, **kwargs):
+    """Plot several launches together; see plot.compare_multiple_launches."""
+    from plot import compare_multiple_launches as _compare_multiple_launches
+    return _compare_multiple_launches(*args, **kwargs)
+
 def visualization_menu():
     """Submenu for data visualization options."""
     clear_screen()
@@ -45,9 +63,7 @@ def visualization_menu():
 def visualize_flight_data():
     """Handle the visualize flight data menu option."""
     clear_screen()
-    results_dir = os.path.join('.', 'results')
-    launch_folders = [f for f in os.listdir(results_dir) if os.path.isdir(
-        os.path.join(results_dir, f)) and f != 'compare_launches']
+    launch_folders = get_launch_folders()
 
     if not launch_folders:
         print("No launch folders found in ./results directory.")
@@ -72,7 +88,7 @@ def visualize_flight_data():
     ]
     answers = inquirer.prompt(questions)
 
-    json_path = os.path.join(results_dir, answers['launch_folder'], 'results.json')
+    json_path = os.path.join(RESULTS_DIR, answers['launch_folder'], 'results.json')
     start_time = int(answers['start_time']) if answers['start_time'] else 0
     end_time = int(answers['end_time']) if answers['end_time'] else -1
     
@@ -107,12 +123,30 @@ def compare_multiple_launches_menu():
     return True
 
 def get_launch_folders():
-    """Get available launch folders from results directory."""
-    results_dir = os.path.join('.', 'results')
-    launch_folders = [f for f in os.listdir(results_dir) if os.path.isdir(
-        os.path.join(results_dir, f)) and f != 'compare_launches']
+    """
+    Get available launch folders from results directory.
+    
+    The listing is reused until the results directory's modification time changes
+    (which happens whenever a launch folder is added or removed).
+    """
+    key = os.path.abspath(RESULTS_DIR)
+    try:
+        mtime = os.stat(RESULTS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        logger.debug(f"Results directory {RESULTS_DIR} does not exist")
+        return []
+    
+    if _launch_folders_memo["key"] == key and _launch_folders_memo["mtime"] == mtime:
+        launch_folders = list(_launch_folders_memo["folders"])
+    else:
+        # DirEntry.is_dir() uses the type returned with the listing, so this needs
+        # no extra stat call per entry
+        with os.scandir(RESULTS_DIR) as entries:
+            launch_folders = [entry.name for entry in entries
+                              if entry.is_dir() and entry.name != 'compare_launches']
+        _launch_folders_memo.update(key=key, mtime=mtime, folders=list(launch_folders))
     
-    logger.debug(f"Found {len(launch_folders)} launch folders for comparison")
+    logger.debug(f"Found {len(launch_folders)} launch folders")
     return launch_folders
 
 def validate_available_launches(launch_folders):
@@ -152,8 +186,7 @@ def validate_selected_launches(selected_launches):
 
 def execute_launch_comparison(launches, start_time_input, end_time_input, show_figures):
     """Execute the launch comparison with the provided parameters."""
-    results_dir = os.path.join('.', 'results')
-    json_paths = [os.path.join(results_dir, folder, 'results.json') for folder in launches]
+    json_paths = [os.path.join(RESULTS_DIR, folder, 'results.json') for folder in launches]
     start_time = int(start_time_input) if start_time_input else 0
     end_time = int(end_time_input) if end_time_input else -1
     
@@ -3,7 +3,6 @@ Utils package for the Starship Analyzer application.
 Contains utility functions and constants.
 """
 
-import cv2
 import os
 import numpy as np
 
@@ -14,6 +13,8 @@ from utils.logger import get_logger, start_new_session, set_global_log_level, LO
 from utils.constants import (
     SUPERHEAVY_ENGINES, 
     STARSHIP_ENGINES,
+    SUPERHEAVY_ENGINE_COORDS,
+    STARSHIP_ENGINE_COORDS,
     WHITE_THRESHOLD,
     G_FORCE_CONVERSION,
     FIGURE_SIZE,
@@ -69,6 +70,9 @@ def display_image(image: np.ndarray, text: str) -> None:
         logger.debug("display_image called with None image; skipping display")
         return
 
+    # OpenCV is only needed for interactive display, so defer loading it
+    import cv2
+
     try:
         # Attempt to use OpenCV GUI to display image. On headless systems
         # this will raise an error from OpenCV; catch and log a warning and
@@ -108,6 +112,8 @@ __all__ = [
     # Constants
     'SUPERHEAVY_ENGINES',
     'STARSHIP_ENGINES',
+    'SUPERHEAVY_ENGINE_COORDS',
+    'STARSHIP_ENGINE_COORDS',
     'WHITE_THRESHOLD',
     'G_FORCE_CONVERSION',
     'FIGURE_SIZE',
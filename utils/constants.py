@@ -3,6 +3,9 @@ Constants used throughout the starship_analyzer application.
 This file centralizes all constant values to make them easier to maintain.
 """
 
+import os
+import numpy as np
+
 # ------------------------------
 # Engine Detection Constants
 # ------------------------------
@@ -27,6 +30,15 @@ STARSHIP_ENGINES = {
     "rvac": [(1764, 1024), (1815, 937), (1866, 1024)]
 }
 
+# The same coordinates frozen once into contiguous (N, 2) int32 arrays of (x, y),
+# ready for vectorized pixel gathers without per-frame conversion
+SUPERHEAVY_ENGINE_COORDS = {
+    section: np.ascontiguousarray(coords, dtype=np.int32) for section, coords in SUPERHEAVY_ENGINES.items()
+}
+STARSHIP_ENGINE_COORDS = {
+    section: np.ascontiguousarray(coords, dtype=np.int32) for section, coords in STARSHIP_ENGINES.items()
+}
+
 # ------------------------------
 # OCR Constants
 # ------------------------------
@@ -34,6 +46,14 @@ STARSHIP_ENGINES = {
 # OCR thresholds
 WHITE_THRESHOLD = 230
 
+# ------------------------------
+# Video Processing Constants
+# ------------------------------
+
+# FFmpeg decoder threads per video capture. Each worker process opens its own
+# capture, and past 3-4 threads decoding gains little while competing with OCR.
+DEFAULT_DECODE_THREADS = min(os.cpu_count() or 1, 4)
+
 # ------------------------------
 # Data Processing Constants
 # ------------------------------
@@ -41,6 +61,17 @@ WHITE_THRESHOLD = 230
 # Physics constants
 G_FORCE_CONVERSION = 9.81  # 1G = 9.81 m/s²
 
+# Superheavy telemetry after this mission time (7 min 30 s) is discarded as post-separation noise
+SUPERHEAVY_DATA_CUTOFF_SECONDS = 7 * 60 + 30
+
+# Telemetry cleaning limits: column -> (min value, max value, max change between samples)
+DATA_CLEANING_LIMITS = {
+    'starship.speed': (0, 28000, 50),
+    'superheavy.speed': (0, 6000, 50),
+    'starship.altitude': (0, 200, 1),
+    'superheavy.altitude': (0, 100, 1),
+}
+
 # ------------------------------
 # Visualization Constants
 # ------------------------------
@@ -48,6 +79,10 @@ G_FORCE_CONVERSION = 9.81  # 1G = 9.81 m/s²
 # Figure size and style
 FIGURE_SIZE = (16, 9)  # 16:9 aspect ratio for fullscreen
 
+# Saved figure output
+SAVE_DPI = 300
+PNG_COMPRESS_LEVEL = 1  # zlib level for saved PNGs; matplotlib's default of 9 dominates savefig time
+
 # Font sizes
 TITLE_FONT_SIZE = 14
 SUBTITLE_FONT_SIZE = 13
@@ -14,12 +14,13 @@ from .core import (
 from .system_info import (
     get_cpu_model, collect_system_info, write_system_info_section, log_system_info
 )
-from .formatters import ColoredFormatter, COLORS
+from .formatters import ColoredFormatter, CachedTimeFormatter, COLORS
+from .handlers import BufferedRotatingFileHandler
 
 __all__ = [
     'LOG_LEVELS', 'DEFAULT_LOG_LEVEL', 'LOG_FORMAT', 'DATE_FORMAT',
     'PROJECT_ROOT', 'LOG_DIR', 'LOG_FILE', 'CURRENT_SESSION_LOG_FILE',
     'get_logger', 'set_global_log_level', 'start_new_session',
     'get_cpu_model', 'collect_system_info', 'log_system_info',
-    'ColoredFormatter', 'COLORS',
+    'ColoredFormatter', 'CachedTimeFormatter', 'COLORS', 'BufferedRotatingFileHandler',
 ]
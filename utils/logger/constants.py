@@ -25,16 +25,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__fi
 LOG_DIR = os.path.join(PROJECT_ROOT, 'logs')
 LOG_FILE = os.path.join(LOG_DIR, 'starship_analyzer.log')  # Default log file, will be overridden by session-specific logs
 
-# Create the log directory if it doesn't exist
-try:
-    os.makedirs(LOG_DIR, exist_ok=True)
-    if not os.access(LOG_DIR, os.W_OK):
-        print(f"Warning: No write access to log directory: {LOG_DIR}")
-except Exception as e:
-    print(f"Error creating log directory {LOG_DIR}: {e}")
-
-# Store all loggers to avoid creating duplicates
-_loggers = {}
+# The log directory is created on first use (see core._ensure_log_dir), not at import
 
 # Store the current session's log file path
 CURRENT_SESSION_LOG_FILE = None
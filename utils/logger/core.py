@@ -3,8 +3,10 @@ Core logging functionality for the Starship Analyzer.
 """
 
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import sys
 from datetime import datetime
 from typing import Union
@@ -12,10 +14,166 @@ from typing import Union
 # Import constants from the constants module
 from .constants import (
     LOG_LEVELS, DEFAULT_LOG_LEVEL, LOG_FORMAT, DATE_FORMAT,
-    LOG_DIR, LOG_FILE, _loggers, CURRENT_SESSION_LOG_FILE
+    LOG_DIR, LOG_FILE, CURRENT_SESSION_LOG_FILE
 )
 from .system_info import log_system_info
-from .formatters import ColoredFormatter
+from .formatters import ColoredFormatter, CachedTimeFormatter
+from .handlers import BufferedRotatingFileHandler
+
+# Console and file handlers that actually write log output. They are built once
+# and owned by a single background QueueListener thread, so there is one open log
+# file and one rotation point no matter how many module loggers exist.
+_output_handlers = []
+
+# Handlers attached to every application logger: a single QueueHandler feeding
+# the listener, so callers only pay for enqueueing a record, not for formatting
+# and I/O on their own thread.
+_shared_handlers = []
+
+_listener = None
+
+# Formatters are shared by every handler built here (including the file handlers
+# created on each session switch), which also keeps their timestamp caches warm
+_FILE_FORMATTER = CachedTimeFormatter(LOG_FORMAT, DATE_FORMAT)
+_CONSOLE_FORMATTER = ColoredFormatter(LOG_FORMAT, DATE_FORMAT)
+
+# Level names accepted by set_global_log_level, in both upper and lower case so
+# the common spellings resolve with a single lookup
+_LEVEL_NAMES = {**{name.lower(): value for name, value in LOG_LEVELS.items()}, **LOG_LEVELS}
+
+# Log directories already created by this process
+_ensured_log_dirs = set()
+
+def _ensure_log_dir(log_dir: str) -> None:
+    """
+    Create a log directory once per process, warning if it is not writable.
+    
+    Args:
+        log_dir: Directory that will hold log files
+    """
+    if log_dir in _ensured_log_dirs:
+        return
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        if not os.access(log_dir, os.W_OK):
+            print(f"Warning: No write access to log directory: {log_dir}")
+        _ensured_log_dirs.add(log_dir)
+    except Exception as e:
+        print(f"Error creating log directory {log_dir}: {e}")
+
+def _create_file_handler(log_file: str) -> RotatingFileHandler:
+    """
+    Create the rotating file handler used for the application log.
+    
+    Args:
+        log_file: Path to the log file
+        
+    Returns:
+        The configured file handler
+    """
+    _ensure_log_dir(os.path.dirname(log_file))
+    
+    # Rotate to prevent excessive file sizes; writes are buffered and flushed
+    # in batches rather than once per record. The handler tracks the file size
+    # itself, so emitting a record makes no stat/seek calls.
+    file_handler = BufferedRotatingFileHandler(
+        log_file,
+        maxBytes=10*1024*1024,  # 10 MB
+        backupCount=5
+    )
+    file_handler.setFormatter(_FILE_FORMATTER)
+    return file_handler
+
+def _get_shared_handlers() -> list:
+    """
+    Return the handlers to attach to application loggers, creating them on first use.
+    
+    Returns:
+        List of handlers to attach to application loggers
+    """
+    global _listener
+    
+    if _shared_handlers:
+        return _shared_handlers
+    
+    # Console handler with colored output
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
+    _output_handlers.append(console_handler)
+    
+    # File handler - use current session log file if available, otherwise use default
+    log_file = CURRENT_SESSION_LOG_FILE or LOG_FILE
+    try:
+        _output_handlers.append(_create_file_handler(log_file))
+    except Exception as e:
+        # Fall back to console-only logging if file logging fails
+        print(f"Warning: Could not set up file logging to {log_file}: {e}")
+    
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *_output_handlers, respect_handler_level=True)
+    _listener.start()
+    # Drain queued records before logging.shutdown flushes and closes the handlers
+    atexit.register(_stop_listener)
+    
+    _shared_handlers.append(QueueHandler(log_queue))
+    return _shared_handlers
+
+def _app_loggers() -> list:
+    """
+    Return the loggers configured by get_logger.
+    
+    logging.getLogger already keeps one logger per name, so rather than tracking
+    them separately they are recognised by carrying the shared handlers.
+    """
+    if not _shared_handlers:
+        return []
+    marker = _shared_handlers[0]
+    return [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger) and marker in logger.handlers
+    ]
+
+def _listener_running() -> bool:
+    """Return True if the queue listener thread is currently running."""
+    return _listener is not None and _listener._thread is not None
+
+def _stop_listener() -> None:
+    """Stop the listener thread after it has handled every queued record."""
+    if _listener_running():
+        _listener.stop()
+
+def _flush_output_handlers() -> None:
+    """Flush buffered output, e.g. so a forked child does not inherit it."""
+    for handler in _output_handlers:
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+def _log_synchronously_in_child() -> None:
+    """
+    Make a forked child process write its records directly.
+    
+    The listener thread does not survive fork, and forked multiprocessing workers
+    leave through os._exit without running logging.shutdown, so children bypass
+    the queue and flush every record to the file.
+    """
+    global _listener
+    _listener = None
+    
+    for handler in _output_handlers:
+        if isinstance(handler, BufferedRotatingFileHandler):
+            handler.flush_level = logging.NOTSET
+    
+    for logger in _app_loggers():
+        for handler in _shared_handlers:
+            logger.removeHandler(handler)
+        for handler in _output_handlers:
+            logger.addHandler(handler)
+    _shared_handlers[:] = _output_handlers
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush_output_handlers, after_in_child=_log_synchronously_in_child)
 
 def get_logger(name: str, level: int = None) -> logging.Logger:
     """
@@ -28,48 +186,23 @@ def get_logger(name: str, level: int = None) -> logging.Logger:
     Returns:
         A configured logger instance
     """
-    global _loggers
-    
-    # Return existing logger if already created
-    if name in _loggers:
-        return _loggers[name]
-    
-    # Create a new logger
+    # logging.getLogger returns the same instance for a name on every call
     logger = logging.getLogger(name)
     
+    # A logger with handlers has been configured already
+    if logger.handlers:
+        return logger
+    
     # Set level (use specified level or default)
     logger.setLevel(level or DEFAULT_LOG_LEVEL)
     
-    # Create formatters
-    file_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    console_formatter = ColoredFormatter(LOG_FORMAT, DATE_FORMAT)
+    # Module loggers are not children of a common package logger, so each one
+    # carries the shared handlers itself; propagating as well would emit twice
+    logger.propagate = False
+    
+    for handler in _get_shared_handlers():
+        logger.addHandler(handler)
     
-    # Create handlers if logger doesn't already have them
-    if not logger.handlers:
-        # Console handler with colored output
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
-        
-        # File handler - use current session log file if available, otherwise use default
-        log_file = CURRENT_SESSION_LOG_FILE or LOG_FILE
-        try:
-            # Use RotatingFileHandler to prevent excessive file sizes
-            file_handler = RotatingFileHandler(
-                log_file, 
-                maxBytes=10*1024*1024,  # 10 MB
-                backupCount=5
-            )
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
-            logger.debug(f"Logger initialized with log file: {log_file}")
-        except Exception as e:
-            # Log to console if file logging fails
-            print(f"Warning: Could not set up file logging to {log_file}: {e}")
-            logger.error(f"Failed to set up file logging: {e}")
-    
-    # Store logger for reuse
-    _loggers[name] = logger
     return logger
 
 def set_global_log_level(level: Union[int, str]) -> None:
@@ -83,19 +216,29 @@ def set_global_log_level(level: Union[int, str]) -> None:
     
     # Convert string level to numeric if needed
     if isinstance(level, str):
-        level = LOG_LEVELS.get(level.upper(), DEFAULT_LOG_LEVEL)
+        level = _LEVEL_NAMES.get(level) or LOG_LEVELS.get(level.upper(), DEFAULT_LOG_LEVEL)
     
     # Update the default level
     DEFAULT_LOG_LEVEL = level
     
-    # Update all existing loggers
-    for logger in _loggers.values():
-        logger.setLevel(level)
+    # Update all existing loggers, skipping the ones already at this level
+    # (setLevel clears the logging module's level cache under its global lock)
+    for logger in _app_loggers():
+        if logger.level != level:
+            logger.setLevel(level)
         for handler in logger.handlers:
+            if handler.level != level:
+                handler.setLevel(level)
+    
+    # ... and the handlers doing the output on the listener thread
+    for handler in _output_handlers:
+        if handler.level != level:
             handler.setLevel(level)
     
     # Update root logger as well
-    logging.getLogger().setLevel(level)
+    root_logger = logging.getLogger()
+    if root_logger.level != level:
+        root_logger.setLevel(level)
 
 def _update_file_handlers(new_log_file: str) -> None:
     """
@@ -104,26 +247,39 @@ def _update_file_handlers(new_log_file: str) -> None:
     Args:
         new_log_file: Path to the new log file
     """
-    for logger in _loggers.values():
-        # Remove existing file handlers
-        for handler in logger.handlers[:]:
-            if isinstance(handler, (logging.FileHandler, RotatingFileHandler)):
+    old_handlers = [h for h in _output_handlers if isinstance(h, (logging.FileHandler, RotatingFileHandler))]
+    
+    try:
+        file_handler = _create_file_handler(new_log_file)
+    except Exception as e:
+        get_logger(__name__).error(f"Failed to update file handler: {e}")
+        return
+    
+    file_handler.setLevel(old_handlers[0].level if old_handlers else logging.NOTSET)
+    
+    # Let the listener finish queued records for the old file before swapping
+    listening = _listener_running()
+    if listening:
+        _listener.stop()
+    
+    for handler in old_handlers:
+        _output_handlers.remove(handler)
+        handler.close()
+    _output_handlers.append(file_handler)
+    
+    if _listener is not None:
+        _listener.handlers = tuple(_output_handlers)
+        if listening:
+            _listener.start()
+    else:
+        # No listener (e.g. in a forked child): loggers hold the output handlers
+        for logger in _app_loggers():
+            for handler in old_handlers:
                 logger.removeHandler(handler)
-        
-        # Add new file handler
-        formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-        try:
-            file_handler = RotatingFileHandler(
-                new_log_file,
-                maxBytes=10*1024*1024,  # 10 MB
-                backupCount=5
-            )
-            file_handler.setFormatter(formatter)
-            file_handler.setLevel(logger.level)
             logger.addHandler(file_handler)
-            logger.debug(f"Switched to log file: {new_log_file}")
-        except Exception as e:
-            logger.error(f"Failed to update file handler: {e}")
+        _shared_handlers[:] = _output_handlers
+    
+    get_logger(__name__).debug(f"Switched to log file: {new_log_file}")
 
 def start_new_session() -> logging.Logger:
     """
@@ -139,14 +295,11 @@ def start_new_session() -> logging.Logger:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     CURRENT_SESSION_LOG_FILE = os.path.join(LOG_DIR, f"starship_analyzer_{timestamp}.log")
     
-    # Create log directory again just to be sure
-    try:
-        os.makedirs(os.path.dirname(CURRENT_SESSION_LOG_FILE), exist_ok=True)
-    except Exception as e:
-        print(f"Error ensuring log directory exists: {e}")
+    # Create the log directory if this process hasn't yet
+    _ensure_log_dir(os.path.dirname(CURRENT_SESSION_LOG_FILE))
     
     # Update existing loggers to use the new file
-    if _loggers:
+    if _shared_handlers:
         _update_file_handlers(CURRENT_SESSION_LOG_FILE)
     
     # Create a root logger for session-wide messages
@@ -163,7 +316,12 @@ def start_new_session() -> logging.Logger:
     else:
         root_logger.error(f"Failed to create log file at: {CURRENT_SESSION_LOG_FILE}")
     
-    # Log system information right after session start message
-    log_system_info(root_logger)
+    # Log system information right after session start message. The section is
+    # written straight to the log file, so hand over the listener's handlers and
+    # drain the queue first to keep it after the header.
+    if _listener_running():
+        _listener.stop()
+        _listener.start()
+    log_system_info(root_logger, _output_handlers or None)
     
     return root_logger
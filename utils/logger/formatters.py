@@ -19,7 +19,36 @@ COLORS = {
     'BOLD': '\033[1m',
 }
 
-class ColoredFormatter(logging.Formatter):
+class CachedTimeFormatter(logging.Formatter):
+    """
+    A formatter that formats the timestamp at most once per second.
+    
+    With a second-resolution date format every record logged within the same
+    second gets the same asctime, so the last result is reused instead of calling
+    localtime/strftime for each record.
+    """
+    
+    def __init__(self, fmt=None, datefmt=None, style='%'):
+        super().__init__(fmt, datefmt, style)
+        # (whole second, date format, formatted time), replaced as a single tuple
+        self._cached_time = (None, None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        # Without a date format the default includes milliseconds, so it can't be cached
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_datefmt, cached_time = self._cached_time
+        if second == cached_second and datefmt == cached_datefmt:
+            return cached_time
+        
+        formatted = super().formatTime(record, datefmt)
+        self._cached_time = (second, datefmt, formatted)
+        return formatted
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """
     A formatter that adds colors to log messages based on their level.
     Colors work in most Unix terminals and Windows 10+ terminals.
@@ -0,0 +1,86 @@
+"""
+Custom handlers for the Starship Analyzer logging system.
+"""
+
+import logging
+import os
+import threading
+from logging.handlers import RotatingFileHandler
+
+# Size of the in-memory write buffer for the log file
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Seconds between background flushes of buffered log records
+LOG_FLUSH_INTERVAL = 2.0
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    A rotating file handler that batches writes instead of flushing every record.
+
+    The standard handler flushes after each record and, to decide on rollover,
+    formats the record a second time and seeks to the end of the file (which also
+    flushes). This handler formats once, tracks the file size itself and lets a
+    large write buffer absorb records. The buffer is flushed immediately for
+    records at or above ``flush_level``, every ``flush_interval`` seconds by a
+    background thread, and on close (logging.shutdown runs at interpreter exit).
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, buffer_size=LOG_BUFFER_SIZE, flush_level=logging.WARNING,
+                 flush_interval=LOG_FLUSH_INTERVAL):
+        # Needed by _open(), which the base constructor calls unless delay is set
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._size = self._current_size()
+
+        self._stop_flushing = threading.Event()
+        self._flush_thread = None
+        if flush_interval and flush_interval > 0:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically, name="log-flush", daemon=True
+            )
+            self._flush_thread.start()
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+
+    def _current_size(self) -> int:
+        """Return the size of the log file on disk, or 0 if it does not exist yet."""
+        try:
+            return os.path.getsize(self.baseFilename)
+        except OSError:
+            return 0
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until the handler is closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        """Write a record into the buffer, rolling the file over when it is full."""
+        try:
+            # Handler.handle() already holds the handler lock around emit()
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                self._size = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """Stop the background flusher, then flush and close the file."""
+        self._stop_flushing.set()
+        super().close()
@@ -255,20 +255,24 @@ def write_system_info_section(log_file: str, system_info: dict) -> None:
         logger = logging.getLogger("system_info")
         logger.error(f"Failed to write system information section: {str(e)}")
 
-def log_system_info(logger: logging.Logger) -> None:
+def log_system_info(logger: logging.Logger, handlers: list = None) -> None:
     """
     Log system information for debugging purposes.
     
     Args:
         logger: The logger to use for logging system information
+        handlers: Handlers to search for the log file, defaults to the logger's own
     """
     try:
         system_info = collect_system_info()
         
         # Write full system info to a separate section in the log file
-        if logger.handlers:
-            for handler in logger.handlers:
+        handlers = logger.handlers if handlers is None else handlers
+        if handlers:
+            for handler in handlers:
                 if isinstance(handler, logging.FileHandler):
+                    # Write out buffered records first so the section lands after them
+                    handler.flush()
                     write_system_info_section(handler.baseFilename, system_info)
                     break
     except Exception as e:
@@ -1,8 +1,21 @@
 """
 Input validation utilities.
 """
+import re
 from inquirer import errors
 
+# Validators run on every keystroke in inquirer prompts, so the checks are
+# precompiled patterns rather than int() parsing with exceptions as control flow
+_BLANK_RE = re.compile(r'\s*\Z')
+_INTEGER_RE = re.compile(r'\s*[+-]?\d+\s*\Z')
+_POSITIVE_INTEGER_RE = re.compile(r'\s*\+?0*[1-9]\d*\s*\Z')
+
+# YouTube pattern: https://www.youtube.com/watch?v=VIDEO_ID
+_YOUTUBE_URL_RE = re.compile(r'^https?://(www\.)?(youtube\.com/watch\?v=|youtu\.be/).+')
+
+# Twitter/X pattern: https://x.com/* or https://twitter.com/*
+_TWITTER_URL_RE = re.compile(r'^https?://(www\.)?(x\.com|twitter\.com)/.+')
+
 def validate_number(_, current):
     """
     Validate that input is a number or empty (for default).
@@ -14,13 +27,10 @@ def validate_number(_, current):
     Returns:
         bool: True if valid, otherwise raises ValidationError
     """
-    try:
-        if current.strip() == "":  # Allow empty for default values
-            return True
-        _ = int(current)
+    # Allow empty for default values
+    if _BLANK_RE.match(current) or _INTEGER_RE.match(current):
         return True
-    except ValueError:
-        raise errors.ValidationError('', reason='Please enter a valid number')
+    raise errors.ValidationError('', reason='Please enter a valid number')
 
 
 def validate_positive_number(_, current):
@@ -34,15 +44,10 @@ def validate_positive_number(_, current):
     Returns:
         bool: True if valid, otherwise raises ValidationError
     """
-    try:
-        if current.strip() == "":  # Allow empty for default values
-            return True
-        value = int(current)
-        if value <= 0:
-            raise ValueError("Value must be positive")
+    # Allow empty for default values
+    if _BLANK_RE.match(current) or _POSITIVE_INTEGER_RE.match(current):
         return True
-    except ValueError:
-        raise errors.ValidationError('', reason='Please enter a valid positive number')
+    raise errors.ValidationError('', reason='Please enter a valid positive number')
 
 def validate_url(url):
     """
@@ -54,15 +59,7 @@ def validate_url(url):
     Returns:
         bool or str: True if valid, error message if invalid
     """
-    import re
-    
-    # YouTube pattern: https://www.youtube.com/watch?v=VIDEO_ID
-    youtube_pattern = r'^https?://(www\.)?(youtube\.com/watch\?v=|youtu\.be/).+'
-    
-    # Twitter/X pattern: https://x.com/* or https://twitter.com/*
-    twitter_pattern = r'^https?://(www\.)?(x\.com|twitter\.com)/.+'
-    
-    if re.match(youtube_pattern, url) or re.match(twitter_pattern, url):
+    if _YOUTUBE_URL_RE.match(url) or _TWITTER_URL_RE.match(url):
         return True
     else:
         return "Please enter a valid YouTube or Twitter/X URL"
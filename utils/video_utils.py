@@ -2,30 +2,112 @@
 Video utility functions for handling video files.
 """
 import os
+import atexit
+import contextlib
+from collections import OrderedDict
 import cv2
+import numpy as np
 from utils.logger import get_logger
 import logging
 import subprocess
+import time
 from typing import Tuple, Optional, List
 
 logger = get_logger(__name__)
 
+# Folder scanned for flight recordings
+FLIGHT_RECORDINGS_DIR = os.path.join('.', 'flight_recordings')
+
+# File extensions recognised as flight recordings
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv')
+
+# Most recently opened capture, reused by back-to-back single-frame grabs from the
+# same video so the container/codec setup is not repeated for every frame. "position"
+# is the index of the frame the capture will decode next (None if unknown).
+_capture_cache = {"path": None, "capture": None, "position": None}
+
+# Recently decoded frames of the cached capture, keyed by frame number
+_recent_frames = OrderedDict()
+RECENT_FRAMES_LIMIT = 8
+
+# A seek makes H.264 decoders restart from the previous keyframe, so targets at
+# most this many frames ahead are reached by grabbing forward instead
+MAX_FORWARD_GRAB = 30
+
+# Last flight_recordings scan: the listing, the mtime of every directory it
+# visited, and when it was last confirmed (time.monotonic())
+VIDEO_LISTING_TTL = 5
+_video_files_memo = {"key": None, "files": None, "dir_mtimes": None, "ts": 0.0}
+
+# Properties read by display_video_info, keyed by absolute path:
+# path -> ((mtime_ns, size), metadata)
+_video_meta_cache = {}
+
+def _dir_mtime(path: str) -> Optional[int]:
+    """Return a directory's modification time in ns, or None if it can't be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _scan_video_files(folder: str) -> Tuple[list, dict]:
+    """
+    Find the video files below a folder.
+    
+    Args:
+        folder (str): Folder to scan recursively
+    
+    Returns:
+        tuple: List of (filename, path) tuples and the mtimes of the scanned directories
+    """
+    video_files = []
+    dir_mtimes = {}
+    
+    # Depth-first scan; DirEntry carries the file type from the directory listing,
+    # so unlike os.walk this needs no stat call per entry
+    pending_dirs = [folder]
+    while pending_dirs:
+        directory = pending_dirs.pop()
+        # Taken before listing, so a change made during the scan invalidates it
+        dir_mtimes[directory] = _dir_mtime(directory)
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif entry.name.lower().endswith(VIDEO_EXTENSIONS):
+                        video_files.append((entry.name, os.path.relpath(entry.path, '.')))
+        except OSError:
+            # Missing or unreadable folder, same as os.walk skipping it
+            continue
+    
+    return video_files, dir_mtimes
+
 def get_video_files_from_flight_recordings():
     """
     Get a list of video files from the flight_recordings folder.
     
+    The listing is reused for VIDEO_LISTING_TTL seconds, and after that for as long
+    as none of the scanned directories has been modified, so returning to the menu
+    does not rescan the whole tree while new recordings are still picked up.
+    
     Returns:
         list: List of tuples (filename, path) for video files
     """
-    flight_recordings_folder = os.path.join('.', 'flight_recordings')
-    video_files = []
+    key = os.path.abspath(FLIGHT_RECORDINGS_DIR)
+    memo = _video_files_memo
+    
+    fresh = memo["key"] == key and time.monotonic() - memo["ts"] < VIDEO_LISTING_TTL
+    if not fresh and memo["key"] == key and \
+            all(_dir_mtime(d) == mtime for d, mtime in memo["dir_mtimes"].items()):
+        memo["ts"] = time.monotonic()
+        fresh = True
     
-    if (os.path.exists(flight_recordings_folder)):
-        for root, _, files in os.walk(flight_recordings_folder):
-            for file in files:
-                if file.lower().endswith(('.mp4', '.avi', '.mov', '.mkv')):
-                    relative_path = os.path.relpath(os.path.join(root, file), '.')
-                    video_files.append((file, relative_path))
+    if fresh:
+        video_files = list(memo["files"])
+    else:
+        video_files, dir_mtimes = _scan_video_files(FLIGHT_RECORDINGS_DIR)
+        memo.update(key=key, files=list(video_files), dir_mtimes=dir_mtimes, ts=time.monotonic())
     
     if not video_files:
         print("No video files found in flight_recordings folder.")
@@ -40,28 +122,18 @@ def display_video_info(video_path):
         video_path (str): Path to the video file
     """
     try:
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
+        meta = _read_video_meta(video_path)
+        if meta is None:
             print(f"Error: Could not open video file {video_path}")
             return
         
-        # Get video properties
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width, height = meta["width"], meta["height"]
+        fps, frame_count, codec = meta["fps"], meta["frame_count"], meta["codec"]
         
         # Calculate duration
         duration_sec = frame_count / fps if fps > 0 else 0
-        hours = int(duration_sec // 3600)
-        minutes = int((duration_sec % 3600) // 60)
-        seconds = int(duration_sec % 60)
-        
-        # Get codec information
-        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
-        codec = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
-        
-        cap.release()
+        minutes, seconds = divmod(int(duration_sec), 60)
+        hours, minutes = divmod(minutes, 60)
         
         # Display information
         print("\n----- Video Information -----")
@@ -78,6 +150,55 @@ def display_video_info(video_path):
         print(f"Error getting video information: {str(e)}")
         logger.error(f"Error displaying video info: {str(e)}")
 
+def fourcc_to_str(fourcc) -> str:
+    """
+    Convert a CAP_PROP_FOURCC value to its four-character codec code (e.g. 'avc1').
+    
+    Args:
+        fourcc: The FOURCC value as returned by cv2.VideoCapture.get (int or float)
+    
+    Returns:
+        str: The codec code, one character per byte
+    """
+    return (int(fourcc) & 0xFFFFFFFF).to_bytes(4, 'little').decode('latin-1')
+
+def _read_video_meta(video_path: str) -> Optional[dict]:
+    """
+    Read a video's resolution, frame rate, frame count and codec.
+    
+    Results are cached per file and reused while its size and modification time
+    are unchanged, so selecting the same video again does not reopen it.
+    
+    Returns:
+        dict: The video properties, or None if the video can't be opened
+    """
+    try:
+        stat = os.stat(video_path)
+        key = os.path.abspath(video_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = signature = None
+    
+    cached = _video_meta_cache.get(key) if key else None
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+    
+    with opened_capture(video_path) as cap:
+        if not cap.isOpened():
+            return None
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+        meta = {
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": cap.get(cv2.CAP_PROP_FPS),
+            "frame_count": int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            "codec": fourcc_to_str(fourcc),
+        }
+    
+    if key:
+        _video_meta_cache[key] = (signature, dict(meta))
+    return meta
+
 def get_video_info(video_path: str) -> dict:
     """
     Get detailed video information using FFprobe (if available)
@@ -96,18 +217,17 @@ def get_video_info(video_path: str) -> dict:
     
     # Try using OpenCV
     try:
-        cap = cv2.VideoCapture(video_path)
-        if cap.isOpened():
-            info["width"] = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            info["height"] = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            info["fps"] = cap.get(cv2.CAP_PROP_FPS)
-            info["frame_count"] = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            info["duration"] = info["frame_count"] / info["fps"] if info["fps"] > 0 else 0
-            fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
-            info["codec"] = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
-            cap.release()
-        else:
-            info["opencv_open_failed"] = True
+        with opened_capture(video_path) as cap:
+            if cap.isOpened():
+                info["width"] = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                info["height"] = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                info["fps"] = cap.get(cv2.CAP_PROP_FPS)
+                info["frame_count"] = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                info["duration"] = info["frame_count"] / info["fps"] if info["fps"] > 0 else 0
+                fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+                info["codec"] = fourcc_to_str(fourcc)
+            else:
+                info["opencv_open_failed"] = True
     except Exception as e:
         logger.error(f"Error getting video info with OpenCV: {str(e)}")
         info["opencv_error"] = str(e)
@@ -134,14 +254,144 @@ def get_video_info(video_path: str) -> dict:
     return info
 
 
+def open_capture(video_path: str, num_threads: Optional[int] = None,
+                 hw_acceleration: bool = False) -> cv2.VideoCapture:
+    """
+    Open a video, optionally tuning the FFmpeg decoder.
+    
+    Args:
+        video_path (str): Path to the video file
+        num_threads (int, optional): Decoder threads; None keeps OpenCV's default
+        hw_acceleration (bool): Ask FFmpeg to decode on the GPU (NVDEC, VAAPI,
+            D3D11, ...) when a hardware decoder is available. OpenCV falls back to
+            software decoding otherwise; frames are still returned in host memory.
+    
+    Returns:
+        cv2.VideoCapture: The capture (check isOpened() before use)
+    """
+    params = []
+    if num_threads and hasattr(cv2, "CAP_PROP_N_THREADS"):
+        params += [cv2.CAP_PROP_N_THREADS, int(num_threads)]
+    if hw_acceleration and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        params += [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    
+    if params:
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, params)
+        if cap.isOpened():
+            return cap
+        cap.release()
+        logger.debug(f"Could not open {video_path} with decoder options {params}, using defaults")
+    return cv2.VideoCapture(video_path)
+
+@contextlib.contextmanager
+def opened_capture(video_path: str, num_threads: Optional[int] = None, hw_acceleration: bool = False):
+    """
+    Open a video with open_capture and release it when the block exits.
+    
+    The capture is released even if reading from it raises, so a failed probe
+    does not keep the file and decoder open until garbage collection.
+    
+    Yields:
+        cv2.VideoCapture: The capture (check isOpened() before use)
+    """
+    cap = open_capture(video_path, num_threads, hw_acceleration)
+    try:
+        yield cap
+    finally:
+        cap.release()
+
+def get_cached_capture(video_path: str) -> Optional[cv2.VideoCapture]:
+    """
+    Return an opened VideoCapture for the video, reusing the last one if it matches.
+    
+    Only one capture is kept open; asking for a different video releases it.
+    
+    Args:
+        video_path (str): Path to the video file
+    
+    Returns:
+        cv2.VideoCapture: The opened capture, or None if the video cannot be opened
+    """
+    cap = _capture_cache["capture"]
+    if cap is not None and _capture_cache["path"] == video_path and cap.isOpened():
+        return cap
+    
+    release_cached_capture()
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        cap.release()
+        return None
+    
+    _capture_cache["path"] = video_path
+    _capture_cache["capture"] = cap
+    _capture_cache["position"] = 0
+    return cap
+
+def release_cached_capture() -> None:
+    """Release the capture kept open by get_cached_capture, if any."""
+    cap = _capture_cache["capture"]
+    _capture_cache["path"] = None
+    _capture_cache["capture"] = None
+    _capture_cache["position"] = None
+    _recent_frames.clear()
+    if cap is not None:
+        cap.release()
+
+atexit.register(release_cached_capture)
+
+def grab_frame(video_path: str, frame_number: int) -> Optional[np.ndarray]:
+    """
+    Decode a single frame from a video, reusing the cached capture.
+    
+    The last few decoded frames are kept, and a frame shortly after the current
+    position is reached by grabbing (demuxing without converting) the frames in
+    between rather than seeking, which would decode again from the keyframe.
+    
+    Args:
+        video_path (str): Path to the video file
+        frame_number (int): Index of the frame to read
+    
+    Returns:
+        numpy.ndarray: The decoded frame, or None if it could not be read
+    """
+    cap = get_cached_capture(video_path)
+    if cap is None:
+        return None
+    
+    cached = _recent_frames.get(frame_number)
+    if cached is not None:
+        _recent_frames.move_to_end(frame_number)
+        return cached.copy()
+    
+    position = _capture_cache["position"]
+    skip = frame_number - position if position is not None else -1
+    if 0 <= skip <= MAX_FORWARD_GRAB:
+        for _ in range(skip):
+            if not cap.grab():
+                _capture_cache["position"] = None
+                return None
+    else:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+    
+    ret, frame = cap.read()
+    if not ret or frame is None:
+        _capture_cache["position"] = None
+        return None
+    _capture_cache["position"] = frame_number + 1
+    
+    # Callers may draw on the frame, so the cache keeps its own copy
+    _recent_frames[frame_number] = frame.copy()
+    if len(_recent_frames) > RECENT_FRAMES_LIMIT:
+        _recent_frames.popitem(last=False)
+    return frame
+
 def get_video_fps(video_path: str) -> Optional[float]:
     """Return the video's frames-per-second as a float, or None if it can't be read."""
     try:
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            return None
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        cap.release()
+        with opened_capture(video_path) as cap:
+            if not cap.isOpened():
+                return None
+            fps = cap.get(cv2.CAP_PROP_FPS)
         if fps and fps > 0:
             return float(fps)
     except Exception as e: